@@ -11,6 +11,7 @@ import hashlib
 import logging
 import os
 from random import SystemRandom
+import time
 from typing import Callable, Final, cast, final
 
 from aiohttp import web
@@ -141,7 +142,7 @@ async def async_get_image(
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.async_cached_camera_image()
 
             if image:
                 return Image(camera.content_type, image)
@@ -315,6 +316,12 @@ async def async_unload_entry(opp: OpenPeerPower, entry: ConfigEntry) -> bool:
 class Camera(Entity):
     """The base class for camera entities."""
 
+    # Last frame fetched from the camera, shared by all viewers
+    _frame: bytes | None = None
+    _frame_time: float = 0
+    _frame_fetch: asyncio.Task | None = None
+    _thumbnail: str | None = None
+
     def __init__(self) -> None:
         """Initialize a camera."""
         self.is_streaming: bool = False
@@ -387,12 +394,56 @@ class Camera(Entity):
         """Return bytes of camera image."""
         return await self.opp.async_add_executor_job(self.camera_image)
 
+    @final
+    async def async_cached_camera_image(self) -> bytes | None:
+        """Return a camera image shared with the other viewers.
+
+        A frame is reused for frame_interval seconds and concurrent requests
+        wait for the same fetch from the camera.
+        """
+        if (
+            self._frame is not None
+            and time.monotonic() - self._frame_time < self.frame_interval
+        ):
+            return self._frame
+
+        if self._frame_fetch is None:
+            self._frame_fetch = self.opp.async_create_task(self._async_fetch_frame())
+        return await asyncio.shield(self._frame_fetch)
+
+    async def _async_fetch_frame(self) -> bytes | None:
+        """Fetch a frame from the camera."""
+        try:
+            async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
+                image = await self.async_camera_image()
+        finally:
+            self._frame_fetch = None
+
+        if image:
+            self._frame = image
+            self._frame_time = time.monotonic()
+            self._thumbnail = None
+        return image
+
+    @final
+    async def async_camera_thumbnail(self) -> str | None:
+        """Return the base64 encoded camera image, encoded once per frame."""
+        image = await self.async_cached_camera_image()
+        if not image:
+            return None
+        if image is not self._frame:
+            # A newer frame was fetched while waiting
+            return base64.b64encode(image).decode("utf-8")
+        if self._thumbnail is None:
+            self._thumbnail = base64.b64encode(image).decode("utf-8")
+        return self._thumbnail
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request, self.async_cached_camera_image, self.content_type, interval
         )
 
     async def handle_async_mjpeg_stream(
@@ -523,7 +574,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(CAMERA_IMAGE_TIMEOUT):
-                image = await camera.async_camera_image()
+                image = await camera.async_cached_camera_image()
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -566,14 +617,16 @@ async def websocket_camera_thumbnail(
     """
     _LOGGER.warning("The websocket command 'camera_thumbnail' has been deprecated")
     try:
-        image = await async_get_image(opp, msg["entity_id"])
-        await connection.send_big_result(
-            msg["id"],
-            {
-                "content_type": image.content_type,
-                "content": base64.b64encode(image.content).decode("utf-8"),
-            },
-        )
+        camera = _get_camera_from_entity_id(opp, msg["entity_id"])
+        with suppress(asyncio.CancelledError, asyncio.TimeoutError):
+            content = await camera.async_camera_thumbnail()
+            if content:
+                await connection.send_big_result(
+                    msg["id"],
+                    {"content_type": camera.content_type, "content": content},
+                )
+                return
+        raise OpenPeerPowerError("Unable to get image")
     except OpenPeerPowerError:
         connection.send_message(
             websocket_api.error_message(
@@ -1,11 +1,14 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+import asyncio
+from collections.abc import Awaitable, Iterable
+import concurrent.futures
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 import time
-from typing import cast
+from typing import Any, Callable, cast
 
 from aiohttp import web
 from sqlalchemy import not_, or_
@@ -14,8 +17,14 @@ import voluptuous as vol
 from openpeerpower.components import websocket_api
 from openpeerpower.components.http import OpenPeerPowerView
 from openpeerpower.components.recorder import history, models as history_models
-from openpeerpower.components.recorder.statistics import statistics_during_period
+from openpeerpower.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOURLY,
+    statistics_during_period,
+)
 from openpeerpower.components.recorder.util import session_scope
+from openpeerpower.components.websocket_api.const import JSON_DUMP
+from openpeerpower.components.websocket_api.error import Disconnect
 from openpeerpower.const import (
     CONF_DOMAINS,
     CONF_ENTITIES,
@@ -39,6 +48,10 @@ _LOGGER = logging.getLogger(__name__)
 DOMAIN = "history"
 CONF_ORDER = "use_include_order"
 
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+# Seconds a page may take to be written before the stream is aborted
+STREAM_WRITE_TIMEOUT = 30
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -98,11 +111,14 @@ async def async_setup(opp, config):
 
     use_include_order = conf.get(CONF_ORDER)
 
+    opp.data[DOMAIN] = filters
+
     opp.http.register_view(HistoryPeriodView(filters, use_include_order))
     opp.components.frontend.async_register_built_in_panel(
         "history", "history", "opp:poll-box"
     )
     opp.components.websocket_api.async_register_command(ws_get_statistics_during_period)
+    opp.components.websocket_api.async_register_command(ws_stream_history)
 
     return True
 
@@ -118,6 +134,9 @@ class LazyState(history_models.LazyState):
         vol.Required("start_time"): str,
         vol.Optional("end_time"): str,
         vol.Optional("statistic_id"): str,
+        vol.Optional("period", default=PERIOD_HOURLY): vol.In(
+            [PERIOD_5MINUTE, PERIOD_HOURLY]
+        ),
     }
 )
 @websocket_api.async_response
@@ -151,10 +170,149 @@ async def ws_get_statistics_during_period(
         start_time,
         end_time,
         msg.get("statistic_id"),
+        msg["period"],
     )
     connection.send_result(msg["id"], {"statistics": statistics})
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [cv.entity_id],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("page_size", default=history.STREAM_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history(
+    opp: OpenPeerPower, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Handle history stream websocket command.
+
+    Every page of states is sent as an event with the entity_id and its
+    states. The next page is only fetched once the client has read most of
+    the pending messages. The result is sent once all pages have been sent.
+    """
+    start_time = dt_util.parse_datetime(msg["start_time"])
+    if start_time:
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if "end_time" in msg:
+        end_time = dt_util.parse_datetime(msg["end_time"])
+        if end_time:
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    msg_id = msg["id"]
+    cancel = threading.Event()
+    # Stop streaming when the connection is closed
+    connection.subscriptions[msg_id] = cancel.set
+
+    def encode(entity_id: str, states: list[dict]) -> str:
+        return JSON_DUMP(
+            websocket_api.event_message(
+                msg_id, {"entity_id": entity_id, "states": states}
+            )
+        )
+
+    async def write(message: str) -> None:
+        await connection.async_drain()
+        connection.send_message(message)
+
+    try:
+        pages = await opp.async_add_executor_job(
+            _stream_significant_states,
+            opp,
+            encode,
+            write,
+            cancel,
+            opp.data[DOMAIN],
+            start_time,
+            end_time,
+            msg.get("entity_ids"),
+            msg["include_start_time_state"],
+            msg["significant_changes_only"],
+            msg["minimal_response"],
+            msg["page_size"],
+        )
+    except (Disconnect, concurrent.futures.TimeoutError):
+        _LOGGER.debug("History stream %s aborted", msg_id)
+        return
+    finally:
+        cancel.set()
+        connection.subscriptions.pop(msg_id, None)
+
+    if pages is None:
+        return
+    connection.send_result(msg_id, {"pages": pages})
+
+
+def _stream_significant_states(
+    opp: OpenPeerPower,
+    encode: Callable[[str, list[dict]], Any],
+    write: Callable[[Any], Awaitable[None]],
+    cancel: threading.Event,
+    filters: Filters | None,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    page_size: int = history.STREAM_PAGE_SIZE,
+) -> int | None:
+    """Stream the significant states during a period from the executor.
+
+    Every page is encoded here and handed to the write coroutine in the
+    event loop. The next page is only fetched once it has been written, so
+    a single page is held in memory and a slow client slows down the query.
+    A write that does not finish within STREAM_WRITE_TIMEOUT raises
+    TimeoutError.
+
+    Returns the number of pages written, or None if the stream was
+    cancelled.
+    """
+    pages = 0
+    with session_scope(opp=opp) as session:
+        for entity_id, states in history.stream_significant_states(
+            opp,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            page_size,
+        ):
+            if cancel.is_set():
+                return None
+            future = asyncio.run_coroutine_threadsafe(
+                write(encode(entity_id, states)), opp.loop
+            )
+            try:
+                future.result(STREAM_WRITE_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                future.cancel()
+                raise
+            pages += 1
+    return pages
+
+
 class HistoryPeriodView(OpenPeerPowerView):
     """Handle history period requests."""
 
@@ -169,7 +327,7 @@ class HistoryPeriodView(OpenPeerPowerView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -187,7 +345,7 @@ class HistoryPeriodView(OpenPeerPowerView):
             start_time = now - one_day
 
         if start_time > now:
-            return self.json([])
+            return self._empty_response(request)
 
         end_time_str = request.query.get("end_time")
         if end_time_str:
@@ -216,7 +374,19 @@ class HistoryPeriodView(OpenPeerPowerView):
             and entity_ids
             and not _entities_may_have_state_changes_after(opp, entity_ids, start_time)
         ):
-            return self.json([])
+            return self._empty_response(request)
+
+        if "stream" in request.query:
+            return await self._async_stream_significant_states(
+                request,
+                opp,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
 
         return cast(
             web.Response,
@@ -232,6 +402,65 @@ class HistoryPeriodView(OpenPeerPowerView):
             ),
         )
 
+    def _empty_response(self, request: web.Request) -> web.Response:
+        """Return a response without any states."""
+        if "stream" in request.query:
+            return web.Response(content_type=NDJSON_CONTENT_TYPE)
+        return self.json([])
+
+    async def _async_stream_significant_states(
+        self,
+        request,
+        opp,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Stream significant states as newline delimited JSON.
+
+        Every line is an object with an entity_id and a page of its states.
+        """
+        response = web.StreamResponse()
+        response.content_type = NDJSON_CONTENT_TYPE
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        def encode(entity_id, states):
+            return (
+                JSON_DUMP({"entity_id": entity_id, "states": states}).encode("UTF-8")
+                + b"\n"
+            )
+
+        cancel = threading.Event()
+        try:
+            await opp.async_add_executor_job(
+                _stream_significant_states,
+                opp,
+                encode,
+                response.write,
+                cancel,
+                self.filters,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+        except (ConnectionResetError, concurrent.futures.TimeoutError):
+            _LOGGER.debug("History stream closed by the client")
+            return response
+        finally:
+            # Stop the query when the client went away and the request
+            # handler was cancelled
+            cancel.set()
+
+        await response.write_eof()
+        return response
+
     def _sorted_significant_states_json(
         self,
         opp,
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from collections import deque
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -74,6 +75,7 @@ from .const import (
 )
 from .discovery import LAST_DISCOVERY
 from .models import Message, MessageCallbackType, PublishPayloadType
+from .topic_trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -85,6 +87,7 @@ SERVICE_DUMP = "dump"
 
 CONF_DISCOVERY_PREFIX = "discovery_prefix"
 CONF_KEEPALIVE = "keepalive"
+CONF_INBOUND_BATCH_SIZE = "inbound_batch_size"
 CONF_CERTIFICATE = "certificate"
 CONF_CLIENT_KEY = "client_key"
 CONF_CLIENT_CERT = "client_cert"
@@ -98,6 +101,7 @@ PROTOCOL_31 = "3.1"
 
 DEFAULT_PORT = 1883
 DEFAULT_KEEPALIVE = 60
+DEFAULT_INBOUND_BATCH_SIZE = 1000
 DEFAULT_PROTOCOL = PROTOCOL_311
 DEFAULT_TLS_PROTOCOL = "auto"
 
@@ -165,6 +169,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_KEEPALIVE, default=DEFAULT_KEEPALIVE): vol.All(
                         vol.Coerce(int), vol.Range(min=15)
                     ),
+                    vol.Optional(
+                        CONF_INBOUND_BATCH_SIZE, default=DEFAULT_INBOUND_BATCH_SIZE
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(CONF_BROKER): cv.string,
                     vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
                     vol.Optional(CONF_USERNAME): cv.string,
@@ -398,6 +405,7 @@ async def async_setup(opp: OpenPeerPower, config: ConfigType) -> bool:
     websocket_api.async_register_command(opp, websocket_subscribe)
     websocket_api.async_register_command(opp, websocket_remove_device)
     websocket_api.async_register_command(opp, websocket_mqtt_info)
+    websocket_api.async_register_command(opp, websocket_inbound_stats)
 
     if conf is None:
         # If we have a config entry, setup is done by that config entry.
@@ -532,12 +540,11 @@ async def async_setup_entry(opp, entry):
     return True
 
 
-@attr.s(slots=True, frozen=True)
+@attr.s(slots=True, frozen=True, eq=False)
 class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: OppJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
@@ -560,7 +567,7 @@ class MQTT:
         self.opp = opp
         self.config_entry = config_entry
         self.conf = conf
-        self.subscriptions: list[Subscription] = []
+        self.subscriptions: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._op_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -569,6 +576,14 @@ class MQTT:
 
         self._pending_operations = {}
 
+        # Messages and acks handed over by the paho thread, drained in batches
+        self._inbound: deque[tuple[Callable[[Any], None], Any]] = deque()
+        self._inbound_scheduled = False
+        self._inbound_batches = 0
+        self._inbound_handled = 0
+        self._inbound_max_batch = 0
+        self._inbound_max_depth = 0
+
         if self.opp.state == CoreState.running:
             self._op_started.set()
         else:
@@ -736,11 +751,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise OpenPeerPowerError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), OppJob(msg_callback), qos, encoding
-        )
-        self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        subscription = Subscription(topic, OppJob(msg_callback), qos, encoding)
+        self.subscriptions.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -750,12 +762,12 @@ class MQTT:
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
-                raise OpenPeerPowerError("Can't remove subscription twice")
-            self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            try:
+                remaining = self.subscriptions.remove(topic, subscription)
+            except KeyError as err:
+                raise OpenPeerPowerError("Can't remove subscription twice") from err
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if remaining:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -842,17 +854,56 @@ class MQTT:
                 publish_birth_message(birth_message), self.opp.loop
             )
 
+    @property
+    def inbound_stats(self) -> dict[str, int]:
+        """Return statistics of the messages handed over by the paho thread."""
+        return {
+            "queue_depth": len(self._inbound),
+            "max_queue_depth": self._inbound_max_depth,
+            "batches": self._inbound_batches,
+            "handled": self._inbound_handled,
+            "max_batch_size": self._inbound_max_batch,
+        }
+
+    def _queue_inbound(self, handler: Callable[[Any], None], arg: Any) -> None:
+        """Queue a message or ack from the paho thread for the event loop.
+
+        Only the first item queued since the loop last started draining the
+        queue wakes up the loop.
+        """
+        self._inbound.append((handler, arg))
+        if not self._inbound_scheduled:
+            self._inbound_scheduled = True
+            self.opp.loop.call_soon_threadsafe(self._async_handle_inbound)
+
+    @callback
+    def _async_handle_inbound(self) -> None:
+        """Handle a batch of the queued messages and acks."""
+        self._inbound_scheduled = False
+        inbound = self._inbound
+        depth = len(inbound)
+        batch_size = min(depth, self.conf[CONF_INBOUND_BATCH_SIZE])
+
+        for _ in range(batch_size):
+            handler, arg = inbound.popleft()
+            try:
+                handler(arg)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error handling %s", arg)
+
+        self._inbound_batches += 1
+        self._inbound_handled += batch_size
+        self._inbound_max_batch = max(self._inbound_max_batch, batch_size)
+        self._inbound_max_depth = max(self._inbound_max_depth, depth)
+
+        # Yield to the loop before handling the rest of the queue
+        if inbound and not self._inbound_scheduled:
+            self._inbound_scheduled = True
+            self.opp.loop.call_soon(self._async_handle_inbound)
+
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
         """Message received callback."""
-        self.opp.add_job(self._mqtt_handle_message, msg)
-
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        self._queue_inbound(self._mqtt_handle_message, msg)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -864,23 +915,28 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        # Decode the payload only once for each encoding, None if it can't be
+        payloads: dict[str | None, SubscribePayloadType | None] = {None: msg.payload}
 
-        for subscription in subscriptions:
+        for subscription in self.subscriptions.match(msg.topic):
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+            encoding = subscription.encoding
+            if encoding not in payloads:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    payloads[encoding] = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
-                        msg.topic,
-                        subscription.encoding,
-                        subscription.job,
-                    )
-                    continue
+                    payloads[encoding] = None
+
+            payload = payloads[encoding]
+            if encoding is not None and payload is None:
+                _LOGGER.warning(
+                    "Can't decode payload %s on %s with encoding %s (for %s)",
+                    msg.payload[0:8192],
+                    msg.topic,
+                    encoding,
+                    subscription.job,
+                )
+                continue
 
             self.opp.async_run_opp_job(
                 subscription.job,
@@ -896,7 +952,7 @@ class MQTT:
 
     def _mqtt_on_callback(self, _mqttc, _userdata, mid, _granted_qos=None) -> None:
         """Publish / Subscribe / Unsubscribe callback."""
-        self.opp.add_job(self._mqtt_handle_mid, mid)
+        self._queue_inbound(self._mqtt_handle_mid, mid)
 
     @callback
     def _mqtt_handle_mid(self, mid) -> None:
@@ -964,16 +1020,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
@@ -986,6 +1032,21 @@ async def websocket_mqtt_info(opp, connection, msg):
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.websocket_command({vol.Required("type"): "mqtt/inbound_stats"})
+@websocket_api.require_admin
+@callback
+def websocket_inbound_stats(opp, connection, msg):
+    """Get statistics of the messages received from the broker."""
+    mqtt_data = opp.data.get(DATA_MQTT)
+    if mqtt_data is None:
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "MQTT is not set up"
+        )
+        return
+
+    connection.send_result(msg["id"], mqtt_data.inbound_stats)
+
+
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/remove", vol.Required("device_id"): str}
 )
@@ -0,0 +1,124 @@
+"""Route MQTT topics to the subscriptions of matching topic filters."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Node:
+    """A level of the topic filters."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _Node] = {}
+        # Values of the topic filter ending at this node, in insertion order
+        self.values: dict[Any, int] = {}
+
+
+class TopicTrie(Generic[_T]):
+    """Prefix tree of topic filters supporting the + and # wildcards.
+
+    Adding and removing a value only touches the levels of its topic filter,
+    and matching a topic only visits the branches that can match it. Values
+    are returned in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _Node()
+        self._counter = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the trie."""
+        return self._len
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all values in the trie."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            yield from node.values
+            stack.extend(node.children.values())
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _Node()
+            node = child
+        if value not in node.values:
+            self._len += 1
+        self._counter += 1
+        node.values[value] = self._counter
+
+    def remove(self, topic_filter: str, value: _T) -> bool:
+        """Remove a value of a topic filter.
+
+        Returns if the topic filter still has other values. Raises KeyError
+        if the value was not added for the topic filter.
+        """
+        path = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        self._len -= 1
+        if node.values:
+            return True
+        # Prune the levels no other topic filter uses
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.children or child.values:
+                break
+            del parent.children[level]
+        return False
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if a topic filter has values."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all topic filters matching a topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards do not match the first level of topics starting with $
+        wildcards = not topic.startswith("$")
+        matched: list[dict[Any, int]] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, idx = stack.pop()
+            children = node.children
+            if "#" in children and (wildcards or idx):
+                matched.append(children["#"].values)
+            if idx == last:
+                if node.values:
+                    matched.append(node.values)
+                continue
+            child = children.get(levels[idx])
+            if child is not None:
+                stack.append((child, idx + 1))
+            if "+" in children and (wildcards or idx):
+                stack.append((children["+"], idx + 1))
+
+        if not matched:
+            return []
+        if len(matched) == 1:
+            return list(matched[0])
+        order = {}
+        for values in matched:
+            order.update(values)
+        return sorted(order, key=order.__getitem__)
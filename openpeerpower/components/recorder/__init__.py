@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 import concurrent.futures
 from datetime import datetime, timedelta
 import logging
@@ -11,7 +12,14 @@ import threading
 import time
 from typing import Any, Callable, NamedTuple
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import (
+    bindparam,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    func,
+    select,
+)
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -49,8 +57,15 @@ from openpeerpower.loader import bind_opp
 import openpeerpower.util.dt as dt_util
 
 from . import history, migration, purge, statistics
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DOMAIN,
+    SQLITE_URL_PREFIX,
+    STATE_ATTRIBUTES_ID_CACHE_MIN_SIZE,
+    STATE_ATTRIBUTES_ID_CACHE_PER_ENTITY,
+)
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .pool import RecorderPool
 from .util import (
     dburl_to_path,
@@ -327,6 +342,12 @@ class StatisticsTask(NamedTuple):
     start: datetime.datetime
 
 
+class ShortTermStatisticsTask(NamedTuple):
+    """An object to insert into the recorder queue to run a 5-minute statistics task."""
+
+    start: datetime.datetime
+
+
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
@@ -370,8 +391,18 @@ class Recorder(threading.Thread):
         self._timechanges_seen = 0
         self._commits_without_expire = 0
         self._keepalive_count = 0
-        self._old_states = {}
-        self._pending_expunge = []
+        # Map of entity_id to the state_id of its last recorded state
+        self._old_state_ids: dict[str, int] = {}
+        # Rows waiting to be written on the next commit
+        self._pending_rows: list[tuple[dict[str, Any], dict[str, Any] | None]] = []
+        # LRU of recently written serialized attributes to their attributes_id
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._state_attributes_ids_size = STATE_ATTRIBUTES_ID_CACHE_MIN_SIZE
+        # Write statistics of the event session
+        self.commit_count = 0
+        self.committed_rows = 0
+        self.last_commit_seconds = 0.0
+        self.total_commit_seconds = 0.0
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -460,10 +491,14 @@ class Recorder(threading.Thread):
 
     def do_adhoc_statistics(self, **kwargs):
         """Trigger an adhoc statistics run."""
+        period = kwargs.get("period", statistics.PERIOD_HOURLY)
         start = kwargs.get("start")
         if not start:
-            start = statistics.get_start_time()
-        self.queue.put(StatisticsTask(start))
+            start = statistics.get_start_time(period)
+        if period == statistics.PERIOD_5MINUTE:
+            self.queue.put(ShortTermStatisticsTask(start))
+        else:
+            self.queue.put(StatisticsTask(start))
 
     @callback
     def async_register(self, shutdown_task, opp_started):
@@ -529,6 +564,7 @@ class Recorder(threading.Thread):
     def _async_recorder_ready(self):
         """Finish start and mark recorder ready."""
         self._async_setup_periodic_tasks()
+        self._async_size_state_attributes_ids()
         self.async_recorder_ready.set()
 
     @callback
@@ -547,6 +583,22 @@ class Recorder(threading.Thread):
         """Trigger the hourly statistics run."""
         start = statistics.get_start_time()
         self.queue.put(StatisticsTask(start))
+        self._async_size_state_attributes_ids()
+
+    @callback
+    def async_short_term_statistics(self, now):
+        """Trigger the 5-minute statistics run."""
+        start = statistics.get_start_time(statistics.PERIOD_5MINUTE)
+        self.queue.put(ShortTermStatisticsTask(start))
+
+    @callback
+    def _async_size_state_attributes_ids(self):
+        """Size the attributes_id LRU to the number of entities."""
+        self._state_attributes_ids_size = max(
+            STATE_ATTRIBUTES_ID_CACHE_MIN_SIZE,
+            self.opp.states.async_entity_ids_count()
+            * STATE_ATTRIBUTES_ID_CACHE_PER_ENTITY,
+        )
 
     def _async_setup_periodic_tasks(self):
         """Prepare periodic tasks."""
@@ -558,6 +610,10 @@ class Recorder(threading.Thread):
         async_track_time_change(
             self.opp, self.async_hourly_statistics, minute=12, second=0
         )
+        # Compile short term statistics every 5 minutes
+        async_track_time_change(
+            self.opp, self.async_short_term_statistics, minute="/5", second=10
+        )
 
     def run(self):
         """Start processing events to save."""
@@ -698,6 +754,8 @@ class Recorder(threading.Thread):
 
     def _run_purge(self, keep_days, repack, apply_filter):
         """Purge the database."""
+        # Buffered rows are written first so they are purged as well
+        self._commit_event_session_or_retry()
         if purge.purge_old_data(self, keep_days, repack, apply_filter):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
@@ -709,6 +767,7 @@ class Recorder(threading.Thread):
 
     def _run_purge_entities(self, entity_filter):
         """Purge entities from the database."""
+        self._commit_event_session_or_retry()
         if purge.purge_entity_data(self, entity_filter):
             return
         # Schedule a new purge task if this one didn't finish
@@ -721,6 +780,13 @@ class Recorder(threading.Thread):
         # Schedule a new statistics task if this one didn't finish
         self.queue.put(StatisticsTask(start))
 
+    def _run_short_term_statistics(self, start):
+        """Run 5-minute statistics task."""
+        if statistics.compile_short_term_statistics(self, start):
+            return
+        # Schedule a new statistics task if this one didn't finish
+        self.queue.put(ShortTermStatisticsTask(start))
+
     def _process_one_event(self, event):
         """Process one event."""
         if isinstance(event, PurgeTask):
@@ -735,6 +801,9 @@ class Recorder(threading.Thread):
         if isinstance(event, StatisticsTask):
             self._run_statistics(event.start)
             return
+        if isinstance(event, ShortTermStatisticsTask):
+            self._run_short_term_statistics(event.start)
+            return
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
@@ -755,38 +824,29 @@ class Recorder(threading.Thread):
 
         try:
             if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
+                event_row = Events.row_from_event(event, event_data="{}")
             else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
+                event_row = Events.row_from_event(event)
+            event_row["created"] = event.time_fired
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
 
+        state_row = None
         if event.event_type == EVENT_STATE_CHANGED:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                state_row = States.row_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+            else:
+                if not event.data.get("new_state"):
+                    state_row["state"] = None
+                state_row["created"] = event.time_fired
+
+        self._pending_rows.append((event_row, state_row))
 
         # If they do not have a commit interval
         # than we commit right away
@@ -805,7 +865,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_rows
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -827,16 +891,28 @@ class Recorder(threading.Thread):
 
     def _commit_event_session(self):
         self._commits_without_expire += 1
+        start = time.perf_counter()
+        pending_rows = self._pending_rows
 
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
-        self.event_session.commit()
+        try:
+            old_state_ids, new_attributes_ids = self._write_pending_rows(pending_rows)
+            self.event_session.commit()
+        except Exception:
+            # Nothing of the batch was committed so it is
+            # written again on retry
+            self.event_session.rollback()
+            raise
+
+        self._old_state_ids = old_state_ids
+        self._pending_rows = []
+        for shared_attrs, attributes_id in new_attributes_ids.items():
+            self._cache_attributes_id(shared_attrs, attributes_id)
+        elapsed = time.perf_counter() - start
+        self.commit_count += 1
+        self.committed_rows += len(pending_rows)
+        self.last_commit_seconds = elapsed
+        self.total_commit_seconds += elapsed
+        _LOGGER.debug("Committed %s rows in %.3f seconds", len(pending_rows), elapsed)
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -845,6 +921,143 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _write_pending_rows(self, pending_rows):
+        """Insert the buffered rows with SQLAlchemy Core.
+
+        All events are inserted with one executemany and their ids are read
+        back, then the same is done for the states. A state that follows
+        another state of its entity in the same batch gets its old_state_id
+        set afterwards.
+
+        Returns the updated map of entity_id to the id of its last state and
+        the attributes rows created by this batch.
+        """
+        session = self.event_session
+        old_state_ids = dict(self._old_state_ids)
+        new_attributes_ids = {}
+
+        event_ids = self._insert_rows(
+            Events.__table__.c.event_id, [event_row for event_row, _ in pending_rows]
+        )
+
+        state_rows = []
+        # Index in state_rows of the last state of an entity in this batch
+        last_state_idx = {}
+        # Pairs of state_rows indexes of a state and its old state
+        chained_states = []
+        for event_id, (_, state_row) in zip(event_ids, pending_rows):
+            if state_row is None:
+                continue
+            entity_id = state_row["entity_id"]
+            old_idx = last_state_idx.pop(entity_id, None)
+            if old_idx is not None:
+                chained_states.append((len(state_rows), old_idx))
+            if state_row["state"] is not None:
+                last_state_idx[entity_id] = len(state_rows)
+            state_rows.append(
+                {
+                    **state_row,
+                    "attributes": None,
+                    "attributes_id": self._get_attributes_id(
+                        state_row["attributes"], new_attributes_ids
+                    ),
+                    "event_id": event_id,
+                    "old_state_id": old_state_ids.pop(entity_id, None),
+                }
+            )
+
+        if not state_rows:
+            return old_state_ids, new_attributes_ids
+
+        state_ids = self._insert_rows(States.__table__.c.state_id, state_rows)
+        if chained_states:
+            table = States.__table__
+            session.execute(
+                table.update()
+                .where(table.c.state_id == bindparam("b_state_id"))
+                .values(old_state_id=bindparam("b_old_state_id")),
+                [
+                    {
+                        "b_state_id": state_ids[idx],
+                        "b_old_state_id": state_ids[old_idx],
+                    }
+                    for idx, old_idx in chained_states
+                ],
+            )
+        for entity_id, idx in last_state_idx.items():
+            old_state_ids[entity_id] = state_ids[idx]
+
+        return old_state_ids, new_attributes_ids
+
+    def _insert_rows(self, id_column, rows):
+        """Insert rows with one executemany and return their ids in order.
+
+        The recorder is the only writer of the table, so the rows it inserts
+        in the transaction are the ones above the highest id before it.
+        """
+        if not rows:
+            return []
+        session = self.event_session
+        last_id = session.execute(select(func.max(id_column))).scalar() or 0
+        session.execute(id_column.table.insert(), rows)
+        ids = (
+            session.execute(
+                select(id_column).where(id_column > last_id).order_by(id_column)
+            )
+            .scalars()
+            .all()
+        )
+        if len(ids) != len(rows):
+            raise SQLAlchemyError(
+                f"Inserted {len(rows)} rows into {id_column.table.name} "
+                f"but found {len(ids)}"
+            )
+        return ids
+
+    def _get_attributes_id(self, shared_attrs, new_attributes_ids):
+        """Return the id of the state_attributes row for shared_attrs.
+
+        Recently written attributes are served from the LRU, otherwise the
+        row is looked up by hash or inserted.
+        """
+        attributes_id = self._state_attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            return attributes_id
+        attributes_id = new_attributes_ids.get(shared_attrs)
+        if attributes_id is not None:
+            return attributes_id
+
+        table = StateAttributes.__table__
+        attrs_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        attributes_id = self.event_session.execute(
+            select(table.c.attributes_id)
+            .where(table.c.hash == attrs_hash)
+            .where(table.c.shared_attrs == shared_attrs)
+            .limit(1)
+        ).scalar()
+        if attributes_id is None:
+            result = self.event_session.execute(
+                table.insert(), {"hash": attrs_hash, "shared_attrs": shared_attrs}
+            )
+            attributes_id = result.inserted_primary_key[0]
+        new_attributes_ids[shared_attrs] = attributes_id
+        return attributes_id
+
+    def _cache_attributes_id(self, shared_attrs, attributes_id):
+        """Remember the attributes_id of shared_attrs in the LRU."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        self._state_attributes_ids.move_to_end(shared_attrs)
+        while len(self._state_attributes_ids) > self._state_attributes_ids_size:
+            self._state_attributes_ids.popitem(last=False)
+
+    def evict_state_attributes_ids(self, attributes_ids):
+        """Drop purged state_attributes rows from the LRU."""
+        attributes_ids = set(attributes_ids)
+        for shared_attrs, attributes_id in list(self._state_attributes_ids.items()):
+            if attributes_id in attributes_ids:
+                del self._state_attributes_ids[shared_attrs]
+
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -855,7 +1068,9 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self):
         """Close the event session."""
-        self._old_states = {}
+        self._old_state_ids = {}
+        self._pending_rows = []
+        self._state_attributes_ids.clear()
 
         if not self.event_session:
             return
@@ -8,3 +8,8 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 # The maximum number of rows (events) we purge in one delete statement
 MAX_ROWS_TO_PURGE = 1000
+
+# The number of distinct state attributes we keep the attributes_id of in memory
+# is sized to the number of entities, but never below the minimum
+STATE_ATTRIBUTES_ID_CACHE_MIN_SIZE = 2048
+STATE_ATTRIBUTES_ID_CACHE_PER_ENTITY = 2
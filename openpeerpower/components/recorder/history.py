@@ -11,6 +11,7 @@ from sqlalchemy.ext import baked
 
 from openpeerpower.components import recorder
 from openpeerpower.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp_to_utc_isoformat,
 )
@@ -47,19 +48,39 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Rows written before the state_attributes table existed
+    # still carry their attributes in the states table
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
+QUERY_STATE_ROWS = [
+    States.entity_id,
+    States.state,
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
+    States.last_updated,
+]
+
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The number of rows fetched and the number of states sent at once
+# when streaming history
+STREAM_PAGE_SIZE = 500
+
 
 def async_setup(opp):
     """Set up the history hooks."""
     opp.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _query_states(session):
+    """Query QUERY_STATES joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(opp, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(opp=opp) as session:
@@ -86,7 +107,39 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = opp.data[HISTORY_BAKERY](lambda session: session.query(*QUERY_STATES))
+    states = execute(
+        _significant_states_query(
+            opp,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_dict(
+        opp,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def _significant_states_query(
+    opp, session, start_time, end_time, entity_ids, filters, significant_changes_only
+):
+    """Return the query for the significant states during a period."""
+    baked_query = opp.data[HISTORY_BAKERY](_query_states)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -113,34 +166,159 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
 
-    return _sorted_states_to_dict(
+def get_significant_state_rows(opp, start_time, end_time, entity_ids):
+    """Return the raw state changes of entities during start_time - end_time.
+
+    Rows of (entity_id, state, attributes, last_updated) are returned sorted by
+    entity and time, starting with the state of each entity at start_time.
+    Unlike get_significant_states no State objects are created and attributes
+    are left as JSON, so it is cheap to fetch many entities at once.
+    """
+    with session_scope(opp=opp) as session:
+        query = session.query(*QUERY_STATE_ROWS).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
+        period_query = query.filter(
+            States.entity_id.in_(entity_ids),
+            States.last_changed == States.last_updated,
+            States.last_updated >= start_time,
+            States.last_updated < end_time,
+        )
+
+        run = recorder.run_information_from_instance(opp, start_time)
+        if run is None:
+            run = recorder.run_information_with_session(session, start_time)
+        if run is not None:
+            most_recent_state_ids = (
+                session.query(func.max(States.state_id).label("max_state_id"))
+                .filter(
+                    States.entity_id.in_(entity_ids),
+                    States.last_updated >= run.start,
+                    States.last_updated < start_time,
+                )
+                .group_by(States.entity_id)
+                .subquery()
+            )
+            start_query = query.join(
+                most_recent_state_ids,
+                States.state_id == most_recent_state_ids.c.max_state_id,
+            )
+            period_query = start_query.union_all(period_query)
+
+        return execute(period_query.order_by(States.entity_id, States.last_updated))
+
+
+def stream_significant_states(
+    opp,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    page_size=STREAM_PAGE_SIZE,
+):
+    """Yield the significant states during a period one page at a time.
+
+    Returns the same states as get_significant_states, but rows are fetched
+    with yield_per and every page is a tuple of an entity_id and a list of
+    at most page_size JSON friendly state dicts, so memory use does not
+    grow with the length of the period.
+
+    Pages of an entity are yielded in order. Entities that only have a
+    state at start_time are yielded last.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(opp, start_time)
+        for state in _get_states_with_session(
+            opp, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            initial_states[state.entity_id] = state
+
+    rows = _significant_states_query(
         opp,
         session,
-        states,
         start_time,
+        end_time,
         entity_ids,
         filters,
-        include_start_time_state,
-        minimal_response,
-    )
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(page_size))
+
+    for ent_id, group in groupby(rows, lambda row: row.entity_id):
+        page = []
+        for state_dict in _entity_state_dicts(
+            ent_id, group, initial_states.pop(ent_id, None), minimal_response
+        ):
+            page.append(state_dict)
+            if len(page) >= page_size:
+                yield ent_id, page
+                page = []
+        if page:
+            yield ent_id, page
+
+    for ent_id, state in initial_states.items():
+        yield ent_id, [state.as_dict()]
+
+
+def _entity_state_dicts(ent_id, group, initial_state, minimal_response):
+    """Yield the JSON friendly states of one entity.
+
+    Follows the format of _sorted_states_to_dict.
+    """
+    if initial_state is not None:
+        yield initial_state.as_dict()
+
+    if not minimal_response or split_entity_id(ent_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        for db_state in group:
+            yield LazyState(db_state).as_dict()
+        return
+
+    prev_state = initial_state
+    if prev_state is None:
+        prev_state = next(group)
+        yield LazyState(prev_state).as_dict()
+
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    # Only the last state change is a full state, so the minimal
+    # state of a change is sent once the next change is seen
+    last_changed_state = None
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        if last_changed_state is not None:
+            yield {
+                STATE_KEY: last_changed_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    last_changed_state.last_changed
+                ),
+            }
+        last_changed_state = prev_state = db_state
+
+    if last_changed_state is not None:
+        yield LazyState(last_changed_state).as_dict()
 
 
 def state_changes_during_period(opp, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(opp=opp) as session:
-        baked_query = opp.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = opp.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -153,7 +331,9 @@ def state_changes_during_period(opp, start_time, end_time=None, entity_id=None):
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -174,13 +354,13 @@ def get_last_state_changes(opp, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(opp=opp) as session:
-        baked_query = opp.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = opp.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -241,7 +421,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -289,7 +469,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(opp, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = opp.data[HISTORY_BAKERY](lambda session: session.query(*QUERY_STATES))
+    baked_query = opp.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
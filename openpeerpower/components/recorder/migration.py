@@ -11,7 +11,15 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.schema import AddConstraint, DropConstraint
 
-from .models import SCHEMA_VERSION, TABLE_STATES, Base, SchemaChanges, Statistics
+from .models import (
+    SCHEMA_VERSION,
+    TABLE_STATES,
+    Base,
+    SchemaChanges,
+    StateAttributes,
+    Statistics,
+    StatisticsShortTerm,
+)
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -340,7 +348,7 @@ def _drop_foreign_key_constraints(connection, engine, table, columns):
             )
 
 
-def _apply_update(engine, session, new_version, old_version):
+def _apply_update(engine, session, new_version, old_version):  # noqa: C901
     """Perform operations to bring schema up to date."""
     connection = session.connection()
     if new_version == 1:
@@ -452,6 +460,17 @@ def _apply_update(engine, session, new_version, old_version):
         _drop_foreign_key_constraints(
             connection, engine, TABLE_STATES, ["old_state_id"]
         )
+    elif new_version == 17:
+        # Attributes are now stored once per distinct value in the
+        # state_attributes table. Existing rows keep their attributes
+        # in the states table and are read through a coalesce.
+        if not sqlalchemy.inspect(engine).has_table(StateAttributes.__tablename__):
+            StateAttributes.__table__.create(engine)
+        _add_columns(connection, TABLE_STATES, ["attributes_id INTEGER"])
+        _create_index(connection, TABLE_STATES, "ix_states_attributes_id")
+    elif new_version == 18:
+        if not sqlalchemy.inspect(engine).has_table(StatisticsShortTerm.__tablename__):
+            StatisticsShortTerm.__table__.create(engine)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
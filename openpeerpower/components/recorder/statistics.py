@@ -7,28 +7,44 @@ from itertools import groupby
 import logging
 from typing import TYPE_CHECKING
 
-from sqlalchemy import bindparam
+from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 import openpeerpower.util.dt as dt_util
 
 from .const import DOMAIN
-from .models import Statistics, process_timestamp_to_utc_isoformat
+from .models import Statistics, StatisticsShortTerm, process_timestamp_to_utc_isoformat
 from .util import execute, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
     from . import Recorder
 
-QUERY_STATISTICS = [
-    Statistics.statistic_id,
-    Statistics.start,
-    Statistics.mean,
-    Statistics.min,
-    Statistics.max,
-    Statistics.last_reset,
-    Statistics.state,
-    Statistics.sum,
-]
+PERIOD_HOURLY = "hourly"
+PERIOD_5MINUTE = "5minute"
+
+STATISTICS_TABLES = {
+    PERIOD_HOURLY: Statistics,
+    PERIOD_5MINUTE: StatisticsShortTerm,
+}
+
+PERIOD_LENGTHS = {
+    PERIOD_HOURLY: timedelta(hours=1),
+    PERIOD_5MINUTE: timedelta(minutes=5),
+}
+
+QUERY_STATISTICS = {
+    period: [
+        table.statistic_id,
+        table.start,
+        table.mean,
+        table.min,
+        table.max,
+        table.last_reset,
+        table.state,
+        table.sum,
+    ]
+    for period, table in STATISTICS_TABLES.items()
+}
 
 STATISTICS_BAKERY = "recorder_statistics_bakery"
 
@@ -40,20 +56,26 @@ def async_setup(opp):
     opp.data[STATISTICS_BAKERY] = baked.bakery()
 
 
-def get_start_time() -> datetime.datetime:
-    """Return start time."""
-    last_hour = dt_util.utcnow() - timedelta(hours=1)
+def get_start_time(period: str = PERIOD_HOURLY) -> datetime.datetime:
+    """Return the start time of the last complete period."""
+    now = dt_util.utcnow()
+    if period == PERIOD_5MINUTE:
+        now = now.replace(minute=now.minute - now.minute % 5)
+        return now.replace(second=0, microsecond=0) - PERIOD_LENGTHS[period]
+    last_hour = now - timedelta(hours=1)
     start = last_hour.replace(minute=0, second=0, microsecond=0)
     return start
 
 
-@retryable_database_job("statistics")
-def compile_statistics(instance: Recorder, start: datetime.datetime) -> bool:
-    """Compile statistics."""
+def _compile_statistics(
+    instance: Recorder, start: datetime.datetime, period: str
+) -> None:
+    """Compile statistics of all platforms for a period."""
     start = dt_util.as_utc(start)
-    end = start + timedelta(hours=1)
+    end = start + PERIOD_LENGTHS[period]
     _LOGGER.debug(
-        "Compiling statistics for %s-%s",
+        "Compiling %s statistics for %s-%s",
+        period,
         start,
         end,
     )
@@ -61,36 +83,55 @@ def compile_statistics(instance: Recorder, start: datetime.datetime) -> bool:
     for domain, platform in instance.opp.data[DOMAIN].items():
         if not hasattr(platform, "compile_statistics"):
             continue
-        platform_stats.append(platform.compile_statistics(instance.opp, start, end))
+        platform_stats.append(
+            platform.compile_statistics(instance.opp, start, end, period)
+        )
         _LOGGER.debug(
             "Statistics for %s during %s-%s: %s", domain, start, end, platform_stats[-1]
         )
 
+    table = STATISTICS_TABLES[period]
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         for stats in platform_stats:
             for entity_id, stat in stats.items():
-                session.add(Statistics.from_stats(DOMAIN, entity_id, start, stat))
+                session.add(table.from_stats(DOMAIN, entity_id, start, stat))
+
+
+@retryable_database_job("statistics")
+def compile_statistics(instance: Recorder, start: datetime.datetime) -> bool:
+    """Compile hourly statistics."""
+    _compile_statistics(instance, start, PERIOD_HOURLY)
+    return True
 
+
+@retryable_database_job("statistics")
+def compile_short_term_statistics(instance: Recorder, start: datetime.datetime) -> bool:
+    """Compile 5-minute statistics."""
+    _compile_statistics(instance, start, PERIOD_5MINUTE)
     return True
 
 
-def statistics_during_period(opp, start_time, end_time=None, statistic_id=None):
+def statistics_during_period(
+    opp, start_time, end_time=None, statistic_id=None, period=PERIOD_HOURLY
+):
     """Return states changes during UTC period start_time - end_time."""
+    table = STATISTICS_TABLES[period]
     with session_scope(opp=opp) as session:
+        # The period is part of the cache key as the queries differ per table
         baked_query = opp.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
+            lambda session: session.query(*QUERY_STATISTICS[period]), period
         )
 
-        baked_query += lambda q: q.filter(Statistics.start >= bindparam("start_time"))
+        baked_query += lambda q: q.filter(table.start >= bindparam("start_time"))
 
         if end_time is not None:
-            baked_query += lambda q: q.filter(Statistics.start < bindparam("end_time"))
+            baked_query += lambda q: q.filter(table.start < bindparam("end_time"))
 
         if statistic_id is not None:
             baked_query += lambda q: q.filter_by(statistic_id=bindparam("statistic_id"))
             statistic_id = statistic_id.lower()
 
-        baked_query += lambda q: q.order_by(Statistics.statistic_id, Statistics.start)
+        baked_query += lambda q: q.order_by(table.statistic_id, table.start)
 
         stats = execute(
             baked_query(session).params(
@@ -107,7 +148,7 @@ def get_last_statistics(opp, number_of_stats, statistic_id=None):
     """Return the last number_of_stats statistics."""
     with session_scope(opp=opp) as session:
         baked_query = opp.data[STATISTICS_BAKERY](
-            lambda session: session.query(*QUERY_STATISTICS)
+            lambda session: session.query(*QUERY_STATISTICS[PERIOD_HOURLY])
         )
 
         if statistic_id is not None:
@@ -130,6 +171,34 @@ def get_last_statistics(opp, number_of_stats, statistic_id=None):
         return _sorted_statistics_to_dict(stats, statistic_ids)
 
 
+def get_latest_statistics(opp, statistic_ids, period=PERIOD_HOURLY):
+    """Return the latest statistics of each of statistic_ids in one query."""
+    table = STATISTICS_TABLES[period]
+    with session_scope(opp=opp) as session:
+        most_recent = (
+            session.query(
+                table.statistic_id.label("max_statistic_id"),
+                func.max(table.start).label("max_start"),
+            )
+            .filter(table.statistic_id.in_(statistic_ids))
+            .group_by(table.statistic_id)
+            .subquery()
+        )
+        query = (
+            session.query(*QUERY_STATISTICS[period])
+            .join(
+                most_recent,
+                and_(
+                    table.statistic_id == most_recent.c.max_statistic_id,
+                    table.start == most_recent.c.max_start,
+                ),
+            )
+            .order_by(table.statistic_id)
+        )
+
+        return _sorted_statistics_to_dict(execute(query), None)
+
+
 def _sorted_statistics_to_dict(
     stats,
     statistic_ids,
@@ -8,6 +8,7 @@ from openpeerpower.components import automation, group, script, websocket_api
 from openpeerpower.components.openpeerpower import scene
 from openpeerpower.core import OpenPeerPower, callback, split_entity_id
 from openpeerpower.helpers import device_registry, entity_registry
+from openpeerpower.helpers.service import async_resolve_targets
 
 DOMAIN = "search"
 _LOGGER = logging.getLogger(__name__)
@@ -120,8 +121,8 @@ class Searcher:
     @callback
     def _resolve_area(self, area_id) -> None:
         """Resolve an area."""
-        for device in device_registry.async_entries_for_area(self._device_reg, area_id):
-            self._add_or_resolve("device", device.id)
+        for device_id in async_resolve_targets(self.opp, (area_id,), ()).devices:
+            self._add_or_resolve("device", device_id)
         for entity_entry in entity_registry.async_entries_for_area(
             self._entity_reg, area_id
         ):
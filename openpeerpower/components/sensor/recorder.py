@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import datetime
-import itertools
+from itertools import groupby
+import json
+from operator import itemgetter, mul
 
 from openpeerpower.components.recorder import history, statistics
+from openpeerpower.components.recorder.models import process_timestamp
 from openpeerpower.components.sensor import (
     ATTR_STATE_CLASS,
     DEVICE_CLASS_BATTERY,
@@ -15,7 +18,7 @@ from openpeerpower.components.sensor import (
     STATE_CLASS_MEASUREMENT,
 )
 from openpeerpower.const import ATTR_DEVICE_CLASS
-from openpeerpower.core import OpenPeerPower, State
+from openpeerpower.core import OpenPeerPower
 import openpeerpower.util.dt as dt_util
 
 from . import DOMAIN
@@ -53,7 +56,7 @@ def _is_number(s: str) -> bool:  # pylint: disable=invalid-name
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[float], timestamps: list[float], start: float, end: float
 ) -> float:
     """Calculate a time weighted average.
 
@@ -61,110 +64,129 @@ def _time_weighted_average(
     state changes.
     Note: there's no interpolation of values between state changes.
     """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics. If there was no
+    # last known state the period starts with the first state.
+    if timestamps[0] < start:
+        timestamps[0] = start
+    ends = timestamps[1:]
+    ends.append(end)
+    durations = map(float.__sub__, ends, timestamps)
+
+    return sum(map(mul, values, durations)) / (end - timestamps[0])
+
+
+def _compile_sum(
+    values: list[float], attributes: list[str], last_stats: dict | None
+) -> dict | None:
+    """Compile the sum of a sensor which may be reset."""
+    last_reset = old_last_reset = None
+    new_state = old_state = None
+    _sum = 0
+    if last_stats is not None:
+        # We have compiled history for this sensor before, use that as a starting point
+        last_reset = old_last_reset = last_stats["last_reset"]
+        new_state = old_state = last_stats["state"]
+        _sum = last_stats["sum"]
+
+    # Attributes are shared by consecutive states, only decode them once
+    decoded: dict[str, dict] = {}
+    for fstate, attrs in zip(values, attributes):
+        if (state_attributes := decoded.get(attrs)) is None:
+            state_attributes = decoded[attrs] = json.loads(attrs) if attrs else {}
+        if "last_reset" not in state_attributes:
+            continue
+        if (last_reset := state_attributes["last_reset"]) != old_last_reset:
+            # The sensor has been reset, update the sum
+            if old_state is not None:
+                _sum += new_state - old_state
+            # ..and update the starting point
+            new_state = fstate
+            old_last_reset = last_reset
+            old_state = new_state
         else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
+            new_state = fstate
 
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+    if last_reset is None or new_state is None or old_state is None:
+        # No valid updates
+        return None
 
-    return accumulated / (end - start).total_seconds()
+    # Update the sum with the last state
+    _sum += new_state - old_state
+    return {
+        "last_reset": dt_util.parse_datetime(last_reset),
+        "sum": _sum,
+        "state": new_state,
+    }
 
 
 def compile_statistics(
-    opp: OpenPeerPower, start: datetime.datetime, end: datetime.datetime
+    opp: OpenPeerPower,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    period: str = statistics.PERIOD_HOURLY,
 ) -> dict:
     """Compile statistics for all entities during start-end.
 
+    The states of all entities are fetched as raw rows in one query, and the
+    last statistics of all entities with a sum in another one.
+
     Note: This will query the database and must not be run in the event loop
     """
     result: dict = {}
 
-    entities = _get_entities(opp)
+    device_classes = dict(_get_entities(opp))
+    if not device_classes:
+        return result
+
+    sum_entity_ids = [
+        entity_id
+        for entity_id, device_class in device_classes.items()
+        if "sum" in DEVICE_CLASS_STATISTICS[device_class]
+    ]
+    last_stats = {}
+    if sum_entity_ids:
+        last_stats = statistics.get_latest_statistics(  # type: ignore
+            opp, sum_entity_ids, period
+        )
 
     # Get history between start and end
-    history_list = history.get_significant_states(  # type: ignore
-        opp, start - datetime.timedelta.resolution, end, [i[0] for i in entities]
+    rows = history.get_significant_state_rows(  # type: ignore
+        opp, start, end, list(device_classes)
     )
 
-    for entity_id, device_class in entities:
-        wanted_statistics = DEVICE_CLASS_STATISTICS[device_class]
+    for entity_id, entity_rows in groupby(rows, itemgetter(0)):
+        wanted_statistics = DEVICE_CLASS_STATISTICS[device_classes[entity_id]]
 
-        if entity_id not in history_list:
+        numeric_rows = [row for row in entity_rows if row[1] and _is_number(row[1])]
+        if not numeric_rows:
             continue
+        values = [float(row[1]) for row in numeric_rows]
 
-        entity_history = history_list[entity_id]
-        fstates = [
-            (float(el.state), el) for el in entity_history if _is_number(el.state)
-        ]
-
-        if not fstates:
-            continue
-
-        result[entity_id] = {}
+        stats = result[entity_id] = {}
 
         # Make calculations
         if "max" in wanted_statistics:
-            result[entity_id]["max"] = max(*itertools.islice(zip(*fstates), 1))
+            stats["max"] = max(values)
         if "min" in wanted_statistics:
-            result[entity_id]["min"] = min(*itertools.islice(zip(*fstates), 1))
+            stats["min"] = min(values)
 
         if "mean" in wanted_statistics:
-            result[entity_id]["mean"] = _time_weighted_average(fstates, start, end)
+            timestamps = [process_timestamp(row[3]).timestamp() for row in numeric_rows]
+            stats["mean"] = _time_weighted_average(
+                values, timestamps, start.timestamp(), end.timestamp()
+            )
 
         if "sum" in wanted_statistics:
-            last_reset = old_last_reset = None
-            new_state = old_state = None
-            _sum = 0
-            last_stats = statistics.get_last_statistics(opp, 1, entity_id)  # type: ignore
-            if entity_id in last_stats:
-                # We have compiled history for this sensor before, use that as a starting point
-                last_reset = old_last_reset = last_stats[entity_id][0]["last_reset"]
-                new_state = old_state = last_stats[entity_id][0]["state"]
-                _sum = last_stats[entity_id][0]["sum"]
-
-            for fstate, state in fstates:
-                if "last_reset" not in state.attributes:
-                    continue
-                if (last_reset := state.attributes["last_reset"]) != old_last_reset:
-                    # The sensor has been reset, update the sum
-                    if old_state is not None:
-                        _sum += new_state - old_state
-                    # ..and update the starting point
-                    new_state = fstate
-                    old_last_reset = last_reset
-                    old_state = new_state
-                else:
-                    new_state = fstate
-
-            if last_reset is None or new_state is None or old_state is None:
-                # No valid updates
+            entity_last_stats = last_stats.get(entity_id)
+            sum_stats = _compile_sum(
+                values,
+                [row[2] for row in numeric_rows],
+                entity_last_stats[0] if entity_last_stats else None,
+            )
+            if sum_stats is None:
                 result.pop(entity_id)
                 continue
-
-            # Update the sum with the last state
-            _sum += new_state - old_state
-            result[entity_id]["last_reset"] = dt_util.parse_datetime(last_reset)
-            result[entity_id]["sum"] = _sum
-            result[entity_id]["state"] = new_state
+            stats.update(sum_stats)
 
     return result
@@ -0,0 +1,140 @@
+"""Rolling window of sensor values with incrementally updated aggregates."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Iterator
+import math
+
+
+class RollingWindow:
+    """Window of the last values of a sensor.
+
+    The aggregates are updated as values enter and leave the window instead of
+    being recomputed over all values: the total, mean and variance (Welford)
+    are running sums, the min and max are kept in monotonic deques and the
+    median is looked up in a sorted copy of the values.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the window."""
+        self._maxlen = maxlen
+        self._values: deque[float] = deque()
+        self._sorted: list[float] = []
+        # (index, value) of the candidates to become the min or max once
+        # the older values left the window
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+        # Index of the next value to be added
+        self._next_index = 0
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the values from oldest to newest."""
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        """Return a value of the window."""
+        return self._values[index]
+
+    def append(self, value: float) -> None:
+        """Add a value, removing the oldest one if the window is full."""
+        if len(self._values) == self._maxlen:
+            self.popleft()
+
+        index = self._next_index
+        self._next_index += 1
+        self._values.append(value)
+        insort(self._sorted, value)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+    def popleft(self) -> float:
+        """Remove and return the oldest value."""
+        value = self._values.popleft()
+        index = self._next_index - len(self._values) - 1
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        if self._min[0][0] == index:
+            self._min.popleft()
+        if self._max[0][0] == index:
+            self._max.popleft()
+
+        count = len(self._values)
+        self._removed += 1
+        if count == 0 or self._removed >= count:
+            # Removing values from running sums accumulates rounding errors,
+            # recompute them once the window has been replaced
+            self._recompute()
+            return value
+
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        self._m2 -= delta * (value - self._mean)
+        return value
+
+    def _recompute(self) -> None:
+        """Recompute the running sums from the values."""
+        self._removed = 0
+        if not self._values:
+            self._total = self._mean = self._m2 = 0.0
+            return
+        self._total = math.fsum(self._values)
+        self._mean = self._total / len(self._values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._values)
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the values."""
+        return self._total
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values, the window must not be empty."""
+        return self._mean
+
+    @property
+    def median(self) -> float:
+        """Return the median of the values, the window must not be empty."""
+        middle, odd = divmod(len(self._sorted), 2)
+        if odd:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, the window needs at least two values."""
+        return max(self._m2, 0.0) / (len(self._values) - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value, the window must not be empty."""
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        """Return the largest value, the window must not be empty."""
+        return self._max[0][1]
@@ -1,12 +1,13 @@
 """Support for statistics for sensor values."""
 from collections import deque
 import logging
-import statistics
+from operator import itemgetter
 
+from sqlalchemy import literal, select, union_all
 import voluptuous as vol
 
-from openpeerpower.components.recorder.models import States
-from openpeerpower.components.recorder.util import execute, session_scope
+from openpeerpower.components.recorder.models import States, process_timestamp
+from openpeerpower.components.recorder.util import session_scope
 from openpeerpower.components.sensor import PLATFORM_SCHEMA, SensorEntity
 from openpeerpower.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -26,6 +27,7 @@ from openpeerpower.helpers.reload import async_setup_reload_service
 from openpeerpower.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .rolling import RollingWindow
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +55,11 @@ DEFAULT_SIZE = 20
 DEFAULT_PRECISION = 2
 ICON = "mdi:calculator"
 
+DATA_PENDING_INITIALIZATIONS = "statistics_pending_initializations"
+
+# The number of sensors whose states are fetched with one statement
+INITIALIZE_BATCH_SIZE = 100
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_id,
@@ -96,7 +103,10 @@ class StatisticsSensor(SensorEntity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        if self.is_binary:
+            self.states = deque(maxlen=self._sampling_size)
+        else:
+            self.states = RollingWindow(self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
         self.count = 0
@@ -137,7 +147,7 @@ class StatisticsSensor(SensorEntity):
 
             if "recorder" in self.opp.config.components:
                 # Only use the database if it's configured
-                self.opp.async_create_task(self._async_initialize_from_database())
+                _async_queue_initialize_from_database(self.opp, self)
 
         self.opp.bus.async_listen_once(
             EVENT_OPENPEERPOWER_START, async_stats_sensor_startup
@@ -145,21 +155,25 @@ class StatisticsSensor(SensorEntity):
 
     def _add_state_to_queue(self, new_state):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        self._add_value_to_queue(new_state.state, new_state.last_updated)
+
+    def _add_value_to_queue(self, state, last_updated):
+        """Add a state value and the time it was last updated to the queue."""
+        if state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                self.states.append(state)
             else:
-                self.states.append(float(new_state.state))
+                self.states.append(float(state))
 
-            self.ages.append(new_state.last_updated)
+            self.ages.append(last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
-                new_state.state,
+                state,
             )
 
     @property
@@ -247,24 +261,24 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count:  # require only one data point
+                self.mean = round(self.states.mean, self._precision)
+                self.median = round(self.states.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count > 1:  # require at least two data points
+                self.stdev = round(self.states.stdev, self._precision)
+                self.variance = round(self.states.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self.states.total, self._precision)
+                self.min = round(self.states.min, self._precision)
+                self.max = round(self.states.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -311,43 +325,76 @@ class StatisticsSensor(SensorEntity):
                 self.opp, _scheduled_update, next_to_purge_timestamp
             )
 
-    async def _async_initialize_from_database(self):
-        """Initialize the list of states from the database.
-
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
-        """
-
-        _LOGGER.debug("%s: initializing values from the database", self.entity_id)
-
-        with session_scope(opp=self.opp) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
-
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
-                )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records", self.entity_id)
-
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
-            )
-            states = execute(query, to_native=True, validate_entity_ids=False)
-
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+    @callback
+    def async_initialize_from_states(self, states):
+        """Initialize the list of states from (state, last_updated) tuples."""
+        for state, last_updated in states:
+            self._add_value_to_queue(state, process_timestamp(last_updated))
 
         self.async_schedule_update_op_state(True)
 
         _LOGGER.debug("%s: initializing from database completed", self.entity_id)
+
+
+@callback
+def _async_queue_initialize_from_database(opp, sensor):
+    """Queue a sensor to be initialized from the database.
+
+    The sensors queued while the event loop is busy, usually all of them
+    as they start together, are initialized together.
+    """
+    pending = opp.data.get(DATA_PENDING_INITIALIZATIONS)
+    if pending is None:
+        pending = opp.data[DATA_PENDING_INITIALIZATIONS] = []
+        opp.async_create_task(_async_initialize_from_database(opp))
+    pending.append(sensor)
+
+
+async def _async_initialize_from_database(opp):
+    """Initialize the queued sensors from the database."""
+    # pylint: disable=protected-access
+    sensors = opp.data.pop(DATA_PENDING_INITIALIZATIONS)
+    requests = [
+        (sensor._entity_id.lower(), sensor._max_age, sensor._sampling_size)
+        for sensor in sensors
+    ]
+    states = await opp.async_add_executor_job(_fetch_states, opp, requests)
+
+    for sensor, sensor_states in zip(sensors, states):
+        sensor.async_initialize_from_states(sensor_states)
+
+
+def _fetch_states(opp, requests):
+    """Fetch the last states of the sensors from the database.
+
+    For every (entity_id, max_age, sampling_size) request the last
+    sampling_size states not older than max_age are selected in DESCENDING
+    order, so that they can be limited to sampling_size, and sorted
+    afterwards to get them in the right order again. The selects of up to
+    INITIALIZE_BATCH_SIZE sensors are combined into one statement.
+    """
+    now = dt_util.utcnow()
+    selects = []
+    for request_idx, (entity_id, max_age, sampling_size) in enumerate(requests):
+        query = select(
+            literal(request_idx).label("request_idx"),
+            States.state,
+            States.last_updated,
+        ).where(States.entity_id == entity_id)
+        if max_age is not None:
+            query = query.where(States.last_updated >= now - max_age)
+        query = query.order_by(States.last_updated.desc()).limit(sampling_size)
+        selects.append(select(query.subquery()))
+
+    states = [[] for _ in requests]
+    with session_scope(opp=opp) as session:
+        for idx in range(0, len(selects), INITIALIZE_BATCH_SIZE):
+            batch = selects[idx : idx + INITIALIZE_BATCH_SIZE]
+            statement = batch[0] if len(batch) == 1 else union_all(*batch)
+            for request_idx, state, last_updated in session.execute(statement):
+                states[request_idx].append((state, last_updated))
+
+    # The order of the rows of a union is not guaranteed
+    for request_states in states:
+        request_states.sort(key=itemgetter(1))
+    return states
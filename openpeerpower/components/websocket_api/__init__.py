@@ -39,6 +39,19 @@ DOMAIN: Final = const.DOMAIN
 
 DEPENDENCIES: Final[tuple[str]] = ("http",)
 
+CONFIG_SCHEMA: Final = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(
+                    const.CONF_SLOW_CLIENT_POLICY, default=const.SLOW_CLIENT_DISCONNECT
+                ): vol.In([const.SLOW_CLIENT_DISCONNECT, const.SLOW_CLIENT_COALESCE]),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 @bind_opp
 @callback
@@ -64,6 +77,10 @@ def async_register_command(
 
 async def async_setup(opp: OpenPeerPower, config: ConfigType) -> bool:
     """Initialize the websocket API."""
+    if DOMAIN in config:
+        opp.data[const.DATA_SLOW_CLIENT_POLICY] = config[DOMAIN][
+            const.CONF_SLOW_CLIENT_POLICY
+        ]
     opp.http.register_view(http.WebsocketAPIView())
     commands.async_register_commands(opp, async_register_command)
     return True
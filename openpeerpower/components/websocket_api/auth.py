@@ -1,7 +1,7 @@
 """Handle the auth of a connection."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -30,6 +30,7 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("supported_features", default={}): {str: object},
     }
 )
 
@@ -58,14 +59,16 @@ class AuthPhase:
         opp: OpenPeerPower,
         send_message: Callable[[str | dict[str, Any]], None],
         request: Request,
+        drain: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize the authentiated connection."""
         self._opp = opp
         self._send_message = send_message
+        self._drain = drain
         self._logger = logger
         self._request = request
 
-    async def async_handle(self, msg: dict[str, str]) -> ActiveConnection:
+    async def async_handle(self, msg: dict[str, Any]) -> ActiveConnection:
         """Handle authentication."""
         try:
             msg = AUTH_MESSAGE_SCHEMA(msg)
@@ -83,7 +86,11 @@ class AuthPhase:
                 msg["access_token"]
             )
             if refresh_token is not None:
-                return await self._async_finish_auth(refresh_token.user, refresh_token)
+                connection = await self._async_finish_auth(
+                    refresh_token.user, refresh_token
+                )
+                connection.supported_features = msg["supported_features"]
+                return connection
 
         self._send_message(auth_invalid_message("Invalid access token or password"))
         await process_wrong_login(self._request)
@@ -97,5 +104,10 @@ class AuthPhase:
         await process_success_login(self._request)
         self._send_message(auth_ok_message())
         return ActiveConnection(
-            self._logger, self._opp, self._send_message, user, refresh_token
+            self._logger,
+            self._opp,
+            self._send_message,
+            user,
+            refresh_token,
+            self._drain,
         )
@@ -12,7 +12,7 @@ from openpeerpower.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from openpeerpower.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from openpeerpower.components.websocket_api.const import ERR_NOT_FOUND
 from openpeerpower.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from openpeerpower.core import Context, Event, OpenPeerPower, callback
+from openpeerpower.core import Context, Event, OpenPeerPower, State, callback
 from openpeerpower.exceptions import (
     OpenPeerPowerError,
     ServiceNotFound,
@@ -24,6 +24,7 @@ from openpeerpower.helpers.dispatcher import async_dispatcher_connect
 from openpeerpower.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_pending_timers,
     async_track_template_result,
 )
 from openpeerpower.helpers.json import ExtendedJSONEncoder
@@ -42,6 +43,7 @@ def async_register_commands(
 ) -> None:
     """Register commands."""
     async_reg(opp, handle_call_service)
+    async_reg(opp, handle_connection_stats)
     async_reg(opp, handle_entity_source)
     async_reg(opp, handle_execute_script)
     async_reg(opp, handle_get_config)
@@ -49,10 +51,12 @@ def async_register_commands(
     async_reg(opp, handle_get_states)
     async_reg(opp, handle_manifest_get)
     async_reg(opp, handle_integration_setup_info)
+    async_reg(opp, handle_integration_pending_timers)
     async_reg(opp, handle_manifest_list)
     async_reg(opp, handle_ping)
     async_reg(opp, handle_render_template)
     async_reg(opp, handle_subscribe_bootstrap_integrations)
+    async_reg(opp, handle_subscribe_entities)
     async_reg(opp, handle_subscribe_events)
     async_reg(opp, handle_subscribe_trigger)
     async_reg(opp, handle_test_condition)
@@ -94,7 +98,11 @@ def handle_subscribe_events(
             ):
                 return
 
-            connection.send_message(messages.cached_event_message(msg["id"], event))
+            # A newer state of the entity supersedes this one for slow clients
+            connection.send_message(
+                messages.cached_event_message(msg["id"], event),
+                coalesce_key=(msg["id"], event.data["entity_id"]),
+            )
 
     else:
 
@@ -222,25 +230,83 @@ async def handle_call_service(
         )
 
 
+@callback
+def _async_get_allowed_states(
+    opp: OpenPeerPower, connection: ActiveConnection
+) -> list[State]:
+    """Return the states the user of the connection may read."""
+    if connection.user.permissions.access_all_entities("read"):
+        return opp.states.async_all()
+    entity_perm = connection.user.permissions.check_entity
+    return [
+        state
+        for state in opp.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "get_states"})
 def handle_get_states(
     opp: OpenPeerPower, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
-    if connection.user.permissions.access_all_entities("read"):
-        states = opp.states.async_all()
-    else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in opp.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
+    states = _async_get_allowed_states(opp, connection)
 
     connection.send_message(messages.result_message(msg["id"], states))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    opp: OpenPeerPower, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states of the entities, then only what changed.
+    """
+    entity_ids = msg.get("entity_ids")
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Forward the entity changes to websocket."""
+        if not connection.user.permissions.check_entity(
+            event.data["entity_id"], POLICY_READ
+        ):
+            return
+
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    # Listen before taking the states so no change between them is missed
+    connection.subscriptions[msg["id"]] = opp.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, entity_ids or [MATCH_ALL], forward_entity_changes
+    )
+    connection.send_message(messages.result_message(msg["id"]))
+
+    states = _async_get_allowed_states(opp, connection)
+    if entity_ids:
+        wanted = set(entity_ids)
+        states = [state for state in states if state.entity_id in wanted]
+    connection.send_message(
+        messages.message_to_json(
+            messages.event_message(
+                msg["id"],
+                {
+                    messages.ENTITY_EVENT_ADD: {
+                        state.entity_id: messages.compressed_state_dict(state)
+                        for state in states
+                    }
+                },
+            )
+        )
+    )
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
@@ -305,6 +371,21 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/pending_timers"})
+def handle_integration_pending_timers(
+    opp: OpenPeerPower, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle pending timers command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"domain": integration, "timers": timers}
+            for integration, timers in sorted(async_pending_timers(opp).items())
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -314,6 +395,22 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+@decorators.require_admin
+def handle_connection_stats(
+    opp: OpenPeerPower, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle connection stats command."""
+    connection.send_result(
+        msg["id"],
+        [
+            handler.async_get_stats()
+            for handler in opp.data.get(const.DATA_HANDLERS, ())
+        ],
+    )
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "render_template",
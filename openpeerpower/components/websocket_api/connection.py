@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Hashable
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 import voluptuous as vol
 
@@ -24,18 +24,30 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         opp: OpenPeerPower,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[..., None],
         user: User,
         refresh_token: RefreshToken,
+        drain: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.opp = opp
         self.send_message = send_message
+        self._drain = drain
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
+        # Features the client enabled in the auth message
+        self.supported_features: dict[str, Any] = {}
+
+    async def async_drain(self) -> None:
+        """Wait until the client has read most of the pending messages.
+
+        Raises Disconnect if the connection is closed.
+        """
+        if self._drain is not None:
+            await self._drain()
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
@@ -26,6 +26,17 @@ URL: Final = "/api/websocket"
 PENDING_MSG_PEAK: Final = 512
 PENDING_MSG_PEAK_TIME: Final = 5
 MAX_PENDING_MSG: Final = 2048
+# Pending messages below which a draining sender may continue
+PENDING_MSG_DRAINED: Final = 16
+
+# Client feature to receive the pending messages as one JSON array frame
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
+
+CONF_SLOW_CLIENT_POLICY: Final = "slow_client_policy"
+# What to do with clients that stay over PENDING_MSG_PEAK
+SLOW_CLIENT_DISCONNECT: Final = "disconnect"
+# Replace pending state_changed events of an entity by the newer one
+SLOW_CLIENT_COALESCE: Final = "coalesce"
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
@@ -51,5 +62,8 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Handlers of the open connections
+DATA_HANDLERS: Final = f"{DOMAIN}.handlers"
+DATA_SLOW_CLIENT_POLICY: Final = f"{DOMAIN}.slow_client_policy"
 
 JSON_DUMP: Final = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
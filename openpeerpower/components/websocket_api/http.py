@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from contextlib import suppress
 import datetime as dt
 import logging
@@ -20,11 +20,17 @@ from .auth import AuthPhase, auth_required_message
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
+    DATA_SLOW_CLIENT_POLICY,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
+    PENDING_MSG_DRAINED,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
+    SLOW_CLIENT_COALESCE,
+    SLOW_CLIENT_DISCONNECT,
     URL,
 )
 from .error import Disconnect
@@ -61,24 +67,86 @@ class WebSocketHandler:
         self.opp = opp
         self.request = request
         self.wsock: web.WebSocketResponse | None = None
+        # Serialized messages, or (coalesce_key,) for the message kept in
+        # _superseding, None stops the writer
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
+        self._superseding: dict[Hashable, str] = {}
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._closed = False
+        self._coalesce_messages = False
+        self._coalesce_superseded = (
+            opp.data.get(DATA_SLOW_CLIENT_POLICY, SLOW_CLIENT_DISCONNECT)
+            == SLOW_CLIENT_COALESCE
+        )
+        self._user_id: str | None = None
+        self._max_pending = 0
+        self._bytes_sent = 0
+        self._frames_sent = 0
+        self._messages_sent = 0
+        self._dropped = 0
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the statistics of the connection."""
+        return {
+            "connection_id": id(self),
+            "user_id": self._user_id,
+            "coalesce_messages": self._coalesce_messages,
+            "queue_depth": self._to_write.qsize(),
+            "max_queue_depth": self._max_pending,
+            "bytes_sent": self._bytes_sent,
+            "frames_sent": self._frames_sent,
+            "messages_sent": self._messages_sent,
+            "dropped": self._dropped,
+        }
 
     async def _writer(self) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        All pending messages are written together, as one JSON array frame if
+        the client supports it.
+        """
         # Exceptions if Socket disconnected or cancelled by connection handler
         assert self.wsock is not None
+        to_write = self._to_write
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                message = await self._to_write.get()
-                if message is None:
+                pending = [await to_write.get()]
+                while not to_write.empty():
+                    pending.append(to_write.get_nowait())
+                self._drained.set()
+
+                stop = None in pending
+                if stop:
+                    pending = pending[: pending.index(None)]
+                messages = [
+                    message
+                    if isinstance(message, str)
+                    else self._superseding.pop(message[0])
+                    for message in pending
+                ]
+
+                if len(messages) > 1 and self._coalesce_messages:
+                    messages = ["[" + ",".join(messages) + "]"]
+                for message in messages:
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    # JSON_DUMP escapes non-ASCII, so characters are bytes
+                    self._bytes_sent += len(message)
+                    self._frames_sent += 1
+                self._messages_sent += len(pending)
+
+                if stop:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+        # Wake up the senders waiting for the queue to drain
+        self._closed = True
+        self._drained.set()
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
@@ -86,26 +154,49 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | dict[str, Any], coalesce_key: Hashable | None = None
+    ) -> None:
         """Send a message to the client.
 
-        Closes connection if the client is not reading the messages.
+        A message with a coalesce_key replaces the pending message with the
+        same key if the slow client policy coalesces messages. Otherwise
+        closes connection if the client is not reading the messages.
 
         Async friendly.
         """
         if not isinstance(message, str):
             message = message_to_json(message)
 
+        if coalesce_key is not None and self._coalesce_superseded:
+            if coalesce_key in self._superseding:
+                self._superseding[coalesce_key] = message
+                self._dropped += 1
+                return
+            self._superseding[coalesce_key] = message
+            queued: str | tuple[Hashable] = (coalesce_key,)
+        else:
+            queued = message
+
         try:
-            self._to_write.put_nowait(message)
+            self._to_write.put_nowait(queued)
         except asyncio.QueueFull:
+            if coalesce_key is not None:
+                self._superseding.pop(coalesce_key, None)
             self._logger.error(
                 "Client exceeded max pending messages [2]: %s", MAX_PENDING_MSG
             )
 
             self._cancel()
 
-        if self._to_write.qsize() < PENDING_MSG_PEAK:
+        pending = self._to_write.qsize()
+        if pending > self._max_pending:
+            self._max_pending = pending
+
+        if pending > PENDING_MSG_DRAINED:
+            self._drained.clear()
+
+        if pending < PENDING_MSG_PEAK or self._coalesce_superseded:
             if self._peak_checker_unsub:
                 self._peak_checker_unsub()
                 self._peak_checker_unsub = None
@@ -116,6 +207,12 @@ class WebSocketHandler:
                 self.opp, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    async def _async_drain(self) -> None:
+        """Wait until the client has read most of the pending messages."""
+        await self._drained.wait()
+        if self._closed:
+            raise Disconnect
+
     @callback
     def _check_write_peak(self, _utc_time: dt.datetime) -> None:
         """Check that we are no longer above the write peak."""
@@ -160,7 +257,9 @@ class WebSocketHandler:
         # event we do not want to block for websocket responses
         self._writer_task = asyncio.create_task(self._writer())
 
-        auth = AuthPhase(self._logger, self.opp, self._send_message, request)
+        auth = AuthPhase(
+            self._logger, self.opp, self._send_message, request, self._async_drain
+        )
         connection = None
         disconnect_warn = None
 
@@ -190,7 +289,12 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._user_id = connection.user.id
+            self._coalesce_messages = bool(
+                connection.supported_features.get(FEATURE_COALESCE_MESSAGES)
+            )
             self.opp.data[DATA_CONNECTIONS] = self.opp.data.get(DATA_CONNECTIONS, 0) + 1
+            self.opp.data.setdefault(DATA_HANDLERS, set()).add(self)
             self.opp.helpers.dispatcher.async_dispatcher_send(
                 SIGNAL_WEBSOCKET_CONNECTED
             )
@@ -246,6 +350,7 @@ class WebSocketHandler:
 
                 if connection is not None:
                     self.opp.data[DATA_CONNECTIONS] -= 1
+                    self.opp.data[DATA_HANDLERS].discard(self)
                 self.opp.helpers.dispatcher.async_dispatcher_send(
                     SIGNAL_WEBSOCKET_DISCONNECTED
                 )
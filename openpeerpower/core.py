@@ -27,6 +27,7 @@ import yarl
 from openpeerpower import block_async_io, loader, util
 from openpeerpower.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -659,6 +660,13 @@ class EventBus:
     def __init__(self, opp: OpenPeerPower) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[OppJob, Callable | None]]] = {}
+        self._match_all_listeners: list[tuple[OppJob, Callable | None]] = []
+        self._listeners[MATCH_ALL] = self._match_all_listeners
+        # event_type -> key (entity_id or domain) -> filterable jobs
+        self._keyed_listeners: dict[
+            str, dict[str, list[tuple[OppJob, Callable | None]]]
+        ] = {}
+        self._keyed_listener_count: dict[str, int] = {}
         self._opp = opp
 
     @callback
@@ -667,7 +675,23 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key]) for key in self._listeners}
+        listeners = {
+            key: len(self._listeners[key])
+            for key in self._listeners
+            if self._listeners[key]
+        }
+        for event_type, count in self._keyed_listener_count.items():
+            listeners[event_type] = listeners.get(event_type, 0) + count
+        return listeners
+
+    @callback
+    def async_keyed_listeners(self, event_type: str) -> dict[str, int]:
+        """Return dictionary with keys and the number of keyed listeners.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners.get(event_type, {})
+        return {key: len(jobs) for key, jobs in keyed_listeners.items()}
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -704,22 +728,48 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
+        listeners = self._listeners.get(event_type)
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
         # EVENT_OPENPEERPOWER_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_OPENPEERPOWER_CLOSE:
-            listeners = match_all_listeners + listeners
+        match_all_listeners = (
+            self._match_all_listeners
+            if event_type != EVENT_OPENPEERPOWER_CLOSE
+            else None
+        )
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
+        if match_all_listeners:
+            self._async_run_filterable_jobs(event, match_all_listeners)
+
+        if listeners:
+            self._async_run_filterable_jobs(event, listeners)
+
+        if not keyed_listeners or not event_data:
+            return
+
+        # Keyed listeners are routed by the entity_id of the event or by
+        # its domain so listeners that do not care never see the event.
+        entity_id = event_data.get(ATTR_ENTITY_ID)
+        if not isinstance(entity_id, str):
             return
 
-        for job, event_filter in listeners:
+        if (
+            entity_id in keyed_listeners
+            or entity_id.partition(".")[0] in keyed_listeners
+        ):
+            self._opp.loop.call_soon(self._async_dispatch_keyed, event, entity_id)
+
+    @callback
+    def _async_run_filterable_jobs(
+        self, event: Event, filterable_jobs: list[tuple[OppJob, Callable | None]]
+    ) -> None:
+        """Schedule the jobs whose filter accepts the event."""
+        for job, event_filter in filterable_jobs:
             if event_filter is not None:
                 try:
                     if not event_filter(event):
@@ -729,6 +779,42 @@ class EventBus:
                     continue
             self._opp.async_add_opp_job(job, event)
 
+    @callback
+    def _async_dispatch_keyed(self, event: Event, entity_id: str) -> None:
+        """Dispatch an event to the listeners keyed by its entity_id or domain.
+
+        Listeners are resolved when the event is dispatched so a listener
+        added by an earlier event in the same iteration sees later events.
+        """
+        keyed_listeners = self._keyed_listeners.get(event.event_type)
+        if keyed_listeners is None:
+            return
+
+        domain = entity_id.partition(".")[0]
+        entity_jobs = keyed_listeners.get(entity_id)
+        domain_jobs = keyed_listeners.get(domain) if domain != entity_id else None
+
+        if entity_jobs and domain_jobs:
+            # A listener keyed on both the entity_id and its domain
+            # only runs once for the event
+            seen = set(entity_jobs)
+            filterable_jobs = [
+                *entity_jobs,
+                *(job for job in domain_jobs if job not in seen),
+            ]
+        else:
+            filterable_jobs = (entity_jobs or domain_jobs or [])[:]
+
+        for job, event_filter in filterable_jobs:
+            try:
+                if event_filter is not None and not event_filter(event):
+                    continue
+                self._opp.async_run_opp_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing event %s for %s", event, entity_id
+                )
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -769,6 +855,46 @@ class EventBus:
             event_type, (OppJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        keys: Iterable[str],
+        listener: Callable,
+        event_filter: Callable | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type routed by entity_id or domain.
+
+        The listener only runs for events where the ``entity_id`` in the
+        event data or its domain matches one of the keys. Keys must be
+        lowercase. The ``MATCH_ALL`` key matches every event of the type.
+
+        This avoids having every listener (or its event_filter) called for
+        events such as EVENT_STATE_CHANGED that it is not interested in.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback(event_filter):
+            raise OpenPeerPowerError(f"Event filter {event_filter} is not a callback")
+
+        keys = list(dict.fromkeys(keys))
+        if MATCH_ALL in keys:
+            return self.async_listen(event_type, listener, event_filter)
+
+        filterable_job = (OppJob(listener), event_filter)
+        keyed_listeners = self._keyed_listeners.setdefault(event_type, {})
+        for key in keys:
+            keyed_listeners.setdefault(key, []).append(filterable_job)
+        self._keyed_listener_count[event_type] = (
+            self._keyed_listener_count.get(event_type, 0) + 1
+        )
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, keys, filterable_job)
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: tuple[OppJob, Callable | None]
@@ -846,7 +972,7 @@ class EventBus:
             self._listeners[event_type].remove(filterable_job)
 
             # delete event_type list if empty
-            if not self._listeners[event_type]:
+            if not self._listeners[event_type] and event_type != MATCH_ALL:
                 self._listeners.pop(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
@@ -855,6 +981,34 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        keys: list[str],
+        filterable_job: tuple[OppJob, Callable | None],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            for key in keys:
+                keyed_listeners[key].remove(filterable_job)
+                if not keyed_listeners[key]:
+                    del keyed_listeners[key]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        self._keyed_listener_count[event_type] -= 1
+        if not self._keyed_listener_count[event_type]:
+            del self._keyed_listener_count[event_type]
+            del self._keyed_listeners[event_type]
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1190,6 +1344,47 @@ class StateMachine:
         If you just update the attributes and not the state, last changed will
         not be affected.
 
+        This method must be run in the event loop.
+        """
+        self._async_set(entity_id, new_state, attributes, force_update, context, None)
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of many entities at once.
+
+        States is an iterable of (entity_id, state, attributes) tuples. All
+        states in the batch share one timestamp and one context and a
+        state_changed event is fired for every entity that changed.
+
+        This method must be run in the event loop.
+        """
+        if context is None:
+            context = Context()
+
+        now = dt_util.utcnow()
+
+        for entity_id, new_state, attributes in states:
+            self._async_set(
+                entity_id, new_state, attributes, force_update, context, now
+            )
+
+    @callback
+    def _async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        now: datetime.datetime | None,
+    ) -> None:
+        """Set the state of an entity.
+
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
@@ -1211,7 +1406,8 @@ class StateMachine:
         if context is None:
             context = Context()
 
-        now = dt_util.utcnow()
+        if now is None:
+            now = dt_util.utcnow()
 
         state = State(
             entity_id,
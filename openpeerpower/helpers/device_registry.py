@@ -157,6 +157,9 @@ class DeviceRegistry:
     deleted_devices: dict[str, DeletedDeviceEntry]
     _registered_index: _DeviceIndex
     _deleted_index: _DeviceIndex
+    # Ids of the registered devices by area and config entry
+    _area_index: dict[str, dict[str, None]]
+    _config_entry_index: dict[str, dict[str, None]]
 
     def __init__(self, opp: OpenPeerPower) -> None:
         """Initialize the device registry."""
@@ -204,6 +207,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices[device.id] = device
+            self._add_secondary_index(device)
 
         _add_device_to_index(devices_index, device)
 
@@ -215,6 +219,7 @@ class DeviceRegistry:
         else:
             devices_index = self._registered_index
             self.devices.pop(device.id)
+            self._remove_secondary_index(device)
 
         _remove_device_from_index(devices_index, device)
 
@@ -226,16 +231,48 @@ class DeviceRegistry:
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
 
+        # Devices keep their position if they stay in an area or config entry
+        if old_device.area_id != new_device.area_id:
+            if old_device.area_id is not None:
+                _remove_from_index(self._area_index, old_device.area_id, old_device.id)
+            if new_device.area_id is not None:
+                self._area_index.setdefault(new_device.area_id, {})[
+                    new_device.id
+                ] = None
+        for config_entry_id in old_device.config_entries - new_device.config_entries:
+            _remove_from_index(self._config_entry_index, config_entry_id, old_device.id)
+        for config_entry_id in new_device.config_entries - old_device.config_entries:
+            self._config_entry_index.setdefault(config_entry_id, {})[
+                new_device.id
+            ] = None
+
+    def _add_secondary_index(self, device: DeviceEntry) -> None:
+        """Add a registered device to the area and config entry indexes."""
+        if device.area_id is not None:
+            self._area_index.setdefault(device.area_id, {})[device.id] = None
+        for config_entry_id in device.config_entries:
+            self._config_entry_index.setdefault(config_entry_id, {})[device.id] = None
+
+    def _remove_secondary_index(self, device: DeviceEntry) -> None:
+        """Remove a registered device from the area and config entry indexes."""
+        if device.area_id is not None:
+            _remove_from_index(self._area_index, device.area_id, device.id)
+        for config_entry_id in device.config_entries:
+            _remove_from_index(self._config_entry_index, config_entry_id, device.id)
+
     def _clear_index(self) -> None:
         """Clear the index."""
         self._registered_index = _DeviceIndex(identifiers={}, connections={})
         self._deleted_index = _DeviceIndex(identifiers={}, connections={})
+        self._area_index = {}
+        self._config_entry_index = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._registered_index, device)
+            self._add_secondary_index(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._deleted_index, deleted_device)
 
@@ -574,8 +611,8 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
+        for device_id in list(self._config_entry_index.get(config_entry_id, ())):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
             if config_entry_id not in config_entries:
@@ -615,9 +652,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._area_index.get(area_id, ())):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -645,7 +681,11 @@ async def async_get_registry(opp: OpenPeerPower) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    return [
+        registry.devices[device_id]
+        for device_id in registry._area_index.get(area_id, ())
+    ]
 
 
 @callback
@@ -653,10 +693,10 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
+    # pylint: disable=protected-access
     return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
+        registry.devices[device_id]
+        for device_id in registry._config_entry_index.get(config_entry_id, ())
     ]
 
 
@@ -783,6 +823,14 @@ def _normalize_connections(connections: set[tuple[str, str]]) -> set[tuple[str,
     }
 
 
+def _remove_from_index(index: dict[str, dict[str, None]], key: str, item: str) -> None:
+    """Remove an item from the items of a key of an index."""
+    items = index[key]
+    del items[item]
+    if not items:
+        del index[key]
+
+
 def _add_device_to_index(
     devices_index: _DeviceIndex,
     device: DeviceEntry | DeletedDeviceEntry,
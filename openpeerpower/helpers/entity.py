@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import ABC
 import asyncio
-from collections.abc import Awaitable, Iterable, Mapping
+from collections.abc import Awaitable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import functools as ft
 import logging
@@ -29,7 +30,13 @@ from openpeerpower.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from openpeerpower.core import CALLBACK_TYPE, Context, OpenPeerPower, callback
+from openpeerpower.core import (
+    CALLBACK_TYPE,
+    Context,
+    OpenPeerPower,
+    callback,
+    valid_state,
+)
 from openpeerpower.exceptions import NoEntitySpecifiedError, OpenPeerPowerError
 from openpeerpower.helpers import entity_registry as er
 from openpeerpower.helpers.entity_platform import EntityPlatform
@@ -42,6 +49,7 @@ from openpeerpower.util import dt as dt_util, ensure_unique_string, slugify
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_STATE_WRITE_BATCH = "entity_state_write_batch"
 SOURCE_CONFIG_ENTRY = "config_entry"
 SOURCE_PLATFORM_CONFIG = "platform_config"
 
@@ -57,6 +65,27 @@ def entity_sources(opp: OpenPeerPower) -> dict[str, dict[str, str]]:
     return opp.data.get(DATA_ENTITY_SOURCE, {})
 
 
+@contextmanager
+def async_batch_state_writes(opp: OpenPeerPower) -> Iterator[None]:
+    """Write the states of the entities updated in the block in one batch.
+
+    The block must not yield to the event loop. Entities with their own
+    context or force_update are still written immediately.
+    """
+    if DATA_STATE_WRITE_BATCH in opp.data:
+        yield
+        return
+
+    batch: list[tuple[str, str, dict[str, Any]]] = []
+    opp.data[DATA_STATE_WRITE_BATCH] = batch
+    try:
+        yield
+    finally:
+        del opp.data[DATA_STATE_WRITE_BATCH]
+        if batch:
+            opp.states.async_set_many(batch)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -383,6 +412,42 @@ class Entity(ABC):
     @callback
     def _async_write_op_state(self) -> None:
         """Write the state to the state machine."""
+        calculated_state = self._async_calculate_state()
+        if calculated_state is None:
+            return
+
+        self._async_expire_context()
+
+        batch = self.opp.data.get(DATA_STATE_WRITE_BATCH)
+        if (
+            batch is not None
+            and self._context is None
+            and not self.force_update
+            and valid_state(calculated_state[0])
+        ):
+            batch.append((self.entity_id, *calculated_state))
+            return
+
+        self.opp.states.async_set(
+            self.entity_id, *calculated_state, self.force_update, self._context
+        )
+
+    @callback
+    def _async_expire_context(self) -> None:
+        """Forget the context once it is no longer recent."""
+        if (
+            self._context_set is not None
+            and dt_util.utcnow() - self._context_set > self.context_recent_time
+        ):
+            self._context = None
+            self._context_set = None
+
+    @callback
+    def _async_calculate_state(self) -> tuple[str, dict[str, Any]] | None:
+        """Calculate the state and attributes to write to the state machine.
+
+        Returns None if the entity is disabled and must not be written.
+        """
         if self.registry_entry and self.registry_entry.disabled_by:
             if not self._disabled_reported:
                 self._disabled_reported = True
@@ -392,7 +457,7 @@ class Entity(ABC):
                     self.entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         start = timer()
 
@@ -484,16 +549,7 @@ class Entity(ABC):
             # Could not convert state to float
             pass
 
-        if (
-            self._context_set is not None
-            and dt_util.utcnow() - self._context_set > self.context_recent_time
-        ):
-            self._context = None
-            self._context_set = None
-
-        self.opp.states.async_set(
-            self.entity_id, state, attr, self.force_update, self._context
-        )
+        return state, attr
 
     def schedule_update_op_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -608,11 +664,16 @@ class Entity(ABC):
         self.parallel_updates = None
         self._added = False
 
-    async def add_to_platform_finish(self) -> None:
-        """Finish adding an entity to a platform."""
+    async def add_to_platform_finish(self, write_state: bool = True) -> None:
+        """Finish adding an entity to a platform.
+
+        If write_state is False the caller is responsible for writing the
+        state, which allows an entity platform to batch the writes.
+        """
         await self.async_internal_added_to_opp()
         await self.async_added_to_opp()
-        self.async_write_op_state()
+        if write_state:
+            self.async_write_op_state()
 
     async def async_remove(self, *, force_remove: bool = False) -> None:
         """Remove entity from Open Peer Power.
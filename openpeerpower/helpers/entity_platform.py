@@ -27,6 +27,7 @@ from openpeerpower.core import (
     callback,
     split_entity_id,
     valid_entity_id,
+    valid_state,
 )
 from openpeerpower.exceptions import (
     OpenPeerPowerError,
@@ -104,6 +105,8 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Entities that were added and are waiting for their state to be written
+        self._pending_state_writes: list[Entity] = []
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -381,6 +384,7 @@ class EntityPlatform:
         try:
             async with self.opp.timeout.async_timeout(timeout, self.domain):
                 await asyncio.gather(*tasks)
+            self._async_write_pending_states()
         except asyncio.TimeoutError:
             self.logger.warning(
                 "Timed out adding entities for domain %s with platform %s after %ds",
@@ -583,7 +587,66 @@ class EntityPlatform:
 
         entity.async_on_remove(remove_entity_cb)
 
-        await entity.add_to_platform_finish()
+        await entity.add_to_platform_finish(write_state=False)
+        self._async_schedule_state_write(entity)
+
+    @callback
+    def _async_schedule_state_write(self, entity: Entity) -> None:
+        """Schedule writing the state of an entity that was just added.
+
+        Entities that finish being added in the same event loop iteration
+        are written to the state machine in one batch.
+        """
+        if not self._pending_state_writes:
+            self.opp.loop.call_soon(self._async_write_pending_states)
+        self._pending_state_writes.append(entity)
+
+    @callback
+    def _async_write_pending_states(self) -> None:
+        """Write the states of the added entities in one batch."""
+        entities = self._pending_state_writes
+        if not entities:
+            return
+        self._pending_state_writes = []
+
+        batch: list[tuple[str, str, dict[str, Any]]] = []
+        for entity in entities:
+            # The entity was removed before its state was written
+            if self.entities.get(entity.entity_id) is not entity:
+                continue
+
+            # Entities with their own context or force_update are not batched
+            # pylint: disable=protected-access
+            if entity._context is not None or entity.force_update:
+                self._async_write_state(entity)
+                continue
+
+            try:
+                calculated_state = entity._async_calculate_state()
+            except Exception:  # pylint: disable=broad-except
+                calculated_state = None
+            else:
+                if calculated_state is None:
+                    continue
+
+            # An invalid entity is written on its own so it does not prevent
+            # the rest of the batch from being written
+            if calculated_state is None or not valid_state(calculated_state[0]):
+                self._async_write_state(entity)
+                continue
+
+            batch.append((entity.entity_id, *calculated_state))
+
+        if batch:
+            self.opp.states.async_set_many(batch)
+
+    @callback
+    def _async_write_state(self, entity: Entity) -> None:
+        """Write the state of a single added entity."""
+        try:
+            entity.async_write_op_state()
+        except Exception:  # pylint: disable=broad-except
+            self.logger.exception("Error writing state of %s", entity.entity_id)
 
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
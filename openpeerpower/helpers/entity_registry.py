@@ -12,6 +12,7 @@ from __future__ import annotations
 from collections import OrderedDict
 from collections.abc import Iterable, Mapping
 import logging
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 import attr
@@ -154,7 +155,17 @@ class EntityRegistry:
         self.opp = opp
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = opp.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # Entity ids by device, area and config entry, in insertion order
+        self._device_index: dict[str, dict[str, None]] = {}
+        self._area_index: dict[str, dict[str, None]] = {}
+        self._config_entry_index: dict[str, dict[str, None]] = {}
+        self._store = opp.helpers.storage.CollectionStore(
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            collection="entities",
+            item_id=itemgetter("entity_id"),
+            item_to_dict=_entry_to_dict,
+        )
         self.opp.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -307,7 +318,7 @@ class EntityRegistry:
         )
         self._register_entry(entity)
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
-        self.async_schedule_save()
+        self.async_schedule_save(entity_id)
 
         self.opp.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "create", "entity_id": entity_id}
@@ -322,7 +333,7 @@ class EntityRegistry:
         self.opp.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "remove", "entity_id": entity_id}
         )
-        self.async_schedule_save()
+        self.async_schedule_save(entity_id)
 
     @callback
     def async_device_modified(self, event: Event) -> None:
@@ -464,11 +475,14 @@ class EntityRegistry:
         if not new_values:
             return old
 
-        self._remove_index(old)
         new = attr.evolve(old, **new_values)
-        self._register_entry(new)
+        self.entities[entity_id] = new
+        self._update_index(old, new)
 
-        self.async_schedule_save()
+        if old.entity_id != entity_id:
+            self.async_schedule_save(old.entity_id, entity_id)
+        else:
+            self.async_schedule_save(entity_id)
 
         data = {"action": "update", "entity_id": entity_id, "changes": old_values}
 
@@ -521,54 +535,30 @@ class EntityRegistry:
         self._rebuild_index()
 
     @callback
-    def async_schedule_save(self) -> None:
-        """Schedule saving the entity registry."""
-        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
-
-    @callback
-    def _data_to_save(self) -> dict[str, Any]:
-        """Return data of entity registry to store in a file."""
-        data = {}
-
-        data["entities"] = [
-            {
-                "entity_id": entry.entity_id,
-                "config_entry_id": entry.config_entry_id,
-                "device_id": entry.device_id,
-                "area_id": entry.area_id,
-                "unique_id": entry.unique_id,
-                "platform": entry.platform,
-                "name": entry.name,
-                "icon": entry.icon,
-                "disabled_by": entry.disabled_by,
-                "capabilities": entry.capabilities,
-                "supported_features": entry.supported_features,
-                "device_class": entry.device_class,
-                "unit_of_measurement": entry.unit_of_measurement,
-                "original_name": entry.original_name,
-                "original_icon": entry.original_icon,
-            }
-            for entry in self.entities.values()
-        ]
+    def async_schedule_save(self, *entity_ids: str) -> None:
+        """Schedule saving the entity registry.
 
-        return data
+        If the ids of the changed entities are given, only their changes are
+        journaled.
+        """
+        self._store.async_delay_save_items(
+            lambda: list(self.entities.values()),
+            [(entity_id, self.entities.get(entity_id)) for entity_id in entity_ids]
+            or None,
+            SAVE_DELAY,
+        )
 
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._area_index.get(area_id, ())):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -576,6 +566,8 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, key in self._secondary_keys(entry):
+            index.setdefault(key, {})[entry.entity_id] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -583,13 +575,73 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, key in self._secondary_keys(entry):
+            _remove_from_index(index, key, entry.entity_id)
+
+    def _update_index(self, old: RegistryEntry, new: RegistryEntry) -> None:
+        """Update the indexes, entries keep their position if the key is unchanged."""
+        del self._index[(old.domain, old.platform, old.unique_id)]
+        self._index[(new.domain, new.platform, new.unique_id)] = new.entity_id
+        old_keys = self._secondary_keys(old)
+        new_keys = self._secondary_keys(new)
+        if old.entity_id == new.entity_id and old_keys == new_keys:
+            return
+        for index, key in old_keys:
+            _remove_from_index(index, key, old.entity_id)
+        for index, key in new_keys:
+            index.setdefault(key, {})[new.entity_id] = None
+
+    def _secondary_keys(
+        self, entry: RegistryEntry
+    ) -> list[tuple[dict[str, dict[str, None]], str]]:
+        """Return the secondary indexes of an entry with its key."""
+        keys = []
+        if entry.device_id is not None:
+            keys.append((self._device_index, entry.device_id))
+        if entry.area_id is not None:
+            keys.append((self._area_index, entry.area_id))
+        if entry.config_entry_id is not None:
+            keys.append((self._config_entry_index, entry.config_entry_id))
+        return keys
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._area_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
 
+def _remove_from_index(index: dict[str, dict[str, None]], key: str, item: str) -> None:
+    """Remove an item from the items of a key of an index."""
+    items = index[key]
+    del items[item]
+    if not items:
+        del index[key]
+
+
+def _entry_to_dict(entry: RegistryEntry) -> dict[str, Any]:
+    """Return the data of an entry to store in a file."""
+    return {
+        "entity_id": entry.entity_id,
+        "config_entry_id": entry.config_entry_id,
+        "device_id": entry.device_id,
+        "area_id": entry.area_id,
+        "unique_id": entry.unique_id,
+        "platform": entry.platform,
+        "name": entry.name,
+        "icon": entry.icon,
+        "disabled_by": entry.disabled_by,
+        "capabilities": entry.capabilities,
+        "supported_features": entry.supported_features,
+        "device_class": entry.device_class,
+        "unit_of_measurement": entry.unit_of_measurement,
+        "original_name": entry.original_name,
+        "original_icon": entry.original_icon,
+    }
+
+
 @callback
 def async_get(opp: OpenPeerPower) -> EntityRegistry:
     """Get entity registry."""
@@ -617,12 +669,14 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+    # pylint: disable=protected-access
+    entries = [
+        registry.entities[entity_id]
+        for entity_id in registry._device_index.get(device_id, ())
     ]
+    if include_disabled_entities:
+        return entries
+    return [entry for entry in entries if not entry.disabled_by]
 
 
 @callback
@@ -630,7 +684,11 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    # pylint: disable=protected-access
+    return [
+        registry.entities[entity_id]
+        for entity_id in registry._area_index.get(area_id, ())
+    ]
 
 
 @callback
@@ -638,10 +696,10 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
+    # pylint: disable=protected-access
     return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
+        registry.entities[entity_id]
+        for entity_id in registry._config_entry_index.get(config_entry_id, ())
     ]
 
 
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from collections.abc import Awaitable, Iterable
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
+import itertools
 import logging
 import time
 from typing import Any, Callable, List, cast
@@ -30,7 +33,6 @@ from openpeerpower.core import (
     OppJob,
     State,
     callback,
-    split_entity_id,
 )
 from openpeerpower.exceptions import TemplateError
 from openpeerpower.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
@@ -42,18 +44,15 @@ from openpeerpower.loader import bind_opp
 from openpeerpower.util import dt as dt_util
 from openpeerpower.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
-TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
-TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
-
-TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
-TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
-
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TIMER_SCHEDULER = "event_timer_scheduler"
+TEMPLATE_RENDER_QUEUE = "event_template_render_queue"
+
+# Number of templates the render counts are kept for
+_RENDER_COUNTS_SIZE = 1000
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -242,62 +241,15 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    for each one, the listener is registered on the
+    event bus keyed by entity id so events are routed
+    with a fast dict lookup.
     """
     entity_ids = _async_string_to_lower_list(entity_ids)
     if not entity_ids:
         return _remove_empty_listener
 
-    entity_callbacks = opp.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in opp.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    opp.async_run_opp_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        opp.data[TRACK_STATE_CHANGE_LISTENER] = opp.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = OppJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            opp,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
-
-    return remove_listener
+    return opp.bus.async_listen_keyed(EVENT_STATE_CHANGED, entity_ids, action)
 
 
 @callback
@@ -393,23 +345,15 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    opp: OpenPeerPower, event: Event, callbacks: dict[str, list]
-) -> None:
-    domain = split_entity_id(event.data["entity_id"])[0]
-
-    if domain not in callbacks and MATCH_ALL not in callbacks:
-        return
+def _async_state_added_filter(event: Event) -> bool:
+    """Filter state changes where an entity is added."""
+    return event.data.get("old_state") is None
 
-    listeners = callbacks.get(domain, []) + callbacks.get(MATCH_ALL, [])
 
-    for job in listeners:
-        try:
-            opp.async_run_opp_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
+@callback
+def _async_state_removed_filter(event: Event) -> bool:
+    """Filter state changes where an entity is removed."""
+    return event.data.get("new_state") is None
 
 
 @bind_opp
@@ -423,46 +367,9 @@ def async_track_state_added_domain(
     if not domains:
         return _remove_empty_listener
 
-    domain_callbacks = opp.data.setdefault(TRACK_STATE_ADDED_DOMAIN_CALLBACKS, {})
-
-    if TRACK_STATE_ADDED_DOMAIN_LISTENER not in opp.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("old_state") is None
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            if event.data.get("old_state") is not None:
-                return
-
-            _async_dispatch_domain_event(opp, event, domain_callbacks)
-
-        opp.data[TRACK_STATE_ADDED_DOMAIN_LISTENER] = opp.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = OppJob(action)
-
-    for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            opp,
-            TRACK_STATE_ADDED_DOMAIN_CALLBACKS,
-            TRACK_STATE_ADDED_DOMAIN_LISTENER,
-            domains,
-            job,
-        )
-
-    return remove_listener
+    return opp.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, domains, action, event_filter=_async_state_added_filter
+    )
 
 
 @bind_opp
@@ -476,46 +383,12 @@ def async_track_state_removed_domain(
     if not domains:
         return _remove_empty_listener
 
-    domain_callbacks = opp.data.setdefault(TRACK_STATE_REMOVED_DOMAIN_CALLBACKS, {})
-
-    if TRACK_STATE_REMOVED_DOMAIN_LISTENER not in opp.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("new_state") is None
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            if event.data.get("new_state") is not None:
-                return
-
-            _async_dispatch_domain_event(opp, event, domain_callbacks)
-
-        opp.data[TRACK_STATE_REMOVED_DOMAIN_LISTENER] = opp.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = OppJob(action)
-
-    for domain in domains:
-        domain_callbacks.setdefault(domain, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            opp,
-            TRACK_STATE_REMOVED_DOMAIN_CALLBACKS,
-            TRACK_STATE_REMOVED_DOMAIN_LISTENER,
-            domains,
-            job,
-        )
-
-    return remove_listener
+    return opp.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        domains,
+        action,
+        event_filter=_async_state_removed_filter,
+    )
 
 
 @callback
@@ -810,7 +683,9 @@ class _TrackTemplateResultInfo:
                 )
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.opp, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.opp,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_schedule_refresh,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -863,6 +738,7 @@ class _TrackTemplateResultInfo:
         """Cancel the listener."""
         assert self._track_state_changes
         self._track_state_changes.async_remove()
+        _async_get_render_queue(self.opp).async_cancel(self)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -872,11 +748,23 @@ class _TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_schedule_refresh(self, event: Event) -> None:
+        """Queue the templates the state change event affects for a refresh."""
+        triggered = [
+            track_template_
+            for track_template_ in self._track_templates
+            if _event_triggers_rerender(event, self._info[track_template_.template])
+        ]
+        if triggered:
+            _async_get_render_queue(self.opp).async_schedule(self, event, triggered)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
         now: datetime,
         event: Event | None,
+        triggered: bool = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -893,7 +781,7 @@ class _TrackTemplateResultInfo:
         if event:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
+            if not triggered and not _event_triggers_rerender(event, info):
                 return False
 
             had_timer = self._rate_limit.async_has_timer(template)
@@ -916,9 +804,9 @@ class _TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        self._info[template] = info = _async_get_render_queue(
+            self.opp
+        ).async_render_to_info(template, track_template_.variables)
 
         try:
             result: str | TemplateError = info.result()
@@ -942,6 +830,7 @@ class _TrackTemplateResultInfo:
         event: Event | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        triggered: bool = False,
     ) -> None:
         """Refresh the template.
 
@@ -954,13 +843,17 @@ class _TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        triggered is True if the event is known to affect the templates.
         """
         updates = []
         info_changed = False
         now = event.time_fired if not replayed and event else dt_util.utcnow()
 
         for track_template_ in track_templates or self._track_templates:
-            update = self._render_template_if_ready(track_template_, now, event)
+            update = self._render_template_if_ready(
+                track_template_, now, event, triggered
+            )
             if not update:
                 continue
 
@@ -999,6 +892,126 @@ class _TrackTemplateResultInfo:
         self.opp.async_run_opp_job(self._job, event, updates)
 
 
+class _TemplateRenderQueue:
+    """Re-render the templates affected by state changes once per loop tick.
+
+    State change events only queue the affected templates of a tracker. The
+    queue is processed in a task, so a template affected by several state
+    changes in the same loop iteration renders once, and identical templates
+    without variables render once for all trackers.
+    """
+
+    def __init__(self, opp: OpenPeerPower) -> None:
+        """Initialize the queue."""
+        self.opp = opp
+        # Queued templates of the trackers with the event that triggered
+        # them, by id of the track template
+        self._queued: dict[
+            _TrackTemplateResultInfo, dict[int, tuple[TrackTemplate, Event]]
+        ] = {}
+        self._task: asyncio.Task | None = None
+        # Renders shared by identical templates while the queue is processed
+        self._renders: dict[tuple[str, bool | None, bool | None], RenderInfo] | None
+        self._renders = None
+        self.render_counts: Counter[str] = Counter()
+
+    @callback
+    def async_schedule(
+        self,
+        tracker: _TrackTemplateResultInfo,
+        event: Event,
+        track_templates: Iterable[TrackTemplate],
+    ) -> None:
+        """Queue templates of a tracker to re-render for an event."""
+        # pylint: disable=protected-access
+        queued = self._queued.setdefault(tracker, {})
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        for track_template_ in track_templates:
+            # Keep an event of an entity the template references, those
+            # are not rate limited
+            if id(track_template_) not in queued or (
+                entity_id in tracker._info[track_template_.template].entities
+            ):
+                queued[id(track_template_)] = (track_template_, event)
+
+        if self._task is None:
+            self._task = self.opp.async_create_task(self._async_process())
+
+    @callback
+    def async_cancel(self, tracker: _TrackTemplateResultInfo) -> None:
+        """Remove the queued templates of a tracker."""
+        self._queued.pop(tracker, None)
+
+    async def _async_process(self) -> None:
+        """Re-render the queued templates."""
+        self._task = None
+        queued, self._queued = self._queued, {}
+        self._renders = {}
+        try:
+            for tracker, track_templates in queued.items():
+                # Templates triggered by the same event refresh together
+                by_event: dict[int, tuple[Event, list[TrackTemplate]]] = {}
+                for track_template_, event in track_templates.values():
+                    by_event.setdefault(id(event), (event, []))[1].append(
+                        track_template_
+                    )
+                for event, event_track_templates in by_event.values():
+                    # pylint: disable=protected-access
+                    tracker._refresh(
+                        event, track_templates=event_track_templates, triggered=True
+                    )
+        finally:
+            self._renders = None
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, variables: TemplateVarsType
+    ) -> RenderInfo:
+        """Render a template, sharing the render of identical templates."""
+        # pylint: disable=protected-access
+        if variables or self._renders is None:
+            info = None
+        else:
+            key = (template.template, template._limited, template._strict)
+            info = self._renders.get(key)
+
+        if info is not None:
+            info = copy.copy(info)
+            info.template = template
+            return info
+
+        info = template.async_render_to_info(variables)
+        if self._renders is not None and not variables:
+            self._renders[
+                (template.template, template._limited, template._strict)
+            ] = info
+
+        self.render_counts[template.template] += 1
+        if len(self.render_counts) > _RENDER_COUNTS_SIZE:
+            self.render_counts = Counter(
+                dict(self.render_counts.most_common(_RENDER_COUNTS_SIZE // 2))
+            )
+        return info
+
+
+@callback
+def _async_get_render_queue(opp: OpenPeerPower) -> _TemplateRenderQueue:
+    """Return the template render queue."""
+    queue: _TemplateRenderQueue | None = opp.data.get(TEMPLATE_RENDER_QUEUE)
+    if queue is None:
+        queue = opp.data[TEMPLATE_RENDER_QUEUE] = _TemplateRenderQueue(opp)
+    return queue
+
+
+@callback
+@bind_opp
+def async_get_hot_templates(
+    opp: OpenPeerPower, limit: int = 10
+) -> list[tuple[str, int]]:
+    """Return the templates re-rendered the most by trackers with their count."""
+    return _async_get_render_queue(opp).render_counts.most_common(limit)
+
+
 TrackTemplateResultListener = Callable[
     [
         Event,
@@ -1158,51 +1171,217 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
-@callback
-@bind_opp
-def async_track_point_in_utc_time(
-    opp: OpenPeerPower,
-    action: OppJob | Callable[..., Awaitable[None] | None],
-    point_in_time: datetime,
-) -> CALLBACK_TYPE:
-    """Add a listener that fires once after a specific point in UTC time."""
-    # Ensure point_in_time is UTC
-    utc_point_in_time = dt_util.as_utc(point_in_time)
+class _ScheduledTimer:
+    """A point in time tracked by the timer scheduler."""
 
-    # Since this is called once, we accept a OppJob so we can avoid
-    # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+    __slots__ = ("point_in_time", "when", "job", "interval", "cancelled", "in_heap")
+
+    def __init__(
+        self,
+        point_in_time: datetime,
+        job: OppJob,
+        interval: timedelta | None = None,
+    ) -> None:
+        """Initialize the timer."""
+        self.point_in_time = point_in_time
+        self.when = point_in_time.timestamp()
+        self.job = job
+        self.interval = interval
+        self.cancelled = False
+        self.in_heap = False
+
+
+class _TimerScheduler:
+    """Run all timers of the event helpers from a single loop handle.
+
+    Timers are kept in a heap ordered by their timestamp and the loop handle
+    is armed for the earliest one. Cancelling a timer only marks it, the heap
+    is compacted once most of it has been cancelled.
+    """
+
+    def __init__(self, opp: OpenPeerPower) -> None:
+        """Initialize the scheduler."""
+        self._opp = opp
+        self._heap: list[tuple[float, int, _ScheduledTimer]] = []
+        self._counter = itertools.count()
+        self._timers: set[_ScheduledTimer] = set()
+        self._cancelled = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._handle_when: float | None = None
+        self._firing = False
 
     @callback
-    def run_action(job: OppJob) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
+    def async_add(self, timer: _ScheduledTimer) -> None:
+        """Schedule a timer."""
+        self._timers.add(timer)
+        self._async_push(timer)
 
-        now = time_tracker_utcnow()
+    @callback
+    def _async_push(self, timer: _ScheduledTimer) -> None:
+        """Add a timer to the heap and arm the handle if it is the earliest."""
+        heapq.heappush(self._heap, (timer.when, next(self._counter), timer))
+        timer.in_heap = True
+        if not self._firing and (
+            self._handle_when is None or timer.when < self._handle_when
+        ):
+            self._async_arm(timer.when, time.time())
+
+    @callback
+    def async_cancel(self, timer: _ScheduledTimer) -> None:
+        """Cancel a timer."""
+        if timer.cancelled or timer not in self._timers:
+            return
+        timer.cancelled = True
+        self._timers.remove(timer)
+        if not self._timers:
+            self._heap.clear()
+            self._cancelled = 0
+            if not self._firing:
+                self._async_disarm()
+            return
+        # A timer that is being fired has already been popped from the heap
+        if not timer.in_heap:
+            return
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._heap[:] = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    @callback
+    def async_pending_by_integration(self) -> dict[str, int]:
+        """Return the number of pending timers per integration."""
+        pending: dict[str, int] = {}
+        for timer in self._timers:
+            integration = _integration_of_job(timer.job)
+            pending[integration] = pending.get(integration, 0) + 1
+        return pending
+
+    @callback
+    def _async_arm(self, when: float, now: float) -> None:
+        """Arm the loop handle for a timestamp."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_when = when
+        self._handle = self._opp.loop.call_later(when - now, self._async_fire)
+
+    @callback
+    def _async_disarm(self) -> None:
+        """Cancel the loop handle."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._handle_when = None
+
+    @callback
+    def _async_fire(self) -> None:
+        """Run the timers that are due."""
+        self._handle = self._handle_when = None
+        heap = self._heap
+        now = time_tracker_utcnow().timestamp()
+
+        due = []
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            timer.in_heap = False
+            if timer.cancelled:
+                self._cancelled -= 1
+                continue
+            due.append(timer)
+
+        self._firing = True
+        try:
+            for timer in due:
+                # An earlier timer may have cancelled this one
+                if timer.cancelled:
+                    continue
+                point_in_time = timer.point_in_time
+                if timer.interval is None:
+                    timer.cancelled = True
+                    self._timers.remove(timer)
+                else:
+                    timer.point_in_time = dt_util.utcnow() + timer.interval
+                    timer.when = timer.point_in_time.timestamp()
+                    self._async_push(timer)
+                try:
+                    self._opp.async_run_opp_job(timer.job, point_in_time)
+                except Exception as err:  # pylint: disable=broad-except
+                    self._opp.loop.call_exception_handler(
+                        {
+                            "message": f"Exception in timer callback {timer.job}",
+                            "exception": err,
+                        }
+                    )
+        finally:
+            self._firing = False
 
         # Depending on the available clock support (including timer hardware
         # and the OS kernel) it can happen that we fire a little bit too early
         # as measured by utcnow(). That is bad when callbacks have assumptions
         # about the current time. Thus, we rearm the timer for the remaining
         # time.
-        delta = (utc_point_in_time - now).total_seconds()
-        if delta > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
-
-            cancel_callback = opp.loop.call_later(delta, run_action, job)
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)[2].in_heap = False
+            self._cancelled -= 1
+        if not heap:
             return
+        if not due:
+            _LOGGER.debug("Called %f seconds too early, rearming", heap[0][0] - now)
+            self._async_arm(heap[0][0], now)
+        else:
+            self._async_arm(heap[0][0], time.time())
+
+
+def _integration_of_job(job: OppJob) -> str:
+    """Return the integration a job belongs to from its module."""
+    target = job.target
+    while isinstance(target, ft.partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or "unknown"
+    parts = module.split(".")
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    if parts[:2] == ["openpeerpower", "components"] and len(parts) > 2:
+        return parts[2]
+    if parts[0] == "openpeerpower":
+        return "openpeerpower"
+    return module
+
+
+@callback
+def _async_get_timer_scheduler(opp: OpenPeerPower) -> _TimerScheduler:
+    """Return the timer scheduler of an instance."""
+    scheduler: _TimerScheduler | None = opp.data.get(TIMER_SCHEDULER)
+    if scheduler is None:
+        scheduler = opp.data[TIMER_SCHEDULER] = _TimerScheduler(opp)
+    return scheduler
+
+
+@callback
+def async_pending_timers(opp: OpenPeerPower) -> dict[str, int]:
+    """Return the number of pending timers per integration."""
+    return _async_get_timer_scheduler(opp).async_pending_by_integration()
 
-        opp.async_run_opp_job(job, utc_point_in_time)
 
+@callback
+@bind_opp
+def async_track_point_in_utc_time(
+    opp: OpenPeerPower,
+    action: OppJob | Callable[..., Awaitable[None] | None],
+    point_in_time: datetime,
+) -> CALLBACK_TYPE:
+    """Add a listener that fires once after a specific point in UTC time."""
+    # Since this is called once, we accept a OppJob so we can avoid
+    # having to figure out how to call the action every time its called.
     job = action if isinstance(action, OppJob) else OppJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = opp.loop.call_later(delta, run_action, job)
+    scheduler = _async_get_timer_scheduler(opp)
+    # Ensure point_in_time is UTC
+    timer = _ScheduledTimer(dt_util.as_utc(point_in_time), job)
+    scheduler.async_add(timer)
 
     @callback
     def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+        """Cancel the timer."""
+        scheduler.async_cancel(timer)
 
     return unsub_point_in_time_listener
 
@@ -1234,32 +1413,13 @@ def async_track_time_interval(
     interval: timedelta,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval."""
-    remove = None
-    interval_listener_job = None
-
-    job = OppJob(action)
-
-    def next_interval() -> datetime:
-        """Return the next interval."""
-        return dt_util.utcnow() + interval
-
-    @callback
-    def interval_listener(now: datetime) -> None:
-        """Handle elapsed intervals."""
-        nonlocal remove
-        nonlocal interval_listener_job
-
-        remove = async_track_point_in_utc_time(
-            opp, interval_listener_job, next_interval()  # type: ignore
-        )
-        opp.async_run_opp_job(job, now)
-
-    interval_listener_job = OppJob(interval_listener)
-    remove = async_track_point_in_utc_time(opp, interval_listener_job, next_interval())
+    scheduler = _async_get_timer_scheduler(opp)
+    timer = _ScheduledTimer(dt_util.utcnow() + interval, OppJob(action), interval)
+    scheduler.async_add(timer)
 
     def remove_listener() -> None:
         """Remove interval listener."""
-        remove()  # type: ignore
+        scheduler.async_cancel(timer)
 
     return remove_listener
 
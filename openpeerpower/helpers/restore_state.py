@@ -6,9 +6,14 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, cast
 
-from openpeerpower.const import EVENT_OPENPEERPOWER_START, EVENT_OPENPEERPOWER_STOP
+from openpeerpower.const import (
+    EVENT_OPENPEERPOWER_START,
+    EVENT_OPENPEERPOWER_STOP,
+    EVENT_STATE_CHANGED,
+)
 from openpeerpower.core import (
     CoreState,
+    Event,
     OpenPeerPower,
     State,
     callback,
@@ -20,7 +25,7 @@ from openpeerpower.helpers.entity import Entity
 from openpeerpower.helpers.event import async_track_time_interval
 from openpeerpower.helpers.json import JSONEncoder
 from openpeerpower.helpers.singleton import singleton
-from openpeerpower.helpers.storage import Store
+from openpeerpower.helpers.storage import CollectionStore
 import openpeerpower.util.dt as dt_util
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
@@ -30,9 +35,13 @@ _LOGGER = logging.getLogger(__name__)
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
 
-# How long between periodically saving the current states to disk
+# How long between periodically saving the changed states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between saving all current states to disk, which refreshes
+# when the states were last seen
+STATE_FULL_DUMP_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -103,11 +112,20 @@ class RestoreStateData:
     def __init__(self, opp: OpenPeerPower) -> None:
         """Initialize the restore state data class."""
         self.opp: OpenPeerPower = opp
-        self.store: Store = Store(
-            opp, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store: CollectionStore = CollectionStore(
+            opp,
+            STORAGE_VERSION,
+            STORAGE_KEY,
+            collection=None,
+            item_id=_stored_state_entity_id,
+            item_to_dict=StoredState.as_dict,
+            encoder=JSONEncoder,
         )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        # Entities whose stored state changed since the last dump
+        self.changed_entity_ids: set[str] = set()
+        self._last_full_dump: datetime | None = None
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -151,9 +169,26 @@ class RestoreStateData:
 
         return stored_states
 
+    @callback
+    def _async_get_stored_state(
+        self, entity_id: str, now: datetime
+    ) -> StoredState | None:
+        """Get the state of an entity which should be stored."""
+        state = self.opp.states.get(entity_id)
+        # Ignore states that are entity registry placeholders
+        if state is not None and not state.attributes.get(
+            entity_registry.ATTR_RESTORED
+        ):
+            if entity_id in self.entity_ids:
+                return StoredState(state, now)
+            return None
+        return self.last_states.get(entity_id)
+
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        self.changed_entity_ids.clear()
+        self._last_full_dump = dt_util.utcnow()
         try:
             await self.store.async_save(
                 [
@@ -164,17 +199,61 @@ class RestoreStateData:
         except OpenPeerPowerError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    async def async_dump_changed_states(self) -> None:
+        """Save the states that changed since the last dump to storage.
+
+        The changes are appended to a journal, which is compacted into the
+        stored states once it grew large.
+        """
+        now = dt_util.utcnow()
+        if (
+            self._last_full_dump is None
+            or now - self._last_full_dump >= STATE_FULL_DUMP_INTERVAL
+        ):
+            await self.async_dump_states()
+            return
+
+        if not self.changed_entity_ids:
+            return
+
+        _LOGGER.debug("Dumping %s changed states", len(self.changed_entity_ids))
+        changes = [
+            (entity_id, self._async_get_stored_state(entity_id, now))
+            for entity_id in self.changed_entity_ids
+        ]
+        self.changed_entity_ids.clear()
+        try:
+            await self.store.async_save_items(self.async_get_stored_states, changes)
+        except OpenPeerPowerError as exc:
+            _LOGGER.error("Error saving changed states", exc_info=exc)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Track the restorable entities whose state changed."""
+        self.changed_entity_ids.add(event.data["entity_id"])
+
+    @callback
+    def _async_is_restorable(self, event: Event) -> bool:
+        """Return if the changed state belongs to a restorable entity."""
+        return event.data["entity_id"] in self.entity_ids
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
 
         async def _async_dump_states(*_: Any) -> None:
-            await self.async_dump_states()
+            await self.async_dump_changed_states()
+
+        cancel_tracking = self.opp.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_is_restorable,
+        )
 
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Open Peer Power
         # has started and the old states have been read.
-        self.opp.async_create_task(_async_dump_states())
+        self.opp.async_create_task(self.async_dump_states())
 
         # Dump states periodically
         cancel_interval = async_track_time_interval(
@@ -183,7 +262,8 @@ class RestoreStateData:
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
             cancel_interval()
-            await self.async_dump_states()
+            cancel_tracking()
+            await self.async_dump_changed_states()
 
         # Dump states when stopping.opp
         self.opp.bus.async_listen_once(
@@ -210,6 +290,12 @@ class RestoreStateData:
             self.last_states[entity_id] = StoredState(state, dt_util.utcnow())
 
         self.entity_ids.remove(entity_id)
+        self.changed_entity_ids.add(entity_id)
+
+
+def _stored_state_entity_id(stored_state: dict) -> str:
+    """Return the entity id of a stored state dict."""
+    return cast(str, stored_state["state"]["entity_id"])
 
 
 def _encode(value: Any) -> Any:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Awaitable, Iterable
 import dataclasses
 from functools import partial, wraps
@@ -23,7 +24,7 @@ from openpeerpower.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
 )
-from openpeerpower.core import Context, OpenPeerPower, ServiceCall, callback
+from openpeerpower.core import Context, Event, OpenPeerPower, ServiceCall, callback
 from openpeerpower.exceptions import (
     OpenPeerPowerError,
     TemplateError,
@@ -59,6 +60,12 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+DATA_TARGET_CACHE = "service_target_cache"
+
+TARGET_CACHE_SIZE = 256
+
+# Entity registry changes that alter how areas and devices resolve
+_TARGET_ENTITY_CHANGES = {"area_id", "device_id", "entity_id"}
 
 
 class ServiceParams(TypedDict):
@@ -339,42 +346,130 @@ async def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
+    resolved = async_resolve_targets(opp, selector.area_ids, selector.device_ids)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.referenced_devices.update(resolved.devices)
+    selected.indirectly_referenced.update(resolved.entities)
+
+    return selected
+
+
+@dataclasses.dataclass(frozen=True)
+class ResolvedTargets:
+    """Class to hold the registry entries targeted by areas and devices."""
+
+    # Targeted devices and the devices in the targeted areas.
+    devices: frozenset[str]
+
+    # Entities in the targeted areas or of the targeted devices.
+    entities: frozenset[str]
+
+    # Targeted items that could not be found.
+    missing_devices: frozenset[str]
+    missing_areas: frozenset[str]
+
+
+@callback
+@bind_opp
+def async_resolve_targets(
+    opp: OpenPeerPower, area_ids: Iterable[str], device_ids: Iterable[str]
+) -> ResolvedTargets:
+    """Resolve areas and devices to their devices and entities.
+
+    Results are cached per selector until the area, device or entity
+    registry is updated.
+    """
+    cache: OrderedDict[tuple[frozenset[str], frozenset[str]], ResolvedTargets]
+    cache = opp.data.get(DATA_TARGET_CACHE)
+    if cache is None:
+        cache = opp.data[DATA_TARGET_CACHE] = OrderedDict()
+        _async_track_target_changes(opp, cache)
+
+    key = (frozenset(area_ids), frozenset(device_ids))
+    resolved = cache.get(key)
+    if resolved is not None:
+        cache.move_to_end(key)
+        return resolved
+
+    resolved = _async_resolve_targets(opp, *key)
+    cache[key] = resolved
+    if len(cache) > TARGET_CACHE_SIZE:
+        cache.popitem(last=False)
+    return resolved
+
+
+@callback
+def _async_track_target_changes(opp: OpenPeerPower, cache: OrderedDict) -> None:
+    """Clear the resolved targets when the registries change."""
+
+    @callback
+    def _clear_cache(event: Event) -> None:
+        """Clear the resolved targets."""
+        cache.clear()
+
+    @callback
+    def _entity_changes_target(event: Event) -> bool:
+        """Return if an entity registry update affects the resolved targets."""
+        if event.data["action"] != "update":
+            return True
+        return not _TARGET_ENTITY_CHANGES.isdisjoint(event.data["changes"])
+
+    opp.bus.async_listen(area_registry.EVENT_AREA_REGISTRY_UPDATED, _clear_cache)
+    opp.bus.async_listen(device_registry.EVENT_DEVICE_REGISTRY_UPDATED, _clear_cache)
+    opp.bus.async_listen(
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        _clear_cache,
+        event_filter=_entity_changes_target,
+    )
+
+
+@callback
+def _async_resolve_targets(
+    opp: OpenPeerPower, area_ids: frozenset[str], device_ids: frozenset[str]
+) -> ResolvedTargets:
+    """Resolve areas and devices using the registry indexes."""
     ent_reg = entity_registry.async_get(opp)
     dev_reg = device_registry.async_get(opp)
     area_reg = area_registry.async_get(opp)
 
-    for device_id in selector.device_ids:
-        if device_id not in dev_reg.devices:
-            selected.missing_devices.add(device_id)
-
-    for area_id in selector.area_ids:
-        if area_id not in area_reg.areas:
-            selected.missing_areas.add(area_id)
+    missing_devices = {
+        device_id for device_id in device_ids if device_id not in dev_reg.devices
+    }
+    missing_areas = {area_id for area_id in area_ids if area_id not in area_reg.areas}
 
     # Find devices for this area
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
-
-    if not selector.area_ids and not selected.referenced_devices:
-        return selected
-
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
+    devices = set(device_ids)
+    area_devices = set()
+    for area_id in area_ids:
+        for device_entry in device_registry.async_entries_for_area(dev_reg, area_id):
+            area_devices.add(device_entry.id)
+    devices.update(area_devices)
+
+    entities = set()
+    # when area matches the target area
+    for area_id in area_ids:
+        for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id):
+            entities.add(ent_entry.entity_id)
+
+    for device_id in devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
         ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
-
-    return selected
+            if (
+                # when device matches target device
+                device_id in device_ids
+                # when device matches a referenced devices with no explicitly set area
+                or not ent_entry.area_id
+            ):
+                entities.add(ent_entry.entity_id)
+
+    return ResolvedTargets(
+        frozenset(devices),
+        frozenset(entities),
+        frozenset(missing_devices),
+        frozenset(missing_areas),
+    )
 
 
 @bind_opp
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
+import json
 from json import JSONEncoder
 import logging
 import os
@@ -18,6 +20,9 @@ from openpeerpower.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+# Journaled changes after which the collection is written in full again
+JOURNAL_COMPACT_SIZE = 1000
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -67,6 +72,9 @@ async def async_migrator(
 class Store:
     """Class to help storing data."""
 
+    # Write the JSON without indentation
+    _compact = False
+
     def __init__(
         self,
         opp: OpenPeerPower,
@@ -124,7 +132,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.opp.async_add_executor_job(json_util.load_json, self.path)
+            data = await self.opp.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -223,13 +231,19 @@ class Store:
             except (json_util.SerializationError, json_util.WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    def _load_data(self) -> dict:
+        """Load the data from disk."""
+        return json_util.load_json(self.path)
+
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
@@ -242,3 +256,236 @@ class Store:
 
         with suppress(FileNotFoundError):
             await self.opp.async_add_executor_job(os.unlink, self.path)
+
+
+@bind_opp
+class CollectionStore(Store):
+    """Store a large collection of items, such as the entries of a registry.
+
+    The data is a dict holding the collection as a list of items, or the list
+    itself if collection is None. Items are identified by the id item_id
+    returns for their dict. The items are only snapshotted on the event loop and
+    converted with item_to_dict and serialized in the executor. Changes of
+    single items are appended to a journal next to the file, which is
+    compacted into the file after JOURNAL_COMPACT_SIZE changes.
+    """
+
+    _compact = True
+
+    def __init__(
+        self,
+        opp: OpenPeerPower,
+        version: int,
+        key: str,
+        private: bool = False,
+        *,
+        collection: str | None,
+        item_id: Callable[[dict], str],
+        item_to_dict: Callable[[Any], dict],
+        encoder: type[JSONEncoder] | None = None,
+    ) -> None:
+        """Initialize storage class."""
+        super().__init__(opp, version, key, private, encoder=encoder)
+        self._collection = collection
+        self._item_id = item_id
+        self._item_to_dict = item_to_dict
+        # Changes to journal as (id, item or None), None for a full write
+        self._changes: list[tuple[str, Any]] | None = None
+        # Changes are only journaled after the file was written by us
+        self._journal_size: int | None = None
+
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
+    @callback
+    def async_delay_save_items(
+        self,
+        items_func: Callable[[], Iterable[Any]],
+        changes: Iterable[tuple[str, Any]] | None = None,
+        delay: float = 0,
+    ) -> None:
+        """Save the items with an optional delay.
+
+        items_func is called on the event loop and returns a snapshot of the
+        items, which are converted in the executor so must not be changed in
+        place. changes are the ids of the changed items with the item, or None
+        if it was removed. Without changes all items are written.
+        """
+        changes = self._async_merge_changes(changes)
+        super().async_delay_save(lambda: self._items_to_data(items_func()), delay)
+        self._changes = changes
+        self._data["items_func"] = items_func  # type: ignore[index]
+
+    async def async_save_items(
+        self,
+        items_func: Callable[[], Iterable[Any]],
+        changes: Iterable[tuple[str, Any]] | None = None,
+    ) -> None:
+        """Save the items now, see async_delay_save_items."""
+        self._changes = self._async_merge_changes(changes)
+        self._data = {
+            "version": self.version,
+            "key": self.key,
+            "data_func": lambda: self._items_to_data(items_func()),
+            "items_func": items_func,
+        }
+
+        if self.opp.state == CoreState.stopping:
+            self._async_ensure_final_write_listener()
+            return
+
+        await self._async_handle_write_data()
+
+    @callback
+    def _async_merge_changes(
+        self, changes: Iterable[tuple[str, Any]] | None
+    ) -> list[tuple[str, Any]] | None:
+        """Return the changes to journal with the pending ones."""
+        if changes is None or self._data is not None and self._changes is None:
+            # A full write is pending or requested
+            return None
+        if self._changes is None:
+            return list(changes)
+        return [*self._changes, *changes]
+
+    async def async_save(self, data: dict | list) -> None:
+        """Save data."""
+        self._changes = None
+        await super().async_save(data)
+
+    @callback
+    def async_delay_save(self, data_func: Callable[[], dict], delay: float = 0) -> None:
+        """Save data with an optional delay."""
+        self._changes = None
+        super().async_delay_save(data_func, delay)
+
+    async def _async_handle_write_data(self, *_args):
+        """Handle writing the items or the journal."""
+        async with self._write_lock:
+            self._async_cleanup_delay_listener()
+            self._async_cleanup_final_write_listener()
+
+            if self._data is None:
+                # Another write already consumed the data
+                return
+
+            data = self._data
+            changes = self._changes
+            self._data = self._changes = None
+
+            try:
+                if (
+                    "items_func" in data
+                    and changes is not None
+                    and self._journal_size is not None
+                    and self._journal_size + len(changes) <= JOURNAL_COMPACT_SIZE
+                ):
+                    await self.opp.async_add_executor_job(
+                        self._write_journal, self.journal_path, changes
+                    )
+                    self._journal_size += len(changes)
+                    return
+
+                if "items_func" in data:
+                    data.pop("data_func", None)
+                    items = data.pop("items_func")()
+                elif "data_func" in data:
+                    data["data"] = data.pop("data_func")()
+                    items = None
+                else:
+                    items = None
+
+                await self.opp.async_add_executor_job(
+                    self._write_items, self.path, data, items
+                )
+                self._journal_size = 0
+            except (json_util.SerializationError, json_util.WriteError) as err:
+                # The journal may be incomplete, write all items next time
+                self._journal_size = None
+                _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    def _items_to_data(self, items: Iterable[Any]) -> dict | list:
+        """Return the data of the items."""
+        data = [self._item_to_dict(item) for item in items]
+        if self._collection is None:
+            return data
+        return {self._collection: data}
+
+    def _write_items(self, path: str, data: dict, items: Iterable[Any] | None) -> None:
+        """Write the data with the items and remove the journal."""
+        if items is not None:
+            data["data"] = self._items_to_data(items)
+        self._write_data(path, data)
+        with suppress(FileNotFoundError):
+            os.unlink(f"{path}{JOURNAL_SUFFIX}")
+
+    def _write_journal(self, path: str, changes: list[tuple[str, Any]]) -> None:
+        """Append the changed items to the journal."""
+        try:
+            lines = "".join(
+                json.dumps(
+                    [item_id, None if item is None else self._item_to_dict(item)],
+                    separators=(",", ":"),
+                    cls=self._encoder,
+                )
+                + "\n"
+                for item_id, item in changes
+            )
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {path}"
+            ) from err
+
+        _LOGGER.debug(
+            "Journaling %s changes for %s to %s", len(changes), self.key, path
+        )
+        try:
+            fd = os.open(
+                path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            with open(fd, "a", encoding="utf-8") as fdesc:
+                fdesc.write(lines)
+        except OSError as err:
+            raise json_util.WriteError(err) from err
+
+    def _load_data(self) -> dict:
+        """Load the data and apply the journal."""
+        data = super()._load_data()
+        try:
+            with open(self.journal_path, encoding="utf-8") as fdesc:
+                lines = fdesc.readlines()
+        except FileNotFoundError:
+            return data
+
+        changes = []
+        for line in lines:
+            try:
+                changes.append(tuple(json.loads(line)))
+            except ValueError:
+                # Only the last change can be cut off by a crash
+                _LOGGER.warning("Ignoring incomplete change in %s", self.journal_path)
+                break
+        if data:
+            data["data"] = self._apply_changes(data["data"], changes)
+        return data
+
+    def _apply_changes(
+        self, data: dict | list, changes: Iterable[tuple[str, dict | None]]
+    ) -> dict | list:
+        """Return the data with the changes of a journal applied."""
+        collection = data if self._collection is None else data[self._collection]
+        items = {self._item_id(item): item for item in collection}
+        for item_id, item in changes:
+            if item is None:
+                items.pop(item_id, None)
+            else:
+                # Changed items keep their position, new items are appended
+                items[item_id] = item
+        if self._collection is None:
+            return list(items.values())
+        data[self._collection] = list(items.values())
+        return data
@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Generator, Iterable
 from contextlib import suppress
@@ -17,9 +18,10 @@ from operator import attrgetter
 import random
 import re
 import sys
+import threading
+from types import CodeType
 from typing import Any, Callable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfunction, pass_context
@@ -61,6 +63,10 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# Compiled templates kept after the last template using them is gone,
+# so reloads do not compile them again
+_COMPILED_CODE_CACHE_SIZE = 4096
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -566,8 +572,6 @@ class Template:
         self, limited: bool = False, strict: bool = False
     ) -> jinja2.Template:
         """Bind a template to a specific opp instance."""
-        self.ensure_valid()
-
         assert self.opp is not None, "opp variable not set on template"
         assert (
             self._limited is None or self._limited == limited
@@ -579,6 +583,7 @@ class Template:
 
         self._limited = limited
         self._strict = strict
+        self.ensure_valid()
         env = self._env
 
         self._compiled = jinja2.Template.from_code(
@@ -1408,7 +1413,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.opp = opp
-        self.template_cache = weakref.WeakValueDictionary()
+        # Environments of the same kind compile a source to the same code
+        if opp is None:
+            self.kind = "no_opp"
+        elif limited:
+            self.kind = "limited"
+        elif strict:
+            self.kind = "strict"
+        else:
+            self.kind = "normal"
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1552,12 +1565,68 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        return _COMPILED_CODE_CACHE.get(self.kind, source, super().compile)
+
+
+class _CompiledCodeCache:
+    """LRU cache of compiled template code by environment kind and source.
+
+    Shared by all environments, identical templates are compiled once.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[str, str], CodeType] = OrderedDict()
+        # Templates can be validated outside of the event loop
+        self._lock = threading.Lock()
+
+    def get(
+        self, kind: str, source: str, compile_source: Callable[[str], CodeType]
+    ) -> CodeType:
+        """Return the compiled code of a source, compiling it if needed."""
+        key = (kind, source)
+        with self._lock:
+            code = self._cache.get(key)
+            if code is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return code
+            self.misses += 1
+
+        # Errors are raised again for every template using the source
+        code = compile_source(source)
+
+        with self._lock:
+            self._cache[key] = code
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return code
+
+    def clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        """Return the statistics of the cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
+
+
+_COMPILED_CODE_CACHE = _CompiledCodeCache(_COMPILED_CODE_CACHE_SIZE)
 
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
 
-        return cached
+def compiled_code_cache_info() -> dict[str, int]:
+    """Return the hits, misses and size of the compiled template cache."""
+    return _COMPILED_CODE_CACHE.info()
 
 
 _NO_OPP_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
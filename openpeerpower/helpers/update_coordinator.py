@@ -261,8 +261,7 @@ class DataUpdateCoordinator(Generic[T]):
             if not auth_failed and self._listeners and not self.opp.is_stopping:
                 self._schedule_refresh()
 
-        for update_callback in self._listeners:
-            update_callback()
+        self._async_notify_listeners()
 
     @callback
     def async_set_updated_data(self, data: T) -> None:
@@ -283,8 +282,14 @@ class DataUpdateCoordinator(Generic[T]):
         if self._listeners:
             self._schedule_refresh()
 
-        for update_callback in self._listeners:
-            update_callback()
+        self._async_notify_listeners()
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Notify the listeners and write the entity states in one batch."""
+        with entity.async_batch_state_writes(self.opp):
+            for update_callback in self._listeners:
+                update_callback()
 
     @callback
     def _async_stop_refresh(self, _: Event) -> None:
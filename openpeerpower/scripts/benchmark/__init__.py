@@ -252,6 +252,40 @@ async def state_changed_event_filter_helper(opp):
     return timer() - start
 
 
+@benchmark
+async def state_changed_event_helper_10k_listeners(opp):
+    """Run a million events through 10,000 state changed event listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10 ** 6
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10 ** 4):
+        opp.helpers.event.async_track_state_change_event(f"{entity_id}{idx}", listener)
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+
+    for _ in range(events_to_fire):
+        opp.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    start = timer()
+
+    await opp.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(opp):
     """Filter state changes."""
@@ -390,6 +424,90 @@ async def json_serialize_states(opp):
     return timer() - start
 
 
+@benchmark
+async def mqtt_match_subscriptions(opp):
+    """Match 100k MQTT messages against 10k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from openpeerpower.components.mqtt.topic_trie import TopicTrie
+
+    subscriptions = TopicTrie()
+    topics = []
+    for i in range(10 ** 4):
+        topic = f"home/room_{i % 100}/device_{i}/state"
+        subscriptions.add(topic, i)
+        topics.append(topic)
+    subscriptions.add("home/+/+/state", "wildcard")
+    subscriptions.add("home/#", "subtree")
+    size = len(topics)
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        assert len(subscriptions.match(topics[i % size])) == 3
+
+    return timer() - start
+
+
+@benchmark
+async def template_compile_duplicates(opp):
+    """Validate 3000 templates that share 100 sources twice."""
+    # pylint: disable=import-outside-toplevel
+    from openpeerpower.helpers import template
+
+    sources = [
+        f"{{{{ states('sensor.temperature_{i}') | float * 1.8 + 32 | round(1) }}}}"
+        for i in range(100)
+    ]
+    start = timer()
+
+    # The second round is what a reload of the same config compiles
+    for _ in range(2):
+        for i in range(3000):
+            template.Template(sources[i % 100], opp).ensure_valid()
+
+    print("Compiled code cache:", template.compiled_code_cache_info())
+    return timer() - start
+
+
+@benchmark
+async def registry_entries_for_device(opp):
+    """Look up the entities and devices of 20k entities on 5k devices."""
+    # pylint: disable=import-outside-toplevel
+    from openpeerpower.helpers import device_registry as dr, entity_registry as er
+
+    dev_reg = dr.DeviceRegistry(opp)
+    dev_reg.devices = {}
+    dev_reg.deleted_devices = {}
+    ent_reg = er.EntityRegistry(opp)
+    ent_reg.entities = {}
+    ent_reg._rebuild_index()  # pylint: disable=protected-access
+    # There is no config dir to save the registries to
+    dev_reg.async_schedule_save = ent_reg.async_schedule_save = lambda *args: None
+
+    device_ids = []
+    for i in range(5000):
+        device = dev_reg.async_get_or_create(
+            config_entry_id=f"entry_{i % 100}", identifiers={("bench", str(i))}
+        )
+        device_ids.append(device.id)
+    for i in range(20000):
+        ent_reg.async_get_or_create(
+            "sensor",
+            "bench",
+            str(i),
+            device_id=device_ids[i % 5000],
+        )
+
+    start = timer()
+
+    for device_id in device_ids:
+        assert len(er.async_entries_for_device(ent_reg, device_id)) == 4
+    for i in range(100):
+        assert len(dr.async_entries_for_config_entry(dev_reg, f"entry_{i}")) == 50
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
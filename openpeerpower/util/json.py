@@ -48,13 +48,19 @@ def save_json(
     private: bool = False,
     *,
     encoder: type[json.JSONEncoder] | None = None,
+    compact: bool = False,
 ) -> None:
     """Save JSON data to a file.
 
+    The data is indented unless compact is set.
+
     Returns True on success.
     """
     try:
-        json_data = json.dumps(data, indent=4, cls=encoder)
+        if compact:
+            json_data = json.dumps(data, separators=(",", ":"), cls=encoder)
+        else:
+            json_data = json.dumps(data, indent=4, cls=encoder)
     except TypeError as error:
         msg = f"Failed to serialize to JSON: {filename}. Bad data at {format_unserializable_data(find_paths_unserializable_data(data))}"
         _LOGGER.error(msg)
@@ -1016,6 +1016,22 @@ def mock_storage(data=None):
         # To ensure that the data can be serialized
         data[store.key] = json.loads(json.dumps(data_to_write, cls=store._encoder))
 
+    def mock_write_journal(store, path, changes):
+        """Mock version of write journal, applying the changes to the data."""
+        _LOGGER.info("Journaling changes to %s: %s", store.key, changes)
+        data[store.key]["data"] = store._apply_changes(
+            data[store.key]["data"],
+            json.loads(
+                json.dumps(
+                    [
+                        (item_id, None if item is None else store._item_to_dict(item))
+                        for item_id, item in changes
+                    ],
+                    cls=store._encoder,
+                )
+            ),
+        )
+
     async def mock_remove(store):
         """Remove data."""
         data.pop(store.key, None)
@@ -1028,6 +1044,10 @@ def mock_storage(data=None):
         "openpeerpower.helpers.storage.Store._write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "openpeerpower.helpers.storage.CollectionStore._write_journal",
+        side_effect=mock_write_journal,
+        autospec=True,
     ), patch(
         "openpeerpower.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
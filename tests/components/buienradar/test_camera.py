@@ -2,8 +2,10 @@
 import asyncio
 from contextlib import suppress
 import copy
+from unittest.mock import patch
 
 from aiohttp.client_exceptions import ClientResponseError
+import pytest
 
 from openpeerpower.components.buienradar.const import CONF_COUNTRY, CONF_DELTA, DOMAIN
 from openpeerpower.const import (
@@ -25,6 +27,15 @@ TEST_LONGITUDE = 5.4002156
 TEST_CFG_DATA = {CONF_LATITUDE: TEST_LATITUDE, CONF_LONGITUDE: TEST_LONGITUDE}
 
 
+@pytest.fixture(autouse=True)
+def no_frame_cache():
+    """Fetch a new image from the camera for every request."""
+    with patch(
+        "openpeerpower.components.buienradar.camera.BuienradarCam.frame_interval", 0
+    ):
+        yield
+
+
 def radar_map_url(country_code: str = "NL") -> str:
     """Build map URL."""
     return f"https://api.buienradar.nl/image/1.0/RadarMap{country_code}?w=700&h=700"
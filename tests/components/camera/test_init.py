@@ -115,6 +115,53 @@ async def test_get_image_fails(opp, image_mock_url):
         await camera.async_get_image(opp, "camera.demo_camera")
 
 
+async def test_get_image_frame_cache(opp, image_mock_url):
+    """Test images are shared between requests for a frame interval."""
+    fetched = asyncio.Event()
+
+    async def camera_image():
+        await fetched.wait()
+        return b"Frame"
+
+    with patch(
+        "openpeerpower.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ) as mock_image:
+        requests = [
+            opp.async_create_task(camera.async_get_image(opp, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*requests)
+        assert [image.content for image in images] == [b"Frame"] * 3
+        assert mock_image.call_count == 1
+
+        image = await camera.async_get_image(opp, "camera.demo_camera")
+        assert image.content == b"Frame"
+        assert mock_image.call_count == 1
+
+        with patch(
+            "openpeerpower.components.camera.time.monotonic",
+            return_value=camera.time.monotonic() + camera.MIN_STREAM_INTERVAL,
+        ):
+            await camera.async_get_image(opp, "camera.demo_camera")
+        assert mock_image.call_count == 2
+
+
+async def test_camera_thumbnail_cache(opp, image_mock_url):
+    """Test the thumbnail is encoded once per frame."""
+    entity = opp.data[DOMAIN].get_entity("camera.demo_camera")
+
+    with patch(
+        "openpeerpower.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Frame",
+    ):
+        thumbnail = await entity.async_camera_thumbnail()
+        assert thumbnail == base64.b64encode(b"Frame").decode("utf-8")
+        assert await entity.async_camera_thumbnail() is thumbnail
+
+
 async def test_snapshot_service(opp, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
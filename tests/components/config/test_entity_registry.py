@@ -473,6 +473,8 @@ async def test_update_entity_id(opp, client):
         }
     }
 
+    # The state of the re-added entity is written in a batch
+    await opp.async_block_till_done()
     assert opp.states.get("test_domain.world") is None
     assert opp.states.get("test_domain.planet") is not None
 
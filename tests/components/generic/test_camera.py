@@ -4,6 +4,7 @@ from os import path
 from unittest.mock import patch
 
 import httpx
+import pytest
 import respx
 
 from openpeerpower import config as opp_config
@@ -17,6 +18,15 @@ from openpeerpower.const import (
 from openpeerpower.setup import async_setup_component
 
 
+@pytest.fixture(autouse=True)
+def no_frame_cache():
+    """Fetch a new image from the camera for every request."""
+    with patch(
+        "openpeerpower.components.generic.camera.GenericCamera.frame_interval", 0
+    ):
+        yield
+
+
 @respx.mock
 async def test_fetching_url(opp, opp_client):
     """Test that it fetches the given url."""
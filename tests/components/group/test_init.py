@@ -17,7 +17,6 @@ from openpeerpower.const import (
     STATE_UNKNOWN,
 )
 from openpeerpower.core import CoreState
-from openpeerpower.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 from openpeerpower.setup import async_setup_component
 
 from tests.common import assert_setup_component
@@ -437,11 +436,12 @@ async def test_reloading_groups(opp):
         "group.second_group",
         "group.test_group",
     ]
-    assert opp.bus.async_listeners()["state_changed"] == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["hello.world"]) == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+    assert opp.bus.async_listeners()["state_changed"] == 3
+    keyed_listeners = opp.bus.async_keyed_listeners("state_changed")
+    assert keyed_listeners["hello.world"] == 1
+    assert keyed_listeners["light.bowl"] == 1
+    assert keyed_listeners["test.one"] == 1
+    assert keyed_listeners["test.two"] == 1
 
     with patch(
         "openpeerpower.config.load_yaml_config_file",
@@ -456,10 +456,12 @@ async def test_reloading_groups(opp):
         "group.all_tests",
         "group.hello",
     ]
-    assert opp.bus.async_listeners()["state_changed"] == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["test.one"]) == 1
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS]["test.two"]) == 1
+    assert opp.bus.async_listeners()["state_changed"] == 2
+    keyed_listeners = opp.bus.async_keyed_listeners("state_changed")
+    assert "hello.world" not in keyed_listeners
+    assert keyed_listeners["light.bowl"] == 1
+    assert keyed_listeners["test.one"] == 1
+    assert keyed_listeners["test.two"] == 1
 
 
 async def test_modify_group(opp):
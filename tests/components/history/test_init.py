@@ -1,7 +1,10 @@
 """The tests the History component."""
 # pylint: disable=protected-access,invalid-name
+import asyncio
+import concurrent.futures
 from datetime import timedelta
 import json
+import threading
 from unittest.mock import patch, sentinel
 
 import pytest
@@ -612,6 +615,43 @@ async def test_fetch_period_api_with_minimal_response(opp, opp_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_stream(opp, opp_client):
+    """Test the fetch period view streaming newline delimited JSON."""
+    await opp.async_add_executor_job(init_recorder_component, opp)
+    await async_setup_component(opp, "history", {})
+    await opp.async_add_executor_job(opp.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    opp.states.async_set("light.kitchen", "on", {"brightness": 100})
+    opp.states.async_set("light.kitchen", "off")
+    opp.states.async_set("light.cow", "on")
+    await opp.async_block_till_done()
+    await opp.async_add_executor_job(trigger_db_commit, opp)
+    await opp.async_block_till_done()
+    await opp.async_add_executor_job(opp.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await opp_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"stream": "", "minimal_response": ""},
+    )
+    assert response.status == 200
+    assert response.content_type == "application/x-ndjson"
+    lines = [json.loads(line) for line in (await response.text()).splitlines()]
+    assert [line["entity_id"] for line in lines] == ["light.cow", "light.kitchen"]
+    kitchen = lines[1]["states"]
+    assert kitchen[0]["state"] == "on"
+    assert kitchen[0]["attributes"] == {"brightness": 100}
+    assert kitchen[1]["state"] == "off"
+    assert kitchen[1]["entity_id"] == "light.kitchen"
+
+    future = dt_util.utcnow() + timedelta(hours=1)
+    response = await client.get(
+        f"/api/history/period/{future.isoformat()}", params={"stream": ""}
+    )
+    assert response.status == 200
+    assert await response.text() == ""
+
+
 async def test_fetch_period_api_with_no_timestamp(opp, opp_client):
     """Test the fetch period view for history with no timestamp."""
     await opp.async_add_executor_job(init_recorder_component, opp)
@@ -897,6 +937,137 @@ async def test_statistics_during_period(opp, opp_ws_client):
     }
 
 
+async def test_stream_history(opp, opp_ws_client):
+    """Test history/stream sends a page of states per event."""
+    await opp.async_add_executor_job(init_recorder_component, opp)
+    await async_setup_component(opp, "history", {})
+    await opp.async_add_executor_job(opp.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    for state in ("1", "2", "3"):
+        opp.states.async_set("sensor.test", state)
+    await opp.async_block_till_done()
+    await opp.async_add_executor_job(trigger_db_commit, opp)
+    await opp.async_block_till_done()
+    await opp.async_add_executor_job(opp.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await opp_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "page_size": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert response["event"]["entity_id"] == "sensor.test"
+    assert [state["state"] for state in response["event"]["states"]] == ["1", "2"]
+    assert "attributes" not in response["event"]["states"][1]
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert [state["state"] for state in response["event"]["states"]] == ["3"]
+    assert response["event"]["states"][0]["entity_id"] == "sensor.test"
+
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"pages": 2}
+
+
+async def _async_record_stream_states(opp):
+    """Record states of three entities for the stream tests."""
+    await opp.async_add_executor_job(init_recorder_component, opp)
+    await async_setup_component(opp, "history", {})
+    await opp.async_add_executor_job(opp.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+    for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+        opp.states.async_set(entity_id, "on")
+    await opp.async_block_till_done()
+    await opp.async_add_executor_job(trigger_db_commit, opp)
+    await opp.async_block_till_done()
+    await opp.async_add_executor_job(opp.data[recorder.DATA_INSTANCE].block_till_done)
+    return start
+
+
+async def test_stream_stops_when_cancelled(opp):
+    """Test the stream stops fetching pages once it is cancelled."""
+    start = await _async_record_stream_states(opp)
+    cancel = threading.Event()
+    written = []
+
+    async def write(page):
+        written.append(page)
+        # The client went away
+        cancel.set()
+
+    pages = await opp.async_add_executor_job(
+        history._stream_significant_states,
+        opp,
+        lambda entity_id, states: entity_id,
+        write,
+        cancel,
+        None,
+        start,
+        None,
+        None,
+        True,
+        True,
+        False,
+    )
+    assert pages is None
+    assert len(written) == 1
+
+
+async def test_stream_aborts_when_write_times_out(opp):
+    """Test the stream is aborted when the client does not read a page."""
+    start = await _async_record_stream_states(opp)
+    never = asyncio.Event()
+    write_cancelled = False
+
+    async def write(page):
+        nonlocal write_cancelled
+        try:
+            await never.wait()
+        except asyncio.CancelledError:
+            write_cancelled = True
+            raise
+
+    with patch.object(history, "STREAM_WRITE_TIMEOUT", 0.01), pytest.raises(
+        concurrent.futures.TimeoutError
+    ):
+        await opp.async_add_executor_job(
+            history._stream_significant_states,
+            opp,
+            lambda entity_id, states: entity_id,
+            write,
+            threading.Event(),
+            None,
+            start,
+            None,
+            None,
+            True,
+            True,
+            False,
+        )
+    await opp.async_block_till_done()
+    assert write_cancelled
+
+
+async def test_stream_history_bad_start_time(opp, opp_ws_client):
+    """Test history/stream with a bad start time."""
+    await opp.async_add_executor_job(init_recorder_component, opp)
+    await async_setup_component(opp, "history", {})
+
+    client = await opp_ws_client()
+    await client.send_json({"id": 1, "type": "history/stream", "start_time": "cats"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_statistics_during_period_bad_start_time(opp, opp_ws_client):
     """Test statistics_during_period."""
     await opp.async_add_executor_job(init_recorder_component, opp)
@@ -37,12 +37,12 @@ from openpeerpower.const import (
     ATTR_BATTERY_LEVEL,
     ATTR_ENTITY_ID,
     ATTR_SERVICE,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     __version__,
 )
-from openpeerpower.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 
 from tests.common import async_mock_service
 
@@ -58,9 +58,9 @@ async def test_accessory_cancels_track_state_change_on_stop(opp, hk_driver):
         "openpeerpower.components.homekit.accessories.HomeAccessory.async_update_state"
     ):
         await acc.run()
-    assert len(opp.data[TRACK_STATE_CHANGE_CALLBACKS][entity_id]) == 1
+    assert opp.bus.async_keyed_listeners(EVENT_STATE_CHANGED)[entity_id] == 1
     acc.async_stop()
-    assert entity_id not in opp.data[TRACK_STATE_CHANGE_CALLBACKS]
+    assert entity_id not in opp.bus.async_keyed_listeners(EVENT_STATE_CHANGED)
 
 
 async def test_home_accessory(opp, hk_driver):
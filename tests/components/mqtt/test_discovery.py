@@ -473,6 +473,7 @@ ABBREVIATIONS_WHITE_LIST = [
     "CONF_DISCOVERY_ID",
     "CONF_DISCOVERY_PREFIX",
     "CONF_EMBEDDED",
+    "CONF_INBOUND_BATCH_SIZE",
     "CONF_KEEPALIVE",
     "CONF_TLS_INSECURE",
     "CONF_TLS_VERSION",
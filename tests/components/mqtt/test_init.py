@@ -11,6 +11,7 @@ import voluptuous as vol
 from openpeerpower.components import mqtt, websocket_api
 from openpeerpower.components.mqtt import debug_info
 from openpeerpower.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
+from openpeerpower.components.mqtt.models import Message
 from openpeerpower.const import (
     ATTR_DOMAIN,
     ATTR_SERVICE,
@@ -19,6 +20,7 @@ from openpeerpower.const import (
     TEMP_CELSIUS,
 )
 from openpeerpower.core import callback
+from openpeerpower.exceptions import OpenPeerPowerError
 from openpeerpower.helpers import device_registry as dr
 from openpeerpower.setup import async_setup_component
 from openpeerpower.util.dt import utcnow
@@ -583,6 +585,126 @@ async def test_subscribe_special_characters(opp, mqtt_mock, calls, record_calls)
     assert calls[0][0].payload == payload
 
 
+async def test_subscribe_overlapping_topics(opp, mqtt_mock):
+    """Test overlapping subscriptions run in the order they were made."""
+    calls = []
+
+    def record(name):
+        @callback
+        def record_calls(msg):
+            calls.append(name)
+
+        return record_calls
+
+    topics = ["a/#", "a/+/c", "#", "a/b/c", "+/b/#", "a/b/c/#", "a/+", "b/#"]
+    unsubs = {
+        topic: await mqtt.async_subscribe(opp, topic, record(topic)) for topic in topics
+    }
+
+    async_fire_mqtt_message(opp, "a/b/c", "test-payload")
+    await opp.async_block_till_done()
+    assert calls == ["a/#", "a/+/c", "#", "a/b/c", "+/b/#", "a/b/c/#"]
+
+    calls.clear()
+    unsubs["a/+/c"]()
+    unsubs["#"]()
+    async_fire_mqtt_message(opp, "a/b/c", "test-payload")
+    async_fire_mqtt_message(opp, "$SYS/b/c", "test-payload")
+    await opp.async_block_till_done()
+    assert calls == ["a/#", "a/b/c", "+/b/#", "a/b/c/#"]
+
+    calls.clear()
+    await mqtt.async_subscribe(opp, "a/+/c", record("a/+/c"))
+    async_fire_mqtt_message(opp, "a/b/c", "test-payload")
+    await opp.async_block_till_done()
+    assert calls == ["a/#", "a/b/c", "+/b/#", "a/b/c/#", "a/+/c"]
+
+
+async def test_payload_decoded_once_per_encoding(opp, mqtt_mock):
+    """Test the payload is decoded once for each encoding of the subscriptions."""
+    decoded = []
+
+    class Payload(bytes):
+        """Payload recording its decodes."""
+
+        def decode(self, encoding="utf-8", errors="strict"):
+            decoded.append(encoding)
+            return super().decode(encoding, errors)
+
+    calls = []
+
+    @callback
+    def record_calls(msg):
+        calls.append(msg.payload)
+
+    for _ in range(3):
+        await mqtt.async_subscribe(opp, "test-topic", record_calls)
+        await mqtt.async_subscribe(opp, "test-topic", record_calls, encoding="ascii")
+        await mqtt.async_subscribe(opp, "test-topic", record_calls, encoding=None)
+
+    async_fire_mqtt_message(opp, "test-topic", Payload(b"on"))
+    await opp.async_block_till_done()
+    assert sorted(decoded) == ["ascii", "utf-8"]
+    assert calls == ["on", "on", b"on"] * 3
+
+
+async def test_remove_subscription_twice(opp, mqtt_mock):
+    """Test removing a subscription twice raises."""
+    unsub = await mqtt.async_subscribe(opp, "test-topic", None)
+    unsub()
+    with pytest.raises(OpenPeerPowerError):
+        unsub()
+
+
+@pytest.mark.parametrize(
+    "mqtt_config",
+    [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_INBOUND_BATCH_SIZE: 4}],
+)
+async def test_inbound_messages_handled_in_batches(opp, mqtt_mock, calls, record_calls):
+    """Test messages from the paho thread are handled in batches."""
+    await mqtt.async_subscribe(opp, "test-topic", record_calls)
+    mqtt_data = mqtt_mock()
+
+    def receive():
+        for i in range(10):
+            msg = Message("test-topic", str(i).encode(), 0, False)
+            mqtt_data._mqtt_on_message(None, None, msg)
+        mqtt_data._mqtt_on_callback(None, None, 100)
+
+    await opp.async_add_executor_job(receive)
+    await mqtt_data._wait_for_mid(100)
+
+    assert [call[0].payload for call in calls] == [str(i) for i in range(10)]
+    stats = mqtt_data.inbound_stats
+    assert stats["queue_depth"] == 0
+    assert stats["handled"] == 11
+    assert stats["batches"] >= 3
+    assert stats["max_batch_size"] <= 4
+    assert stats["max_queue_depth"] >= stats["max_batch_size"]
+
+
+async def test_inbound_handler_error_does_not_stop_batch(opp, mqtt_mock, caplog):
+    """Test an error handling one message does not drop the rest of the batch."""
+    mqtt_data = mqtt_mock()
+    handled = []
+
+    def handler(arg):
+        if arg == 1:
+            raise ValueError
+        handled.append(arg)
+
+    def receive():
+        for i in range(3):
+            mqtt_data._queue_inbound(handler, i)
+        mqtt_data._mqtt_on_callback(None, None, 100)
+
+    await opp.async_add_executor_job(receive)
+    await mqtt_data._wait_for_mid(100)
+
+    assert handled == [0, 2]
+    assert "Error handling 1" in caplog.text
+
+
 async def test_subscribe_same_topic(opp, mqtt_client_mock, mqtt_mock):
     """
     Test subscring to same topic twice and simulate retained messages.
@@ -945,6 +1067,22 @@ async def test_mqtt_ws_subscription(opp, opp_ws_client, mqtt_mock):
     assert response["success"]
 
 
+async def test_mqtt_ws_inbound_stats(opp, opp_ws_client, mqtt_mock):
+    """Test getting the statistics of the inbound messages."""
+    mqtt_mock.inbound_stats = mqtt_mock().inbound_stats
+    client = await opp_ws_client(opp)
+    await client.send_json({"id": 5, "type": "mqtt/inbound_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "queue_depth": 0,
+        "max_queue_depth": 0,
+        "batches": 0,
+        "handled": 0,
+        "max_batch_size": 0,
+    }
+
+
 async def test_dump_service(opp, mqtt_mock):
     """Test that we can dump a topic."""
     mopen = mock_open()
@@ -31,10 +31,17 @@ async def async_setup_recorder_instance(
     ) -> Recorder:
         """Setup and return recorder instance."""  # noqa: D401
         stats = recorder.Recorder.async_hourly_statistics if enable_statistics else None
+        short_term_stats = (
+            recorder.Recorder.async_short_term_statistics if enable_statistics else None
+        )
         with patch(
             "openpeerpower.components.recorder.Recorder.async_hourly_statistics",
             side_effect=stats,
             autospec=True,
+        ), patch(
+            "openpeerpower.components.recorder.Recorder.async_short_term_statistics",
+            side_effect=short_term_stats,
+            autospec=True,
         ):
             await async_init_recorder_component(opp, config)
             await opp.async_block_till_done()
@@ -7,6 +7,7 @@ from unittest.mock import patch, sentinel
 
 from openpeerpower.components.recorder import history
 from openpeerpower.components.recorder.models import process_timestamp
+from openpeerpower.components.recorder.util import session_scope
 import openpeerpower.core as ha
 from openpeerpower.helpers.json import JSONEncoder
 import openpeerpower.util.dt as dt_util
@@ -206,6 +207,36 @@ def test_get_significant_states_minimal_response(opp_recorder):
     assert states == hist
 
 
+def test_stream_significant_states(opp_recorder):
+    """Test streamed pages match the significant states."""
+    opp = opp_recorder()
+    zero, four, _ = record_states(opp)
+    # Half way between the first and second changes, so entities
+    # also get a state at the start time
+    start = zero + timedelta(seconds=1.5)
+
+    for minimal_response in (False, True):
+        hist = history.get_significant_states(
+            opp, start, four, minimal_response=minimal_response
+        )
+
+        streamed = {}
+        with session_scope(opp=opp) as session:
+            for entity_id, page in history.stream_significant_states(
+                opp,
+                session,
+                start,
+                four,
+                minimal_response=minimal_response,
+                page_size=1,
+            ):
+                assert len(page) == 1
+                streamed.setdefault(entity_id, []).extend(page)
+
+        assert "media_player.test2" in streamed
+        assert json.loads(json.dumps(hist, cls=JSONEncoder)) == streamed
+
+
 def test_get_significant_states_with_initial(opp_recorder):
     """Test that only significant states are returned.
 
@@ -25,7 +25,12 @@ from openpeerpower.components.recorder import (
     run_information_with_session,
 )
 from openpeerpower.components.recorder.const import DATA_INSTANCE
-from openpeerpower.components.recorder.models import Events, RecorderRuns, States
+from openpeerpower.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from openpeerpower.components.recorder.util import session_scope
 from openpeerpower.const import (
     EVENT_OPENPEERPOWER_FINAL_WRITE,
@@ -38,6 +43,7 @@ from openpeerpower.const import (
 from openpeerpower.core import Context, CoreState, OpenPeerPower, callback
 from openpeerpower.setup import async_setup_component, setup_component
 from openpeerpower.util import dt as dt_util
+from openpeerpower.util.async_ import run_callback_threadsafe
 
 from .common import (
     async_wait_recording_done,
@@ -201,16 +207,16 @@ def test_saving_state_with_exception(opp, opp_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in opp.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    original_execute = opp.data[DATA_INSTANCE].event_session.execute
+
+    def _throw_if_state_in_session(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is States.__table__:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return original_execute(statement, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
         opp.data[DATA_INSTANCE].event_session,
-        "flush",
+        "execute",
         side_effect=_throw_if_state_in_session,
     ):
         opp.states.set(entity_id, "fail", attributes)
@@ -239,16 +245,16 @@ def test_saving_state_with_sqlalchemy_exception(opp, opp_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in opp.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    original_execute = opp.data[DATA_INSTANCE].event_session.execute
+
+    def _throw_if_state_in_session(statement, *args, **kwargs):
+        if getattr(statement, "table", None) is States.__table__:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return original_execute(statement, *args, **kwargs)
 
     with patch("time.sleep"), patch.object(
         opp.data[DATA_INSTANCE].event_session,
-        "flush",
+        "execute",
         side_effect=_throw_if_state_in_session,
     ):
         opp.states.set(entity_id, "fail", attributes)
@@ -282,7 +288,7 @@ async def test_force_shutdown_with_queue_of_writes_that_generate_exceptions(
 
     with patch.object(instance, "db_retry_wait", 0.2), patch.object(
         instance.event_session,
-        "flush",
+        "execute",
         side_effect=OperationalError(
             "insert the state", "fake params", "forced to fail"
         ),
@@ -759,6 +765,135 @@ def test_saving_sets_old_state(opp_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_batch_keeps_order_and_old_state(opp_recorder):
+    """Test events and states written in one commit keep order and old state."""
+    opp = opp_recorder()
+    instance = opp.data[DATA_INSTANCE]
+    wait_recording_done(opp)
+    committed_rows = instance.committed_rows
+    commit_count = instance.commit_count
+    original_execute = instance.event_session.execute
+    inserts = []
+
+    def _record_inserts(statement, *args, **kwargs):
+        if getattr(statement, "is_insert", False):
+            inserts.append(statement.table.name)
+        return original_execute(statement, *args, **kwargs)
+
+    opp.states.set("test.one", "on", {})
+    opp.bus.fire("custom_event", {"some_data": 1})
+    opp.bus.fire("custom_event", {"some_data": 2})
+    opp.states.set("test.one", "off", {})
+    opp.states.remove("test.one")
+    opp.bus.fire("custom_event", {"some_data": 3})
+    with patch.object(instance.event_session, "execute", side_effect=_record_inserts):
+        wait_recording_done(opp)
+
+    # One executemany per table
+    assert inserts.count("events") == 1
+    assert inserts.count("states") == 1
+    assert instance.commit_count > commit_count
+    assert instance.committed_rows >= committed_rows + 6
+    assert instance.last_commit_seconds > 0
+    assert instance.total_commit_seconds >= instance.last_commit_seconds
+
+    with session_scope(opp=opp) as session:
+        events = list(
+            session.query(Events)
+            .filter(Events.event_type.in_(["custom_event", "state_changed"]))
+            .order_by(Events.event_id)
+        )
+        assert [event.event_type for event in events] == [
+            "state_changed",
+            "custom_event",
+            "custom_event",
+            "state_changed",
+            "state_changed",
+            "custom_event",
+        ]
+        assert events[5].event_data == '{"some_data": 3}'
+
+        states = list(session.query(States).order_by(States.state_id))
+        assert len(states) == 3
+        assert [state.event_id for state in states] == [
+            events[0].event_id,
+            events[3].event_id,
+            events[4].event_id,
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id == states[0].state_id
+        assert states[2].old_state_id == states[1].state_id
+        assert states[2].state is None
+
+
+def test_saving_state_attributes_are_shared(opp_recorder):
+    """Test identical attributes are stored once and shared between states."""
+    opp = opp_recorder()
+
+    attributes = {"unit_of_measurement": "W", "friendly_name": "Power"}
+    opp.states.set("sensor.one", "1", attributes)
+    opp.states.set("sensor.two", "2", attributes)
+    wait_recording_done(opp)
+    opp.states.set("sensor.one", "3", attributes)
+    opp.states.set("sensor.one", "4", {"friendly_name": "Other"})
+    wait_recording_done(opp)
+
+    with session_scope(opp=opp) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert len(states) == 4
+        assert all(state.attributes is None for state in states)
+        assert (
+            states[0].attributes_id
+            == states[1].attributes_id
+            == states[2].attributes_id
+        )
+        assert states[3].attributes_id != states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+        assert states[2].to_native().attributes == attributes
+        shared_attributes_id = states[0].attributes_id
+
+    instance = opp.data[DATA_INSTANCE]
+    instance.evict_state_attributes_ids([shared_attributes_id])
+    opp.states.set("sensor.two", "5", attributes)
+    wait_recording_done(opp)
+
+    with session_scope(opp=opp) as session:
+        # The evicted attributes are found again in the database
+        assert session.query(StateAttributes).count() == 2
+        state = session.query(States).order_by(States.state_id.desc()).first()
+        assert state.attributes_id == shared_attributes_id
+
+
+def test_state_attributes_ids_cache_sized_to_entities(opp_recorder):
+    """Test the attributes_id LRU grows with the number of entities."""
+    opp = opp_recorder()
+    instance = opp.data[DATA_INSTANCE]
+
+    for idx in range(5):
+        opp.states.set(f"sensor.test_{idx}", "on", {"idx": idx})
+    wait_recording_done(opp)
+
+    with patch(
+        "openpeerpower.components.recorder.STATE_ATTRIBUTES_ID_CACHE_MIN_SIZE", 4
+    ):
+        run_callback_threadsafe(
+            opp.loop, instance._async_size_state_attributes_ids
+        ).result()
+    assert instance._state_attributes_ids_size == 10
+    assert len(instance._state_attributes_ids) == 5
+
+    run_callback_threadsafe(
+        opp.loop, instance._async_size_state_attributes_ids
+    ).result()
+    assert instance._state_attributes_ids_size == 2048
+
+    # The least recently used attributes are dropped beyond the size
+    instance._state_attributes_ids_size = 3
+    opp.states.set("sensor.test_0", "off", {"idx": 5})
+    wait_recording_done(opp)
+    assert len(instance._state_attributes_ids) == 3
+
+
 def test_saving_state_with_serializable_data(opp_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     opp = opp_recorder()
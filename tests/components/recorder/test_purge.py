@@ -8,7 +8,13 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 
 from openpeerpower.components import recorder
-from openpeerpower.components.recorder.models import Events, RecorderRuns, States
+from openpeerpower.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsShortTerm,
+)
 from openpeerpower.components.recorder.purge import purge_old_data
 from openpeerpower.components.recorder.util import session_scope
 from openpeerpower.const import EVENT_STATE_CHANGED
@@ -57,6 +63,61 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_state_attributes(
+    opp: OpenPeerPower, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting state attributes no longer used by any state."""
+    instance = await async_setup_recorder_instance(opp)
+    await async_wait_recording_done(opp, instance)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(opp=opp) as session:
+        only_old = StateAttributes(hash=1, shared_attrs='{"old": true}')
+        shared = StateAttributes(hash=2, shared_attrs='{"shared": true}')
+        session.add_all([only_old, shared])
+        session.flush()
+        for timestamp, attributes_id in (
+            (eleven_days_ago, only_old.attributes_id),
+            (eleven_days_ago, shared.attributes_id),
+            (utcnow, shared.attributes_id),
+        ):
+            event = Events(
+                event_type="state_changed",
+                event_data="{}",
+                origin="LOCAL",
+                time_fired=timestamp,
+            )
+            session.add(event)
+            session.flush()
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    domain="sensor",
+                    state="on",
+                    attributes_id=attributes_id,
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                    event_id=event.event_id,
+                )
+            )
+        only_old_id = only_old.attributes_id
+        shared_id = shared.attributes_id
+
+    with patch.object(instance, "evict_state_attributes_ids") as evict:
+        with recorder.session_scope(opp=opp) as session:
+            finished = purge_old_data(instance, 4, repack=False)
+            assert not finished
+            assert session.query(States).count() == 1
+            assert [
+                attributes.attributes_id
+                for attributes in session.query(StateAttributes)
+            ] == [shared_id]
+
+    evict.assert_called_once_with({only_old_id})
+
+
 async def test_purge_old_states_encouters_database_corruption(
     opp: OpenPeerPower, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -195,6 +256,30 @@ async def test_purge_old_recorder_runs(
         assert recorder_runs.count() == 1
 
 
+async def test_purge_old_short_term_statistics(
+    opp: OpenPeerPower, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting old short term statistics."""
+    instance = await async_setup_recorder_instance(opp)
+    now = dt_util.utcnow()
+
+    with session_scope(opp=opp) as session:
+        for days in (0, 3, 6):
+            session.add(
+                StatisticsShortTerm.from_stats(
+                    "recorder", "sensor.test", now - timedelta(days=days), {}
+                )
+            )
+
+    with session_scope(opp=opp) as session:
+        statistics = session.query(StatisticsShortTerm)
+        assert statistics.count() == 3
+
+        finished = purge_old_data(instance, 4, repack=False)
+        assert finished
+        assert statistics.count() == 2
+
+
 async def test_purge_method(
     opp: OpenPeerPower,
     async_setup_recorder_instance: SetupRecorderInstanceT,
@@ -8,7 +8,10 @@ from pytest import approx
 from openpeerpower.components.recorder import history
 from openpeerpower.components.recorder.const import DATA_INSTANCE
 from openpeerpower.components.recorder.models import process_timestamp_to_utc_isoformat
-from openpeerpower.components.recorder.statistics import statistics_during_period
+from openpeerpower.components.recorder.statistics import (
+    get_latest_statistics,
+    statistics_during_period,
+)
 from openpeerpower.setup import setup_component
 import openpeerpower.util.dt as dt_util
 
@@ -43,6 +46,27 @@ def test_compile_hourly_statistics(opp_recorder):
     }
 
 
+def test_get_latest_statistics(opp_recorder):
+    """Test getting the latest statistics of several entities at once."""
+    opp = opp_recorder()
+    recorder = opp.data[DATA_INSTANCE]
+    setup_component(opp, "sensor", {})
+    zero, four, states = record_states(opp)
+    later = zero + timedelta(hours=1)
+
+    recorder.do_adhoc_statistics(period="hourly", start=zero)
+    wait_recording_done(opp)
+    recorder.do_adhoc_statistics(period="hourly", start=later)
+    wait_recording_done(opp)
+
+    stats = get_latest_statistics(opp, ["sensor.test1", "sensor.test2"])
+    assert list(stats) == ["sensor.test1"]
+    assert [stat["start"] for stat in stats["sensor.test1"]] == [
+        process_timestamp_to_utc_isoformat(later)
+    ]
+    assert get_latest_statistics(opp, ["sensor.test1"], "5minute") == {}
+
+
 def record_states(opp):
     """Record some test states.
 
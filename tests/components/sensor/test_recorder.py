@@ -44,6 +44,48 @@ def test_compile_hourly_statistics(opp_recorder):
     }
 
 
+def test_compile_5minute_statistics(opp_recorder):
+    """Test compiling 5-minute statistics."""
+    opp = opp_recorder()
+    recorder = opp.data[DATA_INSTANCE]
+    setup_component(opp, "sensor", {})
+    zero, four, states = record_states(opp)
+    # The state changes from 10 to 15 after 2 minutes
+    start = zero + timedelta(minutes=9)
+    start2 = zero + timedelta(minutes=2)
+
+    recorder.do_adhoc_statistics(period="5minute", start=start)
+    wait_recording_done(opp)
+    recorder.do_adhoc_statistics(period="5minute", start=start2)
+    wait_recording_done(opp)
+    assert statistics_during_period(opp, zero) == {}
+    stats = statistics_during_period(opp, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(start2),
+                "mean": approx(10.0),
+                "min": approx(10.0),
+                "max": approx(10.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(start),
+                "mean": approx(13.0),
+                "min": approx(10.0),
+                "max": approx(15.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ]
+    }
+
+
 def test_compile_hourly_energy_statistics(opp_recorder):
     """Test compiling hourly statistics."""
     opp = opp_recorder()
@@ -9,7 +9,12 @@ import pytest
 
 from openpeerpower import config as opp_config
 from openpeerpower.components import recorder
-from openpeerpower.components.statistics.sensor import DOMAIN, StatisticsSensor
+from openpeerpower.components.statistics.rolling import RollingWindow
+from openpeerpower.components.statistics.sensor import (
+    DOMAIN,
+    StatisticsSensor,
+    _fetch_states,
+)
 from openpeerpower.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     SERVICE_RELOAD,
@@ -376,6 +381,61 @@ class TestStatisticsSensor(unittest.TestCase):
         state = self.opp.states.get("sensor.test")
         assert str(self.mean) == state.state
 
+    def test_initialize_sensors_from_database_together(self):
+        """Test initializing several statistics sensors from the database."""
+        init_recorder_component(self.opp)
+        self.opp.block_till_done()
+        self.opp.data[recorder.DATA_INSTANCE].block_till_done()
+        for value in self.values:
+            self.opp.states.set("sensor.test_monitored", value)
+            self.opp.states.set("sensor.test_other", value * 2)
+            self.opp.block_till_done()
+        wait_recording_done(self.opp)
+
+        assert setup_component(
+            self.opp,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "statistics",
+                        "name": "test",
+                        "entity_id": "sensor.test_monitored",
+                        "sampling_size": 100,
+                    },
+                    {
+                        "platform": "statistics",
+                        "name": "test_last",
+                        "entity_id": "sensor.test_monitored",
+                        "sampling_size": 2,
+                    },
+                    {
+                        "platform": "statistics",
+                        "name": "test_other_stats",
+                        "entity_id": "sensor.test_other",
+                        "sampling_size": 100,
+                    },
+                ]
+            },
+        )
+        self.opp.block_till_done()
+
+        with patch(
+            "openpeerpower.components.statistics.sensor._fetch_states",
+            wraps=_fetch_states,
+        ) as fetch_states:
+            self.opp.start()
+            self.opp.block_till_done()
+
+        assert fetch_states.call_count == 1
+        assert self.opp.states.get("sensor.test").state == str(self.mean)
+        assert self.opp.states.get("sensor.test_last").state == str(
+            round((self.values[-2] + self.values[-1]) / 2, 2)
+        )
+        assert self.opp.states.get("sensor.test_other_stats").state == str(
+            round(sum(self.values) * 2 / self.count, 2)
+        )
+
     def test_initialize_from_database_with_maxage(self):
         """Test initializing the statistics from the database."""
         now = dt_util.utcnow()
@@ -451,6 +511,36 @@ class TestStatisticsSensor(unittest.TestCase):
         )
 
 
+def test_rolling_window():
+    """Test the rolling window aggregates match recomputing them."""
+    values = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6, 20, 5, 11.1, -4, 0.3]
+    window = RollingWindow(5)
+    for idx, value in enumerate(values):
+        window.append(value)
+        expected = values[max(idx - 4, 0) : idx + 1]
+        assert list(window) == expected
+        assert window.total == pytest.approx(sum(expected))
+        assert window.mean == pytest.approx(statistics.mean(expected))
+        assert window.median == pytest.approx(statistics.median(expected))
+        assert window.min == min(expected)
+        assert window.max == max(expected)
+        if len(expected) > 1:
+            assert window.variance == pytest.approx(statistics.variance(expected))
+            assert window.stdev == pytest.approx(statistics.stdev(expected))
+
+    while len(window) > 1:
+        window.popleft()
+        expected = values[-len(window) :]
+        assert window.mean == pytest.approx(statistics.mean(expected))
+        assert window.median == pytest.approx(statistics.median(expected))
+        assert window.min == min(expected)
+        assert window.max == max(expected)
+
+    assert window.popleft() == values[-1]
+    assert len(window) == 0
+    assert window.total == 0
+
+
 async def test_reload(opp):
     """Verify we can reload filter sensors."""
     await opp.async_add_executor_job(init_recorder_component, opp)  # force in memory db
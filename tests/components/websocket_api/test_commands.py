@@ -18,6 +18,7 @@ from openpeerpower.core import Context, OpenPeerPower, callback
 from openpeerpower.exceptions import OpenPeerPowerError
 from openpeerpower.helpers import entity
 from openpeerpower.helpers.dispatcher import async_dispatcher_send
+from openpeerpower.helpers.event import async_call_later
 from openpeerpower.loader import async_get_integration
 from openpeerpower.setup import DATA_SETUP_TIME, async_setup_component
 
@@ -600,6 +601,107 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(opp, websocket_client, opp_admin_user):
+    """Test subscribe entities sends compressed states and their changes."""
+    opp_admin_user.groups = []
+    opp_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    opp.states.async_set("light.permitted", "off", {"color": "red", "effect": "on"})
+    opp.states.async_set("light.not_permitted", "off")
+    state = opp.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "red", "effect": "on"},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+                "s": "off",
+            }
+        }
+    }
+
+    opp.states.async_set("light.not_permitted", "on")
+    opp.states.async_set("light.permitted", "on", {"color": "blue", "effect": "on"})
+    state = opp.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": state.context.id,
+                    "lc": state.last_changed.timestamp(),
+                    "s": "on",
+                }
+            }
+        }
+    }
+
+    context = Context(user_id="user-id")
+    opp.states.async_set("light.permitted", "on", {"color": "blue"}, context=context)
+    state = opp.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "c": {"id": context.id, "parent_id": None, "user_id": "user-id"},
+                    "lu": state.last_updated.timestamp(),
+                },
+                "-": {"a": ["effect"]},
+            }
+        }
+    }
+
+    opp.states.async_remove("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_with_entity_ids(opp, websocket_client):
+    """Test subscribe entities only sends the requested entities."""
+    opp.states.async_set("light.permitted", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.new"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    opp.states.async_set("light.permitted", "on")
+    opp.states.async_set("light.new", "on", {"color": "red"})
+    state = opp.states.get("light.new")
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {
+            "light.new": {
+                "a": {"color": "red"},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+                "s": "on",
+            }
+        }
+    }
+
+
 async def test_render_template_renders_template(opp, websocket_client):
     """Test simple template is rendered and updated."""
     opp.states.async_set("light.test", "on")
@@ -1189,3 +1291,24 @@ async def test_integration_setup_info(opp, websocket_client, opp_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_integration_pending_timers(opp, websocket_client):
+    """Test pending timers are reported per integration."""
+
+    @callback
+    def _action(now):
+        """Do nothing."""
+
+    unsub = async_call_later(opp, 60, _action)
+    await websocket_client.send_json({"id": 7, "type": "integration/pending_timers"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert {
+        "domain": "tests.components.websocket_api.test_commands",
+        "timers": 1,
+    } in msg["result"]
+    unsub()
@@ -1,4 +1,5 @@
 """Test Websocket API http module."""
+import asyncio
 from datetime import timedelta
 from unittest.mock import patch
 
@@ -6,6 +7,9 @@ from aiohttp import WSMsgType
 import pytest
 
 from openpeerpower.components.websocket_api import const, http
+from openpeerpower.components.websocket_api.auth import TYPE_AUTH, TYPE_AUTH_OK
+from openpeerpower.components.websocket_api.error import Disconnect
+from openpeerpower.setup import async_setup_component
 from openpeerpower.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -66,6 +70,138 @@ async def test_pending_msg_peak(opp, mock_low_peak, opp_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_drain_waits_for_pending_messages(opp, opp_ws_client):
+    """Test senders can wait for the client to read pending messages."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "openpeerpower.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await opp_ws_client()
+
+    with patch("openpeerpower.components.websocket_api.http.PENDING_MSG_DRAINED", 1):
+        for idx in range(3):
+            instance._send_message({"id": idx, "type": "pong"})
+        assert not instance._drained.is_set()
+
+        await asyncio.wait_for(instance._async_drain(), 5)
+        for _ in range(3):
+            await websocket_client.receive_json()
+
+        await websocket_client.close()
+        await opp.async_block_till_done()
+        with pytest.raises(Disconnect):
+            await instance._async_drain()
+
+
+async def test_coalesce_messages(opp, no_auth_websocket_client, opp_access_token):
+    """Test pending messages are sent as one frame if the client supports it."""
+    await no_auth_websocket_client.send_json(
+        {
+            "type": TYPE_AUTH,
+            "access_token": opp_access_token,
+            "supported_features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["type"] == TYPE_AUTH_OK
+
+    await no_auth_websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await no_auth_websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        opp.bus.async_fire("test_event", {"idx": idx})
+
+    msg = await no_auth_websocket_client.receive_json()
+    assert isinstance(msg, list)
+    assert [event["event"]["data"]["idx"] for event in msg] == [0, 1, 2]
+
+    await no_auth_websocket_client.send_json({"id": 6, "type": "connection_stats"})
+    msg = await no_auth_websocket_client.receive_json()
+    stats = msg["result"]
+    assert len(stats) == 1
+    assert stats[0]["coalesce_messages"]
+    # auth_required, auth_ok, the subscribe result and the events frame
+    assert stats[0]["messages_sent"] == 6
+    assert stats[0]["frames_sent"] == 4
+    assert stats[0]["bytes_sent"] > 0
+    assert stats[0]["dropped"] == 0
+
+
+async def test_slow_client_coalesce_state_changed(opp, opp_ws_client):
+    """Test newer states of an entity replace pending state_changed events."""
+    assert await async_setup_component(
+        opp,
+        "websocket_api",
+        {"websocket_api": {const.CONF_SLOW_CLIENT_POLICY: const.SLOW_CLIENT_COALESCE}},
+    )
+    websocket_client = await opp_ws_client()
+
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    opp.states.async_set("light.kitchen", "on")
+    opp.states.async_set("light.kitchen", "off")
+    opp.states.async_set("light.bedroom", "on")
+    opp.states.async_set("light.kitchen", "on", {"brightness": 100})
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["entity_id"] == "light.kitchen"
+    assert msg["event"]["data"]["new_state"]["state"] == "on"
+    assert msg["event"]["data"]["new_state"]["attributes"] == {"brightness": 100}
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["entity_id"] == "light.bedroom"
+
+    await websocket_client.send_json({"id": 6, "type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"][0]["dropped"] == 2
+    assert not msg["result"][0]["coalesce_messages"]
+
+
+async def test_slow_client_coalesce_not_disconnected(opp, mock_low_peak, opp_ws_client):
+    """Test the coalesce policy does not disconnect clients over the peak."""
+    assert await async_setup_component(
+        opp,
+        "websocket_api",
+        {"websocket_api": {const.CONF_SLOW_CLIENT_POLICY: const.SLOW_CLIENT_COALESCE}},
+    )
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "openpeerpower.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await opp_ws_client()
+
+    for idx in range(6):
+        instance._send_message({"id": idx, "type": "pong"})
+    assert instance._peak_checker_unsub is None
+
+    for idx in range(6):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == idx
+
+
 async def test_non_json_message(opp, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
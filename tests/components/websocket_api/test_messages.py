@@ -2,7 +2,9 @@
 
 from openpeerpower.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
+    _cached_state_diff_message as lru_state_diff_cache,
     cached_event_message,
+    cached_state_diff_message,
     message_to_json,
 )
 from openpeerpower.const import EVENT_STATE_CHANGED
@@ -96,3 +98,33 @@ async def test_message_to_json(caplog):
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_cached_state_diff_message(opp):
+    """Test that we serialize the state diff once for all subscriptions."""
+
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    opp.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+
+    opp.states.async_set("light.window", "on")
+    opp.states.async_set("light.window", "off")
+    await opp.async_block_till_done()
+
+    assert len(events) == 2
+    lru_state_diff_cache.cache_clear()
+
+    msg0 = cached_state_diff_message(2, events[1])
+    msg1 = cached_state_diff_message(3, events[1])
+
+    assert msg0 == msg1.replace('"id": 3', '"id": 2')
+    assert '"c": {"light.window": {"+": {"s": "off"' in msg0
+
+    cache_info = lru_state_diff_cache.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
@@ -456,13 +456,9 @@ async def mqtt_mock(opp, mqtt_client_mock, mqtt_config):
     assert result
     await opp.async_block_till_done()
 
-    # Workaround: asynctest==0.13 fails on @functools.lru_cache
-    spec = dir(opp.data["mqtt"])
-    spec.remove("_matching_subscriptions")
-
     mqtt_component_mock = MagicMock(
         return_value=opp.data["mqtt"],
-        spec_set=spec,
+        spec_set=opp.data["mqtt"],
         wraps=opp.data["mqtt"],
     )
     mqtt_component_mock._mqttc = mqtt_client_mock
@@ -610,10 +606,17 @@ def opp_recorder(enable_statistics):
     """Open Peer Power fixture with in-memory recorder."""
     opp = get_test_open_peer_power()
     stats = recorder.Recorder.async_hourly_statistics if enable_statistics else None
+    short_term_stats = (
+        recorder.Recorder.async_short_term_statistics if enable_statistics else None
+    )
     with patch(
         "openpeerpower.components.recorder.Recorder.async_hourly_statistics",
         side_effect=stats,
         autospec=True,
+    ), patch(
+        "openpeerpower.components.recorder.Recorder.async_short_term_statistics",
+        side_effect=short_term_stats,
+        autospec=True,
     ):
 
         def setup_recorder(config=None):
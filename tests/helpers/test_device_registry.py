@@ -1253,3 +1253,40 @@ async def test_disable_config_entry_disables_devices(opp, registry):
     entry2 = registry.async_get(entry2.id)
     assert entry2.disabled
     assert entry2.disabled_by == device_registry.DISABLED_USER
+
+
+async def test_entries_for_indexes(registry):
+    """Test the devices of an area and config entry follow updates."""
+    device1 = registry.async_get_or_create(
+        config_entry_id="entry-1", identifiers={("bridgeid", "0123")}
+    )
+    device2 = registry.async_get_or_create(
+        config_entry_id="entry-1", identifiers={("bridgeid", "4567")}
+    )
+    device1 = registry.async_update_device(device1.id, area_id="area-1")
+    device2 = registry.async_get_or_create(
+        config_entry_id="entry-2", identifiers={("bridgeid", "4567")}
+    )
+
+    assert device_registry.async_entries_for_area(registry, "area-1") == [device1]
+    assert device_registry.async_entries_for_config_entry(registry, "entry-1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "entry-2") == [
+        device2
+    ]
+
+    registry.async_clear_area_id("area-1")
+    assert device_registry.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_clear_config_entry("entry-1")
+    device2 = registry.async_get(device2.id)
+    assert device_registry.async_entries_for_config_entry(registry, "entry-1") == []
+    assert device_registry.async_entries_for_config_entry(registry, "entry-2") == [
+        device2
+    ]
+    assert registry.async_get(device1.id) is None
+
+    registry.async_remove_device(device2.id)
+    assert device_registry.async_entries_for_config_entry(registry, "entry-2") == []
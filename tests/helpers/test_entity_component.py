@@ -378,12 +378,11 @@ async def test_update_entity(opp):
     """Test that we can update an entity with the helper."""
     component = EntityComponent(_LOGGER, DOMAIN, opp)
     entity = MockEntity()
-    entity.async_write_op_state = Mock()
     entity.async_update_op_state = AsyncMock(return_value=None)
     await component.async_add_entities([entity])
 
-    # Called as part of async_add_entities
-    assert len(entity.async_write_op_state.mock_calls) == 1
+    # Written as part of async_add_entities
+    assert opp.states.get(entity.entity_id) is not None
 
     await opp.helpers.entity_component.async_update_entity(entity.entity_id)
 
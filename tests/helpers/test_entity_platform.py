@@ -150,6 +150,39 @@ async def test_update_state_adds_entities_with_update_before_add_false(opp):
     assert not ent.update.called
 
 
+async def test_adding_entities_writes_states_in_batch(opp):
+    """Test entities added together share the timestamp and context."""
+    component = EntityComponent(_LOGGER, DOMAIN, opp)
+
+    await component.async_add_entities(
+        [MockEntity(name="one"), MockEntity(name="two"), MockEntity(name="three")]
+    )
+
+    states = [opp.states.get(entity_id) for entity_id in opp.states.async_entity_ids()]
+    assert len(states) == 3
+    assert len({state.last_updated for state in states}) == 1
+    assert len({state.context.id for state in states}) == 1
+
+
+async def test_adding_entities_batch_skips_invalid_state(opp, caplog):
+    """Test an entity with an invalid state does not block the batch."""
+    component = EntityComponent(_LOGGER, DOMAIN, opp)
+
+    await component.async_add_entities(
+        [
+            MockEntity(name="one"),
+            MockEntity(name="invalid", state="x" * 256),
+            MockEntity(name="three"),
+        ]
+    )
+
+    assert sorted(opp.states.async_entity_ids()) == [
+        "test_domain.one",
+        "test_domain.three",
+    ]
+    assert "Error writing state of test_domain.invalid" in caplog.text
+
+
 @patch("openpeerpower.helpers.entity_platform.async_track_time_interval")
 async def test_set_scan_interval_via_platform(mock_track, opp):
     """Test the setting of the scan interval via platform."""
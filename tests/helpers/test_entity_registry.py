@@ -141,6 +141,29 @@ def test_get_or_create_suggested_object_id_conflict_existing(opp, registry):
     assert entry.entity_id == "light.hue_1234_2"
 
 
+async def test_journaled_changes_loaded(opp, registry):
+    """Test changes saved after the registry was written are loaded."""
+    registry.async_get_or_create("light", "hue", "1234")
+    entry = registry.async_get_or_create("light", "hue", "5678")
+    registry.async_get_or_create("light", "hue", "9012")
+    await flush_store(registry._store)
+
+    with patch.object(
+        registry._store, "_write_items", wraps=registry._store._write_items
+    ) as write_items:
+        registry.async_update_entity(entry.entity_id, new_entity_id="light.renamed")
+        registry.async_update_entity("light.hue_1234", name="Renamed")
+        registry.async_remove("light.hue_9012")
+        await flush_store(registry._store)
+    assert len(write_items.mock_calls) == 0
+
+    registry2 = er.EntityRegistry(opp)
+    await registry2.async_load()
+
+    assert list(registry2.entities) == ["light.hue_1234", "light.renamed"]
+    assert registry2.entities["light.hue_1234"].name == "Renamed"
+
+
 def test_create_triggers_save(opp, registry):
     """Test that registering entry triggers a save."""
     with patch.object(registry, "async_schedule_save") as mock_schedule_save:
@@ -949,3 +972,44 @@ async def test_entity_max_length_exceeded(opp, registry):
     assert exc_info.value.property_name == "generated_entity_id"
     assert exc_info.value.max_length == 255
     assert exc_info.value.value == f"sensor.{long_entity_id_name}_2"
+
+
+async def test_entries_for_indexes(registry):
+    """Test the entries of a device, area and config entry follow updates."""
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", device_id="device-1", area_id="area-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=MockConfigEntry(domain="hue", entry_id="entry-1"),
+        device_id="device-1",
+    )
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+    assert er.async_entries_for_area(registry, "area-1") == [entry1]
+    assert er.async_entries_for_config_entry(registry, "entry-1") == [entry2]
+
+    entry1 = registry.async_update_entity(entry1.entity_id, name="Renamed")
+    assert er.async_entries_for_device(registry, "device-1") == [entry1, entry2]
+
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, new_entity_id="light.moved", area_id="area-2"
+    )
+    assert er.async_entries_for_device(registry, "device-1") == [entry2, entry1]
+    assert er.async_entries_for_area(registry, "area-1") == []
+    assert er.async_entries_for_area(registry, "area-2") == [entry1]
+
+    registry.async_clear_area_id("area-2")
+    assert er.async_entries_for_area(registry, "area-2") == []
+    assert registry.async_get("light.moved").area_id is None
+
+    registry.async_clear_config_entry("entry-1")
+    assert er.async_entries_for_config_entry(registry, "entry-1") == []
+    assert er.async_entries_for_device(registry, "device-1") == [
+        registry.async_get("light.moved")
+    ]
+
+    registry.async_remove("light.moved")
+    assert er.async_entries_for_device(registry, "device-1") == []
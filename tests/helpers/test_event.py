@@ -16,10 +16,12 @@ from openpeerpower.core import callback
 from openpeerpower.exceptions import TemplateError
 from openpeerpower.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from openpeerpower.helpers.event import (
+    TIMER_SCHEDULER,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_pending_timers,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -3322,3 +3324,112 @@ async def test_async_track_entity_registry_updated_event_with_empty_list(opp):
 
     unsub_single2()
     unsub_single()
+
+
+async def test_timers_share_one_loop_handle(opp):
+    """Test point in time and interval listeners share a single loop handle."""
+    runs = []
+    utc_now = dt_util.utcnow()
+
+    unsubs = [
+        async_track_point_in_utc_time(
+            opp,
+            callback(lambda x, idx=idx: runs.append(idx)),
+            utc_now + timedelta(seconds=10 + idx),
+        )
+        for idx in range(100)
+    ]
+    unsub_interval = async_track_time_interval(
+        opp, callback(lambda x: runs.append("interval")), timedelta(seconds=30)
+    )
+
+    handles = [
+        handle
+        for handle in opp.loop._scheduled
+        if not handle.cancelled() and "_TimerScheduler" in repr(handle)
+    ]
+    assert len(handles) == 1
+    assert async_pending_timers(opp) == {"tests.helpers.test_event": 101}
+
+    for unsub in unsubs[20:]:
+        unsub()
+    assert async_pending_timers(opp) == {"tests.helpers.test_event": 21}
+
+    async_fire_time_changed(opp, utc_now + timedelta(seconds=35))
+    await opp.async_block_till_done()
+    assert runs == [*range(20), "interval"]
+    # The interval listener is rescheduled
+    assert async_pending_timers(opp) == {"tests.helpers.test_event": 1}
+
+    # Cancelling a timer that already fired is a no-op
+    unsubs[0]()
+    unsub_interval()
+    assert async_pending_timers(opp) == {}
+
+
+async def test_timer_scheduler_rearms_when_called_too_early(opp):
+    """Test the scheduler rearms its handle when it fires too early."""
+    runs = []
+    utc_now = dt_util.utcnow()
+    point_in_time = utc_now + timedelta(seconds=5)
+
+    unsub = async_track_point_in_utc_time(
+        opp, callback(lambda x: runs.append(x)), point_in_time
+    )
+    scheduler = opp.data[TIMER_SCHEDULER]
+
+    with patch(
+        "openpeerpower.helpers.event.time_tracker_utcnow",
+        return_value=point_in_time - timedelta(seconds=1),
+    ):
+        scheduler._async_fire()
+    await opp.async_block_till_done()
+    assert runs == []
+    assert scheduler._handle is not None
+    assert scheduler._handle_when == point_in_time.timestamp()
+
+    async_fire_time_changed(opp, point_in_time + timedelta(seconds=1))
+    await opp.async_block_till_done()
+    assert runs == [point_in_time]
+    assert scheduler._handle is None
+    unsub()
+
+
+async def test_timer_scheduler_cancel_while_firing(opp):
+    """Test cancelling timers from a timer callback does not skew the heap."""
+    runs = []
+    utc_now = dt_util.utcnow()
+    point_in_time = utc_now + timedelta(seconds=5)
+    unsubs = {}
+
+    @callback
+    def _first(now):
+        runs.append("first")
+        # Cancel itself, it was already popped as due, and the next due one
+        unsubs["first"]()
+        unsubs["second"]()
+
+    unsubs["first"] = async_track_point_in_utc_time(opp, _first, point_in_time)
+    unsubs["second"] = async_track_point_in_utc_time(
+        opp, callback(lambda x: runs.append("second")), point_in_time
+    )
+    for idx in range(5):
+        unsubs[idx] = async_track_point_in_utc_time(
+            opp,
+            callback(lambda x, idx=idx: runs.append(idx)),
+            utc_now + timedelta(seconds=60 + idx),
+        )
+    scheduler = opp.data[TIMER_SCHEDULER]
+
+    async_fire_time_changed(opp, point_in_time + timedelta(seconds=1))
+    await opp.async_block_till_done()
+    assert runs == ["first"]
+    assert scheduler._cancelled == 0
+    assert len(scheduler._heap) == 5
+    assert async_pending_timers(opp) == {"tests.helpers.test_event": 5}
+
+    async_fire_time_changed(opp, utc_now + timedelta(seconds=65))
+    await opp.async_block_till_done()
+    assert runs == ["first", *range(5)]
+    assert scheduler._heap == []
+    assert async_pending_timers(opp) == {}
@@ -39,9 +39,7 @@ async def test_caching_data(opp):
     entity.entity_id = "input_boolean.b1"
 
     # Mock that only b1 is present this run
-    with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch("openpeerpower.helpers.storage.Store.async_save") as mock_write_data:
         state = await entity.async_get_last_state()
         await opp.async_block_till_done()
 
@@ -65,37 +63,101 @@ async def test_periodic_write(opp):
     entity.opp = opp
     entity.entity_id = "input_boolean.b1"
 
-    with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch("openpeerpower.helpers.storage.Store.async_save") as mock_write_data:
         await entity.async_get_last_state()
         await opp.async_block_till_done()
 
     assert mock_write_data.called
 
+    data = await RestoreStateData.async_get_instance(opp)
+    data.async_restore_entity_added("input_boolean.b1")
+
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
+        "openpeerpower.helpers.storage.CollectionStore.async_save_items"
     ) as mock_write_data:
         async_fire_time_changed(opp, dt_util.utcnow() + timedelta(minutes=15))
         await opp.async_block_till_done()
 
+    # No states changed
+    assert not mock_write_data.called
+
+    opp.states.async_set("input_boolean.b1", "on")
+    with patch(
+        "openpeerpower.helpers.storage.CollectionStore.async_save_items"
+    ) as mock_write_data:
+        async_fire_time_changed(opp, dt_util.utcnow() + timedelta(minutes=30))
+        await opp.async_block_till_done()
+
     assert mock_write_data.called
 
+    opp.states.async_set("input_boolean.b1", "off")
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
+        "openpeerpower.helpers.storage.CollectionStore.async_save_items"
     ) as mock_write_data:
         opp.bus.async_fire(EVENT_OPENPEERPOWER_STOP)
         await opp.async_block_till_done()
 
     assert mock_write_data.called
 
+    opp.states.async_set("input_boolean.b1", "on")
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
-        async_fire_time_changed(opp, dt_util.utcnow() + timedelta(minutes=30))
+        "openpeerpower.helpers.storage.CollectionStore.async_save_items"
+    ) as mock_write_data, patch(
+        "openpeerpower.helpers.storage.Store.async_save"
+    ) as mock_write_all:
+        async_fire_time_changed(opp, dt_util.utcnow() + timedelta(minutes=45))
         await opp.async_block_till_done()
 
     assert not mock_write_data.called
+    assert not mock_write_all.called
+
+
+async def test_dump_changed_states(opp, opp_storage):
+    """Test that only the changed states are saved after the first dump."""
+    for entity_id in ("input_boolean.b0", "input_boolean.b1"):
+        entity = RestoreEntity()
+        entity.opp = opp
+        entity.entity_id = entity_id
+        await entity.async_internal_added_to_opp()
+    await opp.async_block_till_done()
+
+    opp.states.async_set("input_boolean.b0", "on")
+    opp.states.async_set("input_boolean.b1", "on")
+    await opp.async_block_till_done()
+    data = await RestoreStateData.async_get_instance(opp)
+    await data.async_dump_states()
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"])
+        for item in opp_storage[STORAGE_KEY]["data"]
+    ] == [("input_boolean.b0", "on"), ("input_boolean.b1", "on")]
+
+    opp.states.async_set("input_boolean.b1", "off")
+    opp.states.async_set("sensor.not_restored", "off")
+    await entity.async_remove()
+    await opp.async_block_till_done()
+    assert data.changed_entity_ids == {"input_boolean.b1"}
+
+    with patch(
+        "openpeerpower.helpers.storage.CollectionStore._write_items"
+    ) as mock_write_items:
+        await data.async_dump_changed_states()
+
+    # The change was journaled
+    assert not mock_write_items.called
+    assert not data.changed_entity_ids
+    assert [
+        (item["state"]["entity_id"], item["state"]["state"])
+        for item in opp_storage[STORAGE_KEY]["data"]
+    ] == [("input_boolean.b0", "on"), ("input_boolean.b1", "off")]
+
+    # A full dump is done once a day
+    with patch(
+        "openpeerpower.helpers.restore_state.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(days=1),
+    ), patch("openpeerpower.helpers.storage.Store.async_save") as mock_write_data:
+        await data.async_dump_changed_states()
+
+    assert mock_write_data.called
 
 
 async def test_opp_starting(opp):
@@ -123,7 +185,7 @@ async def test_opp_starting(opp):
     # Mock that only b1 is present this run
     states = [State("input_boolean.b1", "on")]
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
+        "openpeerpower.helpers.storage.Store.async_save"
     ) as mock_write_data, patch.object(opp.states, "async_all", return_value=states):
         state = await entity.async_get_last_state()
         await opp.async_block_till_done()
@@ -136,9 +198,7 @@ async def test_opp_starting(opp):
     assert not mock_write_data.called
 
     # Finish opp.startup
-    with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch("openpeerpower.helpers.storage.Store.async_save") as mock_write_data:
         opp.bus.async_fire(EVENT_OPENPEERPOWER_START)
         await opp.async_block_till_done()
 
@@ -180,7 +240,7 @@ async def test_dump_data(opp):
     }
 
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
+        "openpeerpower.helpers.storage.Store.async_save"
     ) as mock_write_data, patch.object(opp.states, "async_all", return_value=states):
         await data.async_dump_states()
 
@@ -206,7 +266,7 @@ async def test_dump_data(opp):
     await entity.async_remove()
 
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save"
+        "openpeerpower.helpers.storage.Store.async_save"
     ) as mock_write_data, patch.object(opp.states, "async_all", return_value=states):
         await data.async_dump_states()
 
@@ -241,7 +301,7 @@ async def test_dump_error(opp):
     data = await RestoreStateData.async_get_instance(opp)
 
     with patch(
-        "openpeerpower.helpers.restore_state.Store.async_save",
+        "openpeerpower.helpers.storage.Store.async_save",
         side_effect=OpenPeerPowerError,
     ) as mock_write_data, patch.object(opp.states, "async_all", return_value=states):
         await data.async_dump_states()
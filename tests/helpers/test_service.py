@@ -1102,3 +1102,40 @@ async def test_async_extract_config_entry_ids(opp):
     )
 
     assert await service.async_extract_config_entry_ids(opp, call) == {"abc"}
+
+
+async def test_resolve_targets_cached(opp, area_mock):
+    """Test resolved targets are cached until the registries change."""
+    resolved = service.async_resolve_targets(opp, ["test-area"], [])
+    assert resolved.devices == {
+        device.id
+        for device in dev_reg.async_get(opp).devices.values()
+        if device.area_id == "test-area"
+    }
+    assert resolved.entities == {"light.in_area", "light.assigned_to_area"}
+    assert not resolved.missing_devices
+
+    assert service.async_resolve_targets(opp, {"test-area"}, set()) is resolved
+    assert service.async_resolve_targets(opp, [], ["device-no-area-id"]) is not (
+        resolved
+    )
+
+    registry = ent_reg.async_get(opp)
+    registry.async_update_entity("light.in_area", name="Renamed")
+    await opp.async_block_till_done()
+    assert service.async_resolve_targets(opp, ["test-area"], []) is resolved
+
+    registry.async_update_entity("light.in_own_area", area_id="test-area")
+    await opp.async_block_till_done()
+    resolved = service.async_resolve_targets(opp, ["test-area"], [])
+    assert resolved.entities == {
+        "light.in_area",
+        "light.assigned_to_area",
+        "light.in_own_area",
+    }
+
+    dev_reg.async_get(opp).async_clear_area_id("test-area")
+    await opp.async_block_till_done()
+    resolved = service.async_resolve_targets(opp, ["test-area"], [])
+    assert not resolved.devices
+    assert resolved.entities == {"light.assigned_to_area", "light.in_own_area"}
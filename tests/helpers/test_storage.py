@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+from operator import itemgetter
 from unittest.mock import Mock, patch
 
 import pytest
@@ -279,3 +280,122 @@ async def test_migrator_transforming_config(opp, store, opp_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+@pytest.fixture
+def collection_store(opp):
+    """Fixture of a store of a collection of items."""
+    yield storage.CollectionStore(
+        opp,
+        MOCK_VERSION,
+        MOCK_KEY,
+        collection="items",
+        item_id=itemgetter("id"),
+        item_to_dict=lambda item: {"id": item[0], "value": item[1]},
+    )
+
+
+async def test_collection_store_journals_changes(opp, collection_store, opp_storage):
+    """Test changed items are journaled once the collection was written."""
+    items = {"a": ("a", 1), "b": ("b", 2)}
+
+    def items_func():
+        return list(items.values())
+
+    with patch.object(
+        collection_store, "_write_items", wraps=collection_store._write_items
+    ) as write_items:
+        # The first save writes all items
+        items["c"] = ("c", 3)
+        collection_store.async_delay_save_items(items_func, [("c", items["c"])])
+        await collection_store._async_handle_write_data()
+        assert len(write_items.mock_calls) == 1
+
+        items["a"] = ("a", 4)
+        collection_store.async_delay_save_items(items_func, [("a", items["a"])])
+        del items["b"]
+        collection_store.async_delay_save_items(items_func, [("b", None)])
+        await collection_store._async_handle_write_data()
+        assert len(write_items.mock_calls) == 1
+
+        assert opp_storage[MOCK_KEY]["data"] == {
+            "items": [{"id": "a", "value": 4}, {"id": "c", "value": 3}]
+        }
+
+        # A save without changes writes all items
+        collection_store.async_delay_save_items(items_func, [("a", items["a"])])
+        collection_store.async_delay_save_items(items_func)
+        await collection_store._async_handle_write_data()
+        assert len(write_items.mock_calls) == 2
+
+        # The journal is compacted when it gets too long
+        with patch.object(storage, "JOURNAL_COMPACT_SIZE", 2):
+            for value in range(3):
+                items["c"] = ("c", value)
+                collection_store.async_delay_save_items(items_func, [("c", items["c"])])
+                await collection_store._async_handle_write_data()
+        assert len(write_items.mock_calls) == 3
+
+    assert opp_storage[MOCK_KEY]["data"] == {
+        "items": [{"id": "a", "value": 4}, {"id": "c", "value": 2}]
+    }
+
+
+async def test_collection_store_load_journal(opp, collection_store, tmp_path, caplog):
+    """Test the journal is applied to the loaded data."""
+    opp.config.config_dir = str(tmp_path)
+    (tmp_path / storage.STORAGE_DIR).mkdir()
+    with open(collection_store.path, "w") as fdesc:
+        json.dump(
+            {
+                "version": MOCK_VERSION,
+                "key": MOCK_KEY,
+                "data": {"items": [{"id": "a", "value": 1}, {"id": "b", "value": 2}]},
+            },
+            fdesc,
+        )
+    with open(collection_store.journal_path, "w") as fdesc:
+        fdesc.write(
+            '["a",{"id":"a","value":3}]\n'
+            '["b",null]\n'
+            '["b",{"id":"b","value":4}]\n'
+            '["c",{"id":"c"'
+        )
+
+    assert collection_store._load_data()["data"] == {
+        "items": [{"id": "a", "value": 3}, {"id": "b", "value": 4}]
+    }
+    assert "Ignoring incomplete change" in caplog.text
+
+
+async def test_collection_store_list(opp, opp_storage):
+    """Test a collection stored as a list, saved without delay."""
+    store = storage.CollectionStore(
+        opp,
+        MOCK_VERSION,
+        MOCK_KEY,
+        collection=None,
+        item_id=itemgetter("id"),
+        item_to_dict=lambda item: {"id": item[0], "value": item[1]},
+    )
+    items = {"a": ("a", 1), "b": ("b", 2)}
+
+    def items_func():
+        return list(items.values())
+
+    await store.async_save_items(items_func)
+    assert opp_storage[MOCK_KEY]["data"] == [
+        {"id": "a", "value": 1},
+        {"id": "b", "value": 2},
+    ]
+
+    with patch.object(store, "_write_items") as write_items:
+        items["b"] = ("b", 3)
+        await store.async_save_items(items_func, [("b", items["b"])])
+    assert not write_items.called
+
+    assert opp_storage[MOCK_KEY]["data"] == [
+        {"id": "a", "value": 1},
+        {"id": "b", "value": 3},
+    ]
+    assert await store.async_load() == opp_storage[MOCK_KEY]["data"]
@@ -2137,35 +2137,58 @@ def test_urlencode(opp):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_code_cache(opp):
+    """Test identical templates share the compiled code per environment."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    template._COMPILED_CODE_CACHE.clear()  # pylint: disable=protected-access
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_OPP_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template.compiled_code_cache_info() == {
+        "hits": 0,
+        "misses": 1,
+        "size": 1,
+        "maxsize": 4096,
+    }
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_OPP_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_OPP_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_OPP_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl2._compiled_code is tpl._compiled_code  # pylint: disable=protected-access
+
+    # The code is kept after the templates are gone, as on a reload
+    del tpl, tpl2
+    template.Template(template_string).ensure_valid()
+    assert template.compiled_code_cache_info()["hits"] == 2
+
+    # Environments of another kind compile their own code
+    template.Template(template_string, opp).async_render(limited=True)
+    template.Template(template_string, opp).async_render(strict=True)
+    info = template.compiled_code_cache_info()
+    assert info["misses"] == 3
+    assert info["size"] == 3
+
+    # Static templates are not compiled
+    template.Template("static", opp).async_render()
+    assert template.compiled_code_cache_info()["size"] == 3
+
+
+async def test_compiled_code_cache_lru():
+    """Test the least recently used compiled code is evicted."""
+    with patch.object(template, "_COMPILED_CODE_CACHE", template._CompiledCodeCache(2)):
+        for value in (1, 2, 1, 3):
+            template.Template(f"{{{{ {value} }}}}").ensure_valid()
+        assert template.compiled_code_cache_info() == {
+            "hits": 1,
+            "misses": 3,
+            "size": 2,
+            "maxsize": 2,
+        }
+
+        template.Template("{{ 1 }}").ensure_valid()
+        template.Template("{{ 2 }}").ensure_valid()
+        assert template.compiled_code_cache_info()["misses"] == 4
 
 
 def test_is_template_string():
@@ -381,3 +381,24 @@ async def test_not_schedule_refresh_if_system_option_disable_polling(opp):
     crd = get_crd(opp, DEFAULT_UPDATE_INTERVAL)
     crd.async_add_listener(lambda: None)
     assert crd._unsub_refresh is None
+
+
+async def test_listeners_write_states_in_batch(opp, crd):
+    """Test entities updated by a refresh write their states in one batch."""
+    entities = []
+    for name in ("one", "two"):
+        ent = update_coordinator.CoordinatorEntity(crd)
+        ent.opp = opp
+        ent.entity_id = f"sensor.{name}"
+        entities.append(ent)
+        await ent.async_added_to_opp()
+
+    with patch.object(
+        opp.states, "async_set_many", wraps=opp.states.async_set_many
+    ) as mock_set_many:
+        await crd.async_refresh()
+
+    assert len(mock_set_many.mock_calls) == 1
+    states = [opp.states.get(ent.entity_id) for ent in entities]
+    assert len({state.context.id for state in states}) == 1
+    assert len({state.last_updated for state in states}) == 1
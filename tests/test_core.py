@@ -431,6 +431,127 @@ async def test_eventbus_filtered_listener(opp):
     unsub()
 
 
+async def test_eventbus_keyed_listener(opp):
+    """Test keyed listeners are routed by entity_id and domain."""
+    entity_calls = []
+    domain_calls = []
+    all_calls = []
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock entity listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock domain listener."""
+        domain_calls.append(event)
+
+    @ha.callback
+    def all_listener(event):
+        """Mock match all listener."""
+        all_calls.append(event)
+
+    unsub_entity = opp.bus.async_listen_keyed(
+        "test", ["light.kitchen", "light.bowl"], entity_listener
+    )
+    unsub_domain = opp.bus.async_listen_keyed("test", ["switch"], domain_listener)
+    unsub_all = opp.bus.async_listen_keyed("test", [MATCH_ALL], all_listener)
+
+    assert opp.bus.async_listeners()["test"] == 3
+    assert opp.bus.async_keyed_listeners("test") == {
+        "light.kitchen": 1,
+        "light.bowl": 1,
+        "switch": 1,
+    }
+
+    opp.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    opp.bus.async_fire("test", {"entity_id": "switch.fan"})
+    opp.bus.async_fire("test", {"entity_id": "sensor.other"})
+    opp.bus.async_fire("test")
+    await opp.async_block_till_done()
+
+    assert len(entity_calls) == 1
+    assert entity_calls[0].data["entity_id"] == "light.kitchen"
+    assert len(domain_calls) == 1
+    assert domain_calls[0].data["entity_id"] == "switch.fan"
+    assert len(all_calls) == 4
+
+    unsub_entity()
+    unsub_domain()
+    unsub_all()
+
+    assert "test" not in opp.bus.async_listeners()
+    assert opp.bus.async_keyed_listeners("test") == {}
+
+    opp.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await opp.async_block_till_done()
+
+    assert len(entity_calls) == 1
+
+
+async def test_eventbus_keyed_filtered_listener(opp):
+    """Test keyed listeners still run their filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def filter(event):
+        """Mock filter."""
+        return not event.data["filtered"]
+
+    unsub = opp.bus.async_listen_keyed("test", ["light"], listener, event_filter=filter)
+
+    opp.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": True})
+    await opp.async_block_till_done()
+
+    assert len(calls) == 0
+
+    opp.bus.async_fire("test", {"entity_id": "light.kitchen", "filtered": False})
+    await opp.async_block_till_done()
+
+    assert len(calls) == 1
+
+    unsub()
+
+
+async def test_eventbus_keyed_listener_runs_once(opp):
+    """Test a keyed listener runs once per event for overlapping keys."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = opp.bus.async_listen_keyed(
+        "test", ["light.kitchen", "light", "light", "nodot"], listener
+    )
+    assert opp.bus.async_keyed_listeners("test") == {
+        "light.kitchen": 1,
+        "light": 1,
+        "nodot": 1,
+    }
+
+    opp.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    opp.bus.async_fire("test", {"entity_id": "light.bowl"})
+    opp.bus.async_fire("test", {"entity_id": "nodot"})
+    await opp.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bowl",
+        "nodot",
+    ]
+
+    unsub()
+    assert opp.bus.async_keyed_listeners("test") == {}
+
+
 async def test_eventbus_unsubscribe_listener(opp):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -728,6 +849,34 @@ async def test_statemachine_force_update(opp):
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(opp):
+    """Test setting many states at once."""
+    opp.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(opp, EVENT_STATE_CHANGED)
+
+    opp.states.async_set_many(
+        [
+            ("light.bowl", "on", {}),
+            ("light.Kitchen", "off", {"brightness": 0}),
+            ("switch.fan", "on", None),
+        ]
+    )
+    await opp.async_block_till_done()
+
+    assert len(events) == 2
+    assert [event.data["entity_id"] for event in events] == [
+        "light.kitchen",
+        "switch.fan",
+    ]
+    kitchen = opp.states.get("light.kitchen")
+    fan = opp.states.get("switch.fan")
+    assert kitchen.attributes == {"brightness": 0}
+    assert kitchen.last_updated == fan.last_updated
+    assert kitchen.context is fan.context
+    assert events[0].time_fired == kitchen.last_updated
+    assert events[0].context is kitchen.context
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("openpeerpower", "start")